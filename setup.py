@@ -14,6 +14,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "viz": ["matplotlib>=3.0", "plotly>=5.0"],
+        "arrow": ["pyarrow>=10.0"],
         "dash": [
             "dash>=2.18.0",
             "dash-bootstrap-components>=1.6.0",
@@ -29,6 +30,7 @@ setup(
             "dash>=2.18.0",
             "dash-bootstrap-components>=1.6.0",
             "jupyter-dash>=0.4.2",
+            "pyarrow>=10.0",
         ],
     },
     python_requires=">=3.8",
@@ -145,6 +145,63 @@ class TestDisplayLoaderLoading:
         assert result is not None
         assert loader.display_info["name"] == "test_display"
 
+    def test_load_external_cog_data(self, temp_display_dir, sample_display_info):
+        """Test loading cogData from the file named by cogDataFile."""
+        import gzip
+
+        cog_data = sample_display_info.pop("cogData")
+        sample_display_info["cogDataFile"] = "metaData.json.gz"
+        with open(temp_display_dir / "displayInfo.json", 'w') as f:
+            json.dump(sample_display_info, f)
+        with gzip.open(temp_display_dir / "metaData.json.gz", 'wt') as f:
+            json.dump(cog_data, f)
+
+        loader = DisplayLoader(temp_display_dir)
+        loader.load()
+
+        assert len(loader.cog_data) == 3
+        assert loader.cog_data.loc[1, 'country_label'] == 'UK'
+
+    def test_load_falls_back_to_metadata_js(self, temp_display_dir, sample_display_info):
+        """Test loading cogData from metaData.js when not embedded."""
+        cog_data = sample_display_info.pop("cogData")
+        with open(temp_display_dir / "displayInfo.json", 'w') as f:
+            json.dump(sample_display_info, f)
+        (temp_display_dir / "metaData.js").write_text(
+            f"window.metaData = {json.dumps(cog_data)};\n"
+        )
+
+        loader = DisplayLoader(temp_display_dir)
+        loader.load()
+
+        assert list(loader.cog_data['panelKey']) == ["0", "1", "2"]
+
+    def test_load_compressed_metadata_js(self, temp_display_dir, sample_display_info):
+        """Test loading cogData from the gzipped metaData.js.gz."""
+        import gzip
+
+        cog_data = sample_display_info.pop("cogData")
+        sample_display_info["cogDataFile"] = "metaData.js.gz"
+        with open(temp_display_dir / "displayInfo.json", 'w') as f:
+            json.dump(sample_display_info, f)
+        with gzip.open(temp_display_dir / "metaData.js.gz", 'wt') as f:
+            f.write(f"window.metaData = {json.dumps(cog_data)};\n")
+
+        loader = DisplayLoader(temp_display_dir)
+        loader.load()
+
+        assert list(loader.cog_data['panelKey']) == ["0", "1", "2"]
+
+    def test_load_without_cog_data_raises(self, temp_display_dir, sample_display_info):
+        """Test that missing cogData everywhere raises ValueError."""
+        sample_display_info.pop("cogData")
+        with open(temp_display_dir / "displayInfo.json", 'w') as f:
+            json.dump(sample_display_info, f)
+
+        loader = DisplayLoader(temp_display_dir)
+        with pytest.raises(ValueError, match="cogData"):
+            loader.load()
+
     def test_load_returns_display_data(self, temp_display_dir, sample_display_info):
         """Test that load() returns all required data."""
         info_path = temp_display_dir / "displayInfo.json"
@@ -345,6 +402,24 @@ class TestFactorLabelHandling:
         assert loader.cog_data.loc[1, 'country'] == 1
         assert loader.cog_data.loc[2, 'country'] == 2
 
+    def test_missing_and_unknown_factor_values(self, temp_display_dir, sample_display_info):
+        """Test that null and raw string factor values survive conversion."""
+        sample_display_info["cogData"][1]["country"] = None
+        sample_display_info["cogData"][2]["country"] = "Atlantis"
+        info_path = temp_display_dir / "displayInfo.json"
+        with open(info_path, 'w') as f:
+            json.dump(sample_display_info, f)
+
+        loader = DisplayLoader(temp_display_dir)
+        loader.load()
+
+        assert loader.cog_data.loc[0, 'country'] == 0
+        assert loader.cog_data.loc[0, 'country_label'] == 'USA'
+        assert pd.isna(loader.cog_data.loc[1, 'country'])
+        assert loader.cog_data.loc[1, 'country_label'] is None
+        assert loader.cog_data.loc[2, 'country'] == 'Atlantis'
+        assert loader.cog_data.loc[2, 'country_label'] is None
+
 
 class TestDisplayNameExtraction:
     """Test display name extraction."""
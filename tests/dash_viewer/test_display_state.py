@@ -126,6 +126,47 @@ class TestDisplayStateFiltering:
 
         assert len(filtered) == 3  # Alpha(10), Beta(20), Alpha(15)
 
+    def test_filter_mask(self, sample_display_info, sample_data):
+        """Test that filter_mask returns one boolean per row."""
+        state = DisplayState(display_info=sample_display_info)
+        state.set_filter('category', ['Alpha', 'Beta'])
+        state.set_filter('value', [10, 20])
+
+        mask = state.filter_mask(sample_data)
+
+        assert mask.dtype == bool
+        assert mask.tolist() == [True, True, False, True, False]
+
+    def test_filter_without_filters_does_not_copy(self, sample_display_info, sample_data):
+        """Test that unfiltered data is passed through without a copy."""
+        state = DisplayState(display_info=sample_display_info)
+
+        assert state.filter_data(sample_data) is sample_data
+
+    def test_filter_read_only_columns(self, sample_display_info, sample_data):
+        """Test filtering columns backed by read-only (memory-mapped) arrays."""
+        values = sample_data['value'].to_numpy().copy()
+        values.flags.writeable = False
+        data = sample_data.assign(value=pd.Series(values, copy=False))
+        state = DisplayState(display_info=sample_display_info)
+        state.set_filter('value', [15, 25])
+
+        filtered = state.filter_data(data)
+
+        assert filtered['panelKey'].tolist() == ['1', '3', '4']
+
+    def test_filter_string_search(self, sample_display_info, sample_data):
+        """Test text search on a string meta (high-cardinality filter)."""
+        info = dict(sample_display_info)
+        info['metas'] = info['metas'] + [{'varname': 'panelKey', 'type': 'string'}]
+        data = sample_data.assign(panelKey=['id-10', 'id-2', 'ID-12', None, 'x'])
+        state = DisplayState(display_info=info)
+        state.set_filter('panelKey', 'id-1')
+
+        filtered = state.filter_data(data)
+
+        assert filtered['panelKey'].tolist() == ['id-10', 'ID-12']
+
     def test_clear_filters(self, sample_display_info, sample_data):
         """Test clearing all filters."""
         state = DisplayState(display_info=sample_display_info)
@@ -148,6 +189,66 @@ class TestDisplayStateFiltering:
         assert 'category' not in state.active_filters
 
 
+class TestFilterIndex:
+    """Test filtering through an attached FilterIndex."""
+
+    FILTERS = [
+        ('category', ['Alpha', 'Gamma']),
+        ('value', [12, 25]),
+        ('date', ['2020-02-01', '2020-04-30']),
+    ]
+
+    def test_index_matches_scan(self, sample_display_info, sample_data):
+        """Indexed masks equal scanned masks for every filter type."""
+        scanned = DisplayState(display_info=sample_display_info)
+        indexed = DisplayState(display_info=sample_display_info)
+        indexed.build_index(sample_data)
+
+        for varname, value in self.FILTERS:
+            scanned.set_filter(varname, value)
+            indexed.set_filter(varname, value)
+            assert (scanned.filter_mask(sample_data) ==
+                    indexed.filter_mask(sample_data)).all()
+
+        assert indexed.filter_data(sample_data)['panelKey'].tolist() == ['3']
+
+    def test_only_changed_filter_recomputed(self, sample_display_info, sample_data):
+        """Unchanged filters reuse their cached bitsets."""
+        state = DisplayState(display_info=sample_display_info)
+        index = state.build_index(sample_data)
+        state.set_filter('category', ['Alpha'])
+        state.set_filter('value', [10, 20])
+        state.filter_mask(sample_data)
+        category_bits = index._filters['category'][1]
+
+        state.set_filter('value', [0, 100])
+        state.filter_mask(sample_data)
+
+        assert index._filters['category'][1] is category_bits
+        assert state.filter_data(sample_data)['panelKey'].tolist() == ['0', '3']
+
+    def test_missing_values_excluded_from_ranges(self, sample_display_info, sample_data):
+        """NaN and NaT rows never match a range filter."""
+        data = sample_data.assign(value=[10, None, 30, 15, 25])
+        data.loc[0, 'date'] = pd.NaT
+        state = DisplayState(display_info=sample_display_info)
+        state.build_index(data)
+        state.set_filter('value', [0, 100])
+        state.set_filter('date', ['2000-01-01', '2030-01-01'])
+
+        assert state.filter_data(data)['panelKey'].tolist() == ['2', '3', '4']
+
+    def test_other_frames_are_scanned(self, sample_display_info, sample_data):
+        """The index is only used for the frame it was built on."""
+        state = DisplayState(display_info=sample_display_info)
+        state.build_index(sample_data)
+        state.set_filter('value', [20, 30])
+
+        subset = sample_data.iloc[:3]
+
+        assert state.filter_data(subset)['panelKey'].tolist() == ['1', '2']
+
+
 class TestDisplayStateSorting:
     """Test sorting functionality."""
 
@@ -220,6 +321,52 @@ class TestDisplayStateSorting:
         assert len(sorted_data) == len(sample_data)
 
 
+class TestSortPermutation:
+    """Test cached sort permutations and ordered positions."""
+
+    def test_permutation_cached_until_sort_changes(self, sample_display_info, sample_data):
+        """The permutation is reused until the sort spec changes."""
+        state = DisplayState(display_info=sample_display_info)
+        state.set_sort('value', 'desc')
+
+        first = state.sort_permutation(sample_data)
+        state.set_page(2)
+        assert state.sort_permutation(sample_data) is first
+
+        state.set_sort('value', 'asc')
+        assert state.sort_permutation(sample_data) is not first
+        assert state.sort_permutation(sample_data).tolist() == [0, 3, 1, 4, 2]
+
+    def test_ordered_positions_apply_mask(self, sample_display_info, sample_data):
+        """Filtered rows come back in sort order without re-sorting."""
+        state = DisplayState(display_info=sample_display_info)
+        state.set_sort('value', 'desc')
+        state.set_filter('category', ['Alpha', 'Beta'])
+
+        positions = state.ordered_positions(sample_data)
+
+        assert positions.tolist() == [4, 1, 3, 0]
+        assert state.sort_permutation(sample_data) is state._sort_cache[2]
+
+    def test_ordered_positions_without_sort(self, sample_display_info, sample_data):
+        """Without sorts, positions follow row order."""
+        state = DisplayState(display_info=sample_display_info)
+        mask = sample_data['value'].to_numpy() > 12
+
+        assert state.ordered_positions(sample_data, mask).tolist() == [1, 2, 3, 4]
+
+    def test_page_slice(self, sample_display_info, sample_data):
+        """page_slice selects the current page of ordered positions."""
+        state = DisplayState(display_info=sample_display_info)
+        state.set_layout(ncol=2, nrow=1)
+        state.set_sort('value', 'asc')
+        state.set_page(2)
+
+        page = state.ordered_positions(sample_data)[state.page_slice()]
+
+        assert sample_data['value'].iloc[page].tolist() == [20, 25]
+
+
 class TestDisplayStatePagination:
     """Test pagination functionality."""
 
@@ -0,0 +1,53 @@
+"""
+Unit tests for Dash filter components built from precomputed cogDistns.
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("dash")
+pytest.importorskip("dash_bootstrap_components")
+
+from trelliscope.dash_viewer.components.filters import create_filter_component
+
+
+class TestFiltersFromDistns:
+    """Filters use the precomputed distribution instead of the data."""
+
+    def test_factor_options_from_counts(self):
+        """Factor options come from level counts; unused levels are dropped."""
+        meta = {'varname': 'cat', 'type': 'factor', 'levels': ['a', 'b', 'c']}
+        distn = {'type': 'factor', 'dist': {'a': 2, 'b': 0, 'c': 1}}
+
+        dropdown = create_filter_component(meta, pd.Series([], dtype=object), distn)
+
+        assert [o['value'] for o in dropdown.options] == ['a', 'c']
+        assert dropdown.options[0]['label'] == 'a (2)'
+
+    def test_number_range_from_distn(self):
+        """The slider range comes from the precomputed range."""
+        meta = {'varname': 'num', 'type': 'number', 'digits': 1}
+        distn = {'type': 'number', 'range': [0.0, 10.0], 'dist': None}
+
+        component = create_filter_component(meta, pd.Series([], dtype=float), distn)
+        slider = component.children[0]
+
+        assert (slider.min, slider.max) == (0.0, 10.0)
+
+    def test_string_search_from_distinct_count(self):
+        """High-cardinality strings get a text search without a data scan."""
+        meta = {'varname': 'id', 'type': 'string'}
+        distn = {'type': 'string', 'n_distinct': 5000, 'dist': {'x': 1}}
+
+        component = create_filter_component(meta, pd.Series([], dtype=object), distn)
+
+        assert component.type == 'text'
+
+    def test_mismatched_distn_is_ignored(self):
+        """A distribution of another type falls back to the data."""
+        meta = {'varname': 'num', 'type': 'number', 'digits': 1}
+        distn = {'type': 'factor', 'dist': {'a': 1}}
+
+        component = create_filter_component(meta, pd.Series([1.0, 3.0]), distn)
+
+        assert component.children[0].max == 3.0
@@ -0,0 +1,182 @@
+"""
+Tests for loading Plotly panel figures in the Dash viewer.
+
+HTML panels are written with a figure JSON sidecar, and the viewer keeps
+parsed figures in an LRU cache keyed by file path and modification time.
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("dash")
+go = pytest.importorskip("plotly.graph_objects")
+
+from trelliscope.dash_viewer.components import panels as panels_module
+from trelliscope.dash_viewer.components.panels import PanelRenderer
+from trelliscope.dash_viewer.performance import LRUCache
+from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.plotly_adapter import PlotlyAdapter, figure_sidecar_path
+
+
+def make_figure(y):
+    return go.Figure(
+        data=[go.Scatter(x=[1, 2, 3], y=y)],
+        layout={"title": {"text": "panel"}, "width": 300},
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_figure_cache():
+    panels_module._figure_cache.clear()
+    yield
+    panels_module._figure_cache.clear()
+
+
+class TestFigureSidecar:
+    """Tests for the figure JSON written by PlotlyAdapter."""
+
+    def test_html_panel_writes_sidecar(self):
+        """Test that HTML panels get a figure JSON sidecar."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = PlotlyAdapter().save(make_figure([1, 2, 3]), Path(tmpdir) / "0")
+
+            assert path.name == "0.html"
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "0.figure.json", "0.html"
+            ]
+
+    def test_sidecar_disabled(self):
+        """Test that the sidecar can be switched off."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            PlotlyAdapter(figure_sidecar=False).save(
+                make_figure([1, 2, 3]), Path(tmpdir) / "0"
+            )
+            assert not figure_sidecar_path(Path(tmpdir) / "0.html").exists()
+
+    def test_cache_hit_removes_stale_sidecar(self):
+        """Test that a panel placed from the render cache drops an old sidecar."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            out = tmpdir / "panels"
+
+            manager.save_panel(lambda: make_figure([1, 2, 3]), out, "0")
+            figure_sidecar_path(out / "0").write_text("{}")
+            manager.save_panel(lambda: make_figure([1, 2, 3]), out, "0")
+
+            assert manager.cache.hits == 1
+            assert not figure_sidecar_path(out / "0").exists()
+
+
+class TestLoadPlotlyFigure:
+    """Tests for PanelRenderer.load_plotly_figure."""
+
+    def test_loads_from_sidecar(self, monkeypatch):
+        """Test that the sidecar is used instead of parsing the HTML."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = PlotlyAdapter().save(make_figure([4, 5, 6]), Path(tmpdir) / "0")
+
+            def fail(html_path):
+                raise AssertionError("HTML was parsed")
+
+            monkeypatch.setattr(PanelRenderer, "extract_plotly_figure", fail)
+            fig = PanelRenderer.load_plotly_figure(path)
+
+            assert list(fig["data"][0]["x"]) == [1, 2, 3]
+            assert fig["layout"]["title"]["text"] == "panel"
+
+    def test_falls_back_to_html(self):
+        """Test that panels without a sidecar are parsed from the HTML."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = PlotlyAdapter(figure_sidecar=False).save(
+                make_figure([4, 5, 6]), Path(tmpdir) / "0"
+            )
+            fig = PanelRenderer.load_plotly_figure(path)
+
+            assert fig["layout"]["title"]["text"] == "panel"
+
+    def test_parsed_once(self, monkeypatch):
+        """Test that repeated loads are served from the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = PlotlyAdapter(figure_sidecar=False).save(
+                make_figure([4, 5, 6]), Path(tmpdir) / "0"
+            )
+            calls = []
+            extract = PanelRenderer.extract_plotly_figure
+
+            def counting(html_path):
+                calls.append(html_path)
+                return extract(html_path)
+
+            monkeypatch.setattr(PanelRenderer, "extract_plotly_figure", counting)
+            for _ in range(3):
+                PanelRenderer.load_plotly_figure(path)
+
+            assert len(calls) == 1
+
+    def test_rewritten_panel_is_reloaded(self):
+        """Test that a changed modification time invalidates the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = PlotlyAdapter()
+            path = adapter.save(make_figure([4, 5, 6]), Path(tmpdir) / "0")
+            PanelRenderer.load_plotly_figure(path)
+
+            adapter.save(make_figure([7, 8, 9]), Path(tmpdir) / "0")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            sidecar = figure_sidecar_path(path)
+            os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+            fig = PanelRenderer.load_plotly_figure(path)
+            assert list(fig["data"][0]["y"]) == [7, 8, 9]
+
+    def test_layout_overrides_do_not_touch_cache(self):
+        """Test that layout overrides apply to a copy of the cached figure."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = PlotlyAdapter().save(make_figure([4, 5, 6]), Path(tmpdir) / "0")
+
+            sized = PanelRenderer.load_plotly_figure(path, height=600, width=None)
+            plain = PanelRenderer.load_plotly_figure(path)
+
+            assert sized["layout"]["height"] == 600
+            assert "width" not in sized["layout"]
+            assert plain["layout"]["width"] == 300
+            assert "height" not in plain["layout"]
+
+
+class TestLRUCache:
+    """Tests for the thread-safe cache holding parsed figures."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", {"n": 1})
+        cache.set("b", {"n": 2})
+        cache.get("a")
+        cache.set("c", {"n": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"n": 1}
+        assert len(cache) == 2
+
+    def test_concurrent_access(self):
+        """Test that threads reading and writing keep the size bounded."""
+        cache = LRUCache(max_size=8)
+
+        def work(offset):
+            for i in range(500):
+                key = str((offset + i) % 32)
+                if cache.get(key) is None:
+                    cache.set(key, {"key": key})
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 8
@@ -0,0 +1,128 @@
+"""
+Tests for server-side result resolution and panel serving in the Dash viewer.
+
+The browser store only holds a compact result handle; page and detail rows
+are resolved from cached row positions on the server, and grid images are
+loaded as thumbnails from a cached route.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("dash")
+pytest.importorskip("dash_bootstrap_components")
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from trelliscope import Display
+from trelliscope.dash_viewer.app import DashViewer
+from trelliscope.dash_viewer.thumbnails import ThumbnailStore
+
+
+def plot_group(group):
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.plot(group["v"].to_numpy())
+    return fig
+
+
+@pytest.fixture(scope="module")
+def viewer():
+    df = pd.DataFrame({"g": list("abcdefgh"), "v": [3, 1, 2, 5, 4, 0, 7, 6]})
+    display = Display.from_groupby(
+        df, by="g", plot_fn=plot_group, name="handles",
+        cogs={"total": ("v", "sum")},
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        display.write(Path(tmpdir), force=True)
+        yield DashViewer(Path(tmpdir) / "displays" / "handles")
+
+
+class TestResultHandles:
+    """Tests for result handles and server-side row resolution."""
+
+    def test_handle_is_compact(self, viewer):
+        """The stored handle carries a key and a count, not rows."""
+        positions, total = viewer._query_positions()
+        handle = viewer._result_handle(positions)
+
+        assert set(handle) == {'key', 'count', 'search'}
+        assert handle['count'] == total == 8
+        assert len(json.dumps(handle)) < 200
+
+    def test_resolve_sorted_filtered_rows(self, viewer):
+        """Handles resolve to the filtered rows in sort order."""
+        viewer.state.set_sort('total', 'desc')
+        viewer.state.set_filter('total', [2, 6])
+        try:
+            positions, _ = viewer._query_positions()
+            handle = viewer._result_handle(positions)
+
+            rows = viewer._rows(viewer._resolve_positions(handle))
+            assert rows['total'].tolist() == [6, 5, 4, 3, 2]
+        finally:
+            viewer.state.clear_filters()
+            viewer.state.clear_sorts()
+
+    def test_evicted_handle_is_recomputed(self, viewer):
+        """A handle missing from the cache is recomputed with its search."""
+        positions, _ = viewer._query_positions('c')
+        handle = viewer._result_handle(positions, 'c')
+        viewer._results.clear()
+
+        rows = viewer._rows(viewer._resolve_positions(handle))
+
+        assert rows['g_label'].tolist() == ['c']
+
+
+class TestThumbnails:
+    """Tests for grid thumbnails served over the cached route."""
+
+    def test_grid_uses_thumbnail_urls(self, viewer):
+        """Image panels reference the thumbnail route, not data URIs."""
+        viewer.thumbnails.size = (50, 50)
+        app = viewer.create_app()
+        client = app.server.test_client()
+
+        url = viewer.thumbnails.url(viewer.cog_data['_panel_full_path'].iloc[0])
+        assert url.startswith('/_trelliscope/thumbs/0.png?v=')
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.mimetype == 'image/webp'
+        assert 'immutable' in response.headers['Cache-Control']
+
+        etag = response.headers['ETag']
+        cached = client.get(url, headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+
+    def test_thumbnail_is_smaller(self, viewer):
+        """Thumbnails fit the size box and are regenerated when stale."""
+        from PIL import Image
+
+        panel = Path(viewer.cog_data['_panel_full_path'].iloc[1])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ThumbnailStore(panel.parent, cache_dir=tmpdir, size=(40, 40))
+            thumb = store.thumbnail(panel)
+
+            with Image.open(thumb) as image:
+                assert max(image.size) <= 40
+            assert thumb.stat().st_size < panel.stat().st_size
+
+            # A re-rendered panel gets a fresh thumbnail
+            os.utime(panel, ns=(thumb.stat().st_mtime_ns + 10**9,) * 2)
+            before = thumb.stat().st_mtime_ns
+            assert store.thumbnail(panel) == thumb
+            assert thumb.stat().st_mtime_ns != before
+
+    def test_route_rejects_other_paths(self, viewer):
+        """Only plain file names inside the panel directory are served."""
+        client = viewer.create_app().server.test_client()
+
+        assert client.get('/_trelliscope/thumbs/../displayInfo.json').status_code == 404
+        assert client.get('/_trelliscope/thumbs/missing.png').status_code == 404
@@ -204,6 +204,53 @@ class TestMetadataGeneration:
         # Numeric values should be numbers
         assert isinstance(first_entry["value"], (int, float))
 
+    def test_metadata_json_is_compact_by_default(self, sample_display, temp_output_dir):
+        """Test that metaData.json uses compact separators by default."""
+        json_path = write_metadata_json(sample_display, temp_output_dir)
+
+        content = json_path.read_text(encoding="utf-8")
+
+        assert "\n" not in content
+        assert content == json.dumps(
+            _serialize_cog_data(sample_display), separators=(",", ":")
+        ).replace('"panel":"', '"panel":"panels/')
+
+    def test_metadata_indent_matches_json_dump(self, sample_display, temp_output_dir):
+        """Test that indented output is identical to json.dump."""
+        json_path = write_metadata_json(
+            sample_display, temp_output_dir, indent=2, chunk_size=2
+        )
+
+        with open(json_path, "r") as f:
+            metadata = json.load(f)
+
+        assert json_path.read_text(encoding="utf-8") == json.dumps(
+            metadata, indent=2, ensure_ascii=False
+        )
+
+    def test_metadata_chunking_does_not_change_output(self, sample_display, temp_output_dir):
+        """Test that the chunk size does not affect the written records."""
+        chunked_dir = temp_output_dir / "chunked"
+        chunked_dir.mkdir()
+
+        write_metadata_js(sample_display, temp_output_dir)
+        write_metadata_js(sample_display, chunked_dir, chunk_size=2)
+
+        assert (temp_output_dir / "metaData.js").read_text() == (
+            chunked_dir / "metaData.js"
+        ).read_text()
+
+    def test_metadata_empty_display(self, temp_output_dir):
+        """Test that a display without rows writes an empty array."""
+        display = Display(pd.DataFrame({"value": pd.Series([], dtype=float)}), name="empty")
+        display.add_meta_variable(NumberMeta(varname="value"))
+
+        json_path = write_metadata_json(display, temp_output_dir)
+        js_path = write_metadata_js(display, temp_output_dir)
+
+        assert json_path.read_text() == "[]"
+        assert js_path.read_text() == "window.metaData = [];\n"
+
 
 class TestMetadataWithDisplay:
     """Integration tests for metadata generation through Display.write()."""
@@ -0,0 +1,124 @@
+"""
+Tests for automatic per-group cognostics.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trelliscope import Display
+from trelliscope.cognostics import cognostic_metas, compute_cognostics
+from trelliscope.meta import DateMeta, NumberMeta
+
+
+@pytest.fixture
+def series_df():
+    dates = pd.to_datetime(["2024-01-01", "2024-01-03", "2024-01-02", "2024-01-05"])
+    return pd.DataFrame({
+        "country": ["A", "A", "A", "B"] * 2,
+        "date": list(dates) * 2,
+        "value": [1.0, 5.0, 3.0, 7.0, np.nan, 2.0, 4.0, np.nan],
+    }).iloc[[0, 1, 2, 3, 4, 7]].reset_index(drop=True)
+
+
+class TestComputeCognostics:
+    """Tests for compute_cognostics."""
+
+    def test_matches_groupby_reference(self, series_df):
+        """Vectorized metrics match straightforward per-group results."""
+        cogs = compute_cognostics(series_df, "country", "value", date="date")
+        a = cogs.iloc[0]
+
+        assert cogs["country"].tolist() == ["A", "B"]
+        assert a["value_count"] == 3
+        assert a["value_mean"] == pytest.approx(3.0)
+        assert a["value_min"] == 1.0 and a["value_max"] == 5.0
+        # Last by date (2024-01-03), not by row order
+        assert a["value_last"] == 5.0
+        assert a["value_missing_frac"] == pytest.approx(0.25)
+        # value rises 2 per day: (1, day 0), (3, day 1), (5, day 2)
+        assert a["value_slope"] == pytest.approx(2.0)
+        assert a["date_span"] == 2.0
+
+    def test_single_point_group(self, series_df):
+        """Slope is NaN with fewer than two points; missing values are skipped."""
+        cogs = compute_cognostics(series_df, "country", "value", date="date")
+        b = cogs.iloc[1]
+
+        assert b["value_count"] == 1
+        assert np.isnan(b["value_slope"])
+        assert b["value_last"] == 7.0
+        assert b["value_missing_frac"] == pytest.approx(0.5)
+
+    def test_row_order_without_date(self):
+        """Without a date, slope and last use row order."""
+        df = pd.DataFrame({"g": ["x"] * 3, "v": [10.0, 7.0, 4.0]})
+        cogs = compute_cognostics(df, "g", "v", metrics=["slope", "last", "sd"])
+
+        assert list(cogs.columns) == ["g", "v_slope", "v_last", "v_sd"]
+        assert cogs["v_slope"].iloc[0] == pytest.approx(-3.0)
+        assert cogs["v_last"].iloc[0] == 4.0
+        assert cogs["v_sd"].iloc[0] == pytest.approx(3.0)
+
+    def test_invalid_metrics(self, series_df):
+        """Unknown metrics and date metrics without a date are rejected."""
+        with pytest.raises(ValueError, match="Unknown metrics"):
+            compute_cognostics(series_df, "country", "value", metrics=["median"])
+        with pytest.raises(ValueError, match="require a date"):
+            compute_cognostics(series_df, "country", "value", metrics=["date_span"])
+
+    def test_metas(self, series_df):
+        """Metric columns get inferred meta types and descriptions."""
+        cogs = compute_cognostics(series_df, "country", "value", date="date")
+        metas = cognostic_metas(cogs, "value", date="date")
+
+        assert "country" not in metas
+        assert isinstance(metas["value_mean"], NumberMeta)
+        assert isinstance(metas["date_first"], DateMeta)
+        assert metas["value_slope"].desc == "Linear trend of value per day"
+
+
+class TestDisplayCognostics:
+    """Tests for Display.add_cognostics and from_groupby(cognostics=...)."""
+
+    def test_add_cognostics_keeps_index(self, series_df):
+        """Cognostics are joined by key without changing panel IDs."""
+        display = Display(
+            pd.DataFrame({"country": ["B", "A"]}, index=[10, 20]), name="cogs"
+        )
+        display.add_cognostics(series_df, by="country", value="value")
+
+        assert list(display.data.index) == [10, 20]
+        assert display.data["value_count"].tolist() == [1, 3]
+        assert isinstance(display.get_meta_variable("value_max"), NumberMeta)
+
+    def test_add_cognostics_clash(self, series_df):
+        """Existing columns are not overwritten."""
+        display = Display(
+            pd.DataFrame({"country": ["A"], "value_mean": [0.0]}), name="clash"
+        )
+        with pytest.raises(ValueError, match="already exist"):
+            display.add_cognostics(series_df, by="country", value="value")
+
+    def test_from_groupby_value(self, series_df):
+        """from_groupby computes automatic cognostics for a value column."""
+        display = Display.from_groupby(
+            series_df, by="country", plot_fn=len, name="auto",
+            cognostics={"value": "value", "date": "date"},
+        )
+
+        assert display.data["value_last"].tolist() == [5.0, 7.0]
+        assert "date_span" in display.list_meta_variables()
+
+    def test_from_groupby_plot_kwargs_named_like_cognostics(self, series_df):
+        """Plot keywords such as value= and date= reach plot_fn untouched."""
+        def plot(df, value, date):
+            return (value, date)
+
+        display = Display.from_groupby(
+            series_df, by="country", plot_fn=plot, name="kwargs",
+            value="value", date="date",
+        )
+
+        assert display.data["panel"].iloc[0]() == ("value", "date")
+        assert "value_last" not in display.data.columns
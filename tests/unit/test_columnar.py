@@ -0,0 +1,171 @@
+"""Tests for the columnar cognostics store."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from trelliscope import Display
+from trelliscope.columnar import (
+    build_cog_frame,
+    find_cog_store,
+    read_cog_store,
+    write_cog_store,
+)
+from trelliscope.dash_viewer.loader import DisplayLoader
+from trelliscope.meta import FactorMeta
+
+
+@pytest.fixture
+def display():
+    """Display with factor, number, date and string cognostics."""
+    df = pd.DataFrame({
+        "country": ["UK", "USA", None, "France"],
+        "gdp": [2.8, 21.4, np.nan, 2.7],
+        "date": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01", None]),
+        "panel": ["a", "b", "c", "d"],
+    })
+    display = Display(df, name="columnar")
+    display.set_panel_column("panel")
+    display.infer_metas()
+    return display
+
+
+class TestBuildCogFrame:
+    """Tests for build_cog_frame."""
+
+    def test_keeps_native_dtypes(self, display):
+        """Test that numbers and dates keep their dtypes."""
+        frame = build_cog_frame(display)
+
+        assert pd.api.types.is_float_dtype(frame["gdp"])
+        assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+        assert list(frame["panelKey"]) == ["0", "1", "2", "3"]
+        assert frame.loc[0, "panel"] == "panels/0.png"
+
+    def test_factor_is_categorical_over_levels(self, display):
+        """Test that factors are categoricals whose categories are levels."""
+        frame = build_cog_frame(display)
+
+        assert isinstance(frame["country"].dtype, pd.CategoricalDtype)
+        assert list(frame["country"].cat.categories) == ["France", "UK", "USA"]
+        assert pd.isna(frame.loc[2, "country"])
+
+    def test_numeric_factor_codes(self):
+        """Test that numeric factor values are read as 0-based codes."""
+        df = pd.DataFrame({"grade": [0, 2, 1], "panel": ["a", "b", "c"]})
+        display = Display(df, name="codes")
+        display.set_panel_column("panel")
+        display.add_meta_variable(FactorMeta("grade", levels=["A", "B", "C"]))
+
+        frame = build_cog_frame(display)
+
+        assert list(frame["grade"]) == ["A", "C", "B"]
+
+
+class TestCogStoreRoundTrip:
+    """Tests for writing and reading the store."""
+
+    @pytest.mark.parametrize("format", ["arrow", "parquet"])
+    def test_round_trip(self, display, format):
+        """Test that the store reads back with its dtypes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_cog_store(display, Path(tmpdir), format=format)
+
+            assert find_cog_store(Path(tmpdir)) == path
+            frame = read_cog_store(path)
+
+        pd.testing.assert_frame_equal(frame, build_cog_frame(display))
+
+    def test_arrow_store_is_memory_mapped(self):
+        """Test that Arrow columns are read from the mapped file, not copied."""
+        import pyarrow as pa
+        from trelliscope.meta import NumberMeta
+
+        n = 100_000
+        df = pd.DataFrame({"x": np.arange(n) * 1.5, "panel": ["p"] * n})
+        display = Display(df, name="mapped")
+        display.set_panel_column("panel")
+        display.add_meta_variable(NumberMeta("x"))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_cog_store(display, Path(tmpdir), format="arrow")
+
+            before = pa.total_allocated_bytes()
+            frame = read_cog_store(path)
+            allocated = pa.total_allocated_bytes() - before
+
+            assert allocated < n * 8
+            assert not frame["x"].to_numpy().flags.writeable
+            assert frame["x"].iloc[-1] == (n - 1) * 1.5
+            del frame
+
+    def test_memory_map_disabled(self, display):
+        """Test reading Arrow IPC without memory mapping."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_cog_store(display, Path(tmpdir), format="arrow")
+            frame = read_cog_store(path, memory_map=False)
+
+        pd.testing.assert_frame_equal(frame, build_cog_frame(display))
+
+    def test_invalid_format_raises(self, display):
+        """Test that unknown formats are rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="format"):
+                write_cog_store(display, Path(tmpdir), format="csv")
+
+
+class TestLoaderPrefersStore:
+    """Tests for DisplayLoader with a columnar store."""
+
+    def test_loader_matches_json(self, display):
+        """Test that store and JSON cogData load to the same codes and labels."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display.write(
+                output_path=Path(tmpdir) / "json", render_panels=False
+            )
+            display.write(
+                output_path=Path(tmpdir) / "arrow",
+                render_panels=False,
+                cog_format="arrow",
+            )
+
+            from_json = DisplayLoader(Path(tmpdir) / "json").load()["cog_data"]
+            from_store = DisplayLoader(Path(tmpdir) / "arrow").load()["cog_data"]
+
+        assert pd.api.types.is_datetime64_any_dtype(from_store["date"])
+        for column in ["country", "country_label", "gdp", "panelKey", "_panel_type"]:
+            pd.testing.assert_series_equal(
+                from_store[column], from_json[column], check_dtype=False
+            )
+
+    def test_rewrite_without_store_removes_it(self, display):
+        """Test that a stale store is not picked up after rewriting."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            display.write(output_path=output, render_panels=False, cog_format="parquet")
+            display.write(output_path=output, render_panels=False, force=True)
+
+            assert find_cog_store(output / "displays" / "columnar") is None
+
+    def test_invalid_cog_format_raises(self, display):
+        """Test that Display.write validates cog_format."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="cog_format"):
+                display.write(output_path=Path(tmpdir) / "out", cog_format="csv")
+
+    def test_missing_pyarrow_fails_before_writing(self, display, monkeypatch):
+        """Test that a missing pyarrow is reported before any output is written."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            with pytest.raises(ImportError, match="pip install pyarrow"):
+                display.write(output_path=output, cog_format="arrow")
+
+            assert not output.exists()
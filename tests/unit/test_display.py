@@ -82,6 +82,35 @@ class TestDisplayInitialization:
         assert display.name == "test_display"
 
 
+class TestCopyFreeConstruction:
+    """Test Display(copy=False)."""
+
+    def test_copy_false_shares_buffers(self):
+        """Test that copy=False does not copy column data."""
+        import numpy as np
+
+        df = pd.DataFrame({"x": np.arange(1000.0), "y": np.arange(1000)})
+        display = Display(df, name="big", copy=False)
+
+        copied = Display(df, name="big")
+
+        assert np.shares_memory(display.data["x"].to_numpy(), df["x"].to_numpy())
+        assert not np.shares_memory(copied.data["x"].to_numpy(), df["x"].to_numpy())
+
+    def test_derived_columns_leave_input_untouched(self):
+        """Test that derived columns are tracked and not added to the input."""
+        df = pd.DataFrame({"k": ["a", "b"], "x": [1.0, 2.0]})
+        source = pd.DataFrame({"k": ["a", "a", "b"], "v": [1.0, 3.0, 5.0]})
+
+        display = Display(df, name="derived", copy=False)
+        display.add_cognostics(source, by="k", value="v", metrics=["mean"])
+        display.set_panel_function(len)
+
+        assert list(df.columns) == ["k", "x"]
+        assert display.derived_columns == ["v_mean", "panel"]
+        assert display.data["v_mean"].tolist() == [2.0, 5.0]
+
+
 class TestDisplayValidation:
     """Test Display input validation and error handling."""
 
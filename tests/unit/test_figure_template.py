@@ -0,0 +1,148 @@
+"""Tests for FigureTemplate panels."""
+
+import pickle
+import pytest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+plt = pytest.importorskip("matplotlib.pyplot")
+Image = pytest.importorskip("PIL.Image")
+
+from trelliscope import Display, FigureTemplate
+from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.matplotlib_adapter import MatplotlibAdapter
+from trelliscope.panels.parallel import render_panels
+from trelliscope.panels.template import TemplatePanel
+
+
+def setup_line(fig):
+    ax = fig.add_subplot()
+    line, = ax.plot([], [])
+    return ax, line
+
+
+def update_line(artists, df):
+    ax, line = artists
+    line.set_data(df["x"], df["y"])
+    ax.relim()
+    ax.autoscale_view()
+
+
+def make_template(**kwargs):
+    return FigureTemplate(setup_line, update_line, figsize=(2, 1.5), dpi=50, **kwargs)
+
+
+def frame(i):
+    return pd.DataFrame({"x": [0, 1, 2], "y": [0, i, 2 * i]})
+
+
+class TestFigureTemplate:
+    """Tests for drawing panels with a reused figure."""
+
+    def test_figure_built_once(self):
+        """Test that setup runs once and every panel reuses the figure."""
+        calls = []
+
+        def setup(fig):
+            calls.append(fig)
+            return setup_line(fig)
+
+        template = FigureTemplate(setup, update_line, figsize=(2, 1.5), dpi=50)
+        first = template.draw(frame(1)).copy()
+        second = template.draw(frame(-1))
+
+        assert len(calls) == 1
+        assert first.shape == (75, 100, 4)
+        assert not np.array_equal(first, second)
+
+    def test_save_png(self):
+        """Test that panels are written at the template's fixed size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = make_template().save(frame(1), Path(tmpdir) / "0.png")
+
+            with Image.open(path) as image:
+                assert image.format == "PNG"
+                assert image.size == (100, 75)
+
+    def test_save_svg(self):
+        """Test that vector formats are written with savefig."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = make_template().save(frame(1), Path(tmpdir) / "0.svg", format="svg")
+            assert "<svg" in path.read_text()
+
+    def test_figure_not_pickled(self):
+        """Test that a pickled template rebuilds its figure."""
+        template = make_template()
+        template.draw(frame(1))
+
+        restored = pickle.loads(pickle.dumps(template))
+
+        assert restored._figure is None
+        assert restored.draw(frame(2)).shape == (75, 100, 4)
+
+    def test_cache_key_depends_on_data(self):
+        """Test that template panels are keyed by their data."""
+        template = make_template()
+        assert template.panel(frame(1)).cache_key() == template.panel(frame(1)).cache_key()
+        assert template.panel(frame(1)).cache_key() != template.panel(frame(2)).cache_key()
+
+
+class TestTemplatePanelRendering:
+    """Tests for rendering template panels through the adapter."""
+
+    def test_adapter_detects_template_panels(self):
+        """Test that MatplotlibAdapter renders TemplatePanel objects."""
+        panel = make_template().panel(frame(1))
+        adapter = MatplotlibAdapter()
+
+        assert isinstance(panel, TemplatePanel)
+        assert adapter.detect(panel) is True
+        adapter.release(panel)    # shared figure is left open
+
+    def test_render_with_workers(self):
+        """Test that template panels render in worker processes."""
+        template = make_template()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), template.panel(frame(i))) for i in range(4)]
+            results = render_panels(panels, Path(tmpdir), workers=2)
+
+            assert all(r.ok for r in results)
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "0.png", "1.png", "2.png", "3.png"
+            ]
+
+    def test_render_cache(self):
+        """Test that unchanged template panels come from the render cache."""
+        template = make_template()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            panels = [(str(i), template.panel(frame(i))) for i in range(3)]
+
+            manager.save_panels(panels, tmpdir / "first")
+            results = manager.save_panels(panels, tmpdir / "second")
+
+            assert all(r.cached for r in results)
+
+    def test_from_groupby(self):
+        """Test template.panel as the plot function of a grouped display."""
+        df = pd.DataFrame({
+            "g": ["a", "a", "b", "b"],
+            "x": [0, 1, 0, 1],
+            "y": [1, 2, 3, 1],
+        })
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display = Display.from_groupby(
+                df, by="g", plot_fn=make_template().panel, name="template",
+                path=tmpdir,
+            )
+            output = display.write()
+
+            panels_dir = output / "displays" / "template" / "panels"
+            assert sorted(p.name for p in panels_dir.iterdir()) == ["0.png", "1.png"]
+            assert display.panel_errors == {}
@@ -16,6 +16,7 @@ from trelliscope.meta import (
     NumberMeta,
     DateMeta,
     TimeMeta,
+    StringMeta,
 )
 
 
@@ -311,3 +312,121 @@ class TestInferFallbackBehavior:
         # Timedelta is not considered numeric by pandas, falls back to FactorMeta
         assert isinstance(meta, FactorMeta)
         assert len(meta.levels) == 3
+
+
+class TestSampledInference:
+    """Test type decisions from a row sample (sample_size)."""
+
+    def test_object_numbers_infer_number_when_sampled(self):
+        """Object columns holding numbers become NumberMeta in sample mode."""
+        series = pd.Series([1, 2.5, None, 4] * 50, dtype=object, name="x")
+
+        assert isinstance(infer_meta_from_series(series), FactorMeta)
+        assert isinstance(
+            infer_meta_from_series(series, sample_size=20), NumberMeta
+        )
+
+    def test_object_booleans_infer_boolean_factor(self):
+        """Object columns of booleans get the boolean levels."""
+        series = pd.Series([True, False, None] * 10, dtype=object, name="flag")
+        meta = infer_meta_from_series(series, sample_size=5)
+
+        assert isinstance(meta, FactorMeta)
+        assert meta.levels == ["False", "True"]
+
+    def test_factor_levels_are_exact(self):
+        """Levels cover every row, not only the sampled ones."""
+        values = ["common"] * 10_000 + ["rare"]
+        series = pd.Series(values, name="cat")
+        meta = infer_meta_from_series(series, sample_size=10)
+
+        assert meta.levels == ["common", "rare"]
+
+    def test_categorical_levels_are_used_categories(self):
+        """Categorical levels come from the categories actually present."""
+        series = pd.Series(
+            pd.Categorical(["b", "a", None], categories=["c", "b", "a"]),
+            name="cat",
+        )
+        meta = infer_meta_from_series(series, sample_size=2)
+
+        assert meta.levels == ["a", "b"]
+
+    def test_time_component_detected_for_any_unit(self):
+        """Non-midnight times are found for non-nanosecond datetime units."""
+        dates = pd.Series(
+            pd.to_datetime(["2024-01-01", "1960-06-01"]).astype("datetime64[s]"),
+            name="d",
+        )
+        times = pd.Series(
+            pd.to_datetime(["1960-01-01 00:00:01", None]).astype("datetime64[s]"),
+            name="t",
+        )
+
+        assert isinstance(infer_meta_from_series(dates), DateMeta)
+        assert isinstance(infer_meta_from_series(times), TimeMeta)
+
+    def test_infer_meta_dict_passes_sample_size(self):
+        """infer_meta_dict forwards sample_size to every column."""
+        df = pd.DataFrame({
+            "num": pd.Series(range(100), dtype=object),
+            "cat": ["x", "y"] * 50,
+        })
+        metas = infer_meta_dict(df, sample_size=10)
+
+        assert isinstance(metas["num"], NumberMeta)
+        assert metas["cat"].levels == ["x", "y"]
+
+
+class TestHighCardinalityText:
+    """Test the max_factor_levels downgrade to StringMeta."""
+
+    def test_many_levels_infer_string(self):
+        """Text columns past the threshold become StringMeta."""
+        series = pd.Series([f"id{i}" for i in range(50)], name="id")
+
+        meta = infer_meta_from_series(series, max_factor_levels=10)
+
+        assert isinstance(meta, StringMeta)
+        assert not hasattr(meta, "levels")
+
+    def test_threshold_is_inclusive(self):
+        """A column with exactly max_factor_levels levels stays a factor."""
+        series = pd.Series(list("abcde") * 3, name="letter")
+
+        meta = infer_meta_from_series(series, max_factor_levels=5)
+
+        assert isinstance(meta, FactorMeta)
+        assert meta.levels == list("abcde")
+
+    def test_sample_decides_high_cardinality(self):
+        """A sample with too many distinct values decides StringMeta."""
+        series = pd.Series([f"row{i}" for i in range(1000)], name="text")
+
+        meta = infer_meta_from_series(series, sample_size=100, max_factor_levels=20)
+
+        assert isinstance(meta, StringMeta)
+
+    def test_categorical_and_none_keep_factor(self):
+        """Categoricals and max_factor_levels=None are never downgraded."""
+        values = [f"v{i}" for i in range(30)]
+
+        categorical = infer_meta_from_series(
+            pd.Series(pd.Categorical(values), name="c"), max_factor_levels=5
+        )
+        unlimited = infer_meta_from_series(
+            pd.Series(values, name="o"), max_factor_levels=None
+        )
+
+        assert isinstance(categorical, FactorMeta)
+        assert isinstance(unlimited, FactorMeta)
+        assert len(unlimited.levels) == 30
+
+    def test_infer_meta_dict_threshold(self):
+        """infer_meta_dict forwards max_factor_levels."""
+        df = pd.DataFrame({"id": [str(i) for i in range(20)], "g": ["a", "b"] * 10})
+
+        metas = infer_meta_dict(df, max_factor_levels=5)
+
+        assert isinstance(metas["id"], StringMeta)
+        assert isinstance(metas["g"], FactorMeta)
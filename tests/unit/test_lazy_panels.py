@@ -0,0 +1,243 @@
+"""
+Tests for lazy panels (LazyPanel, facet_panels, Display.set_panel_function,
+Display.from_groupby).
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from trelliscope import Display
+from trelliscope.panels.cache import callable_fingerprint
+from trelliscope.panels.lazy import LazyPanel, facet_panels, group_rows
+from trelliscope.panels.manager import PanelManager
+
+
+def plot_group(group):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot(group["x"].to_numpy(), group["y"].to_numpy())
+    return fig
+
+
+@pytest.fixture
+def long_df():
+    return pd.DataFrame({
+        "country": ["B", "A", "B", "A", None, "C"],
+        "x": [1, 1, 2, 2, 3, 1],
+        "y": [5.0, 1.0, 6.0, 2.0, 9.0, 3.0],
+    })
+
+
+class TestGroupRows:
+    """Tests for group_rows."""
+
+    def test_groups_sorted_with_positions(self, long_df):
+        """Keys are sorted and positions index the source rows."""
+        keys, rows = group_rows(long_df, "country")
+
+        assert keys["country"].tolist() == ["A", "B", "C"]
+        assert [r.tolist() for r in rows] == [[1, 3], [0, 2], [5]]
+
+    def test_missing_column(self, long_df):
+        """Unknown grouping columns raise ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            group_rows(long_df, ["nope"])
+
+    def test_empty_data(self):
+        """Empty data has no groups."""
+        keys, rows = group_rows(pd.DataFrame({"g": [], "v": []}), "g")
+
+        assert len(keys) == 0
+        assert rows == []
+
+    def test_all_keys_missing(self):
+        """Data whose keys are all missing has no groups."""
+        keys, rows = group_rows(pd.DataFrame({"g": [None, None], "v": [1, 2]}), "g")
+
+        assert len(keys) == 0
+        assert rows == []
+
+
+class TestFacetPanels:
+    """Tests for facet_panels and LazyPanel."""
+
+    def test_one_lazy_panel_per_group(self, long_df):
+        """Each group gets a LazyPanel over its own rows."""
+        panels = facet_panels(long_df, by="country", plot_fn=plot_group)
+
+        assert list(panels.columns) == ["country", "panel"]
+        assert all(isinstance(p, LazyPanel) for p in panels["panel"])
+        subset = panels["panel"].iloc[1].subset()
+        assert subset["y"].tolist() == [5.0, 6.0]
+
+    def test_pickle_ships_only_own_rows(self):
+        """A pickled panel carries its group's rows, not the source frame."""
+        import pickle
+
+        df = pd.DataFrame({
+            "g": np.repeat(np.arange(100), 50),
+            "x": np.arange(5000),
+            "y": np.random.default_rng(0).normal(size=5000),
+        })
+        panel = facet_panels(df, by="g", plot_fn=plot_group)["panel"].iloc[3]
+
+        restored = pickle.loads(pickle.dumps(panel))
+
+        assert len(pickle.dumps(panel)) < len(pickle.dumps(df)) / 10
+        pd.testing.assert_frame_equal(restored.subset(), panel.subset())
+        assert restored.cache_key() == panel.cache_key()
+
+    def test_no_groups(self):
+        """Empty data or all-missing keys give no panels."""
+        for df in (
+            pd.DataFrame({"g": [], "x": [], "y": []}),
+            pd.DataFrame({"g": [np.nan, np.nan], "x": [1, 2], "y": [1.0, 2.0]}),
+        ):
+            panels = facet_panels(df, by="g", plot_fn=plot_group)
+            assert list(panels.columns) == ["g", "panel"]
+            assert len(panels) == 0
+
+    def test_kwargs_passed_to_plot_fn(self, long_df):
+        """Extra keyword arguments reach the plot function."""
+        panel = LazyPanel(lambda d, scale: d["y"].sum() * scale, long_df, [0, 2], scale=2)
+        assert panel() == 22.0
+
+    def test_cache_key_tracks_group_content(self, long_df):
+        """Panels over equal data share a key; changed data changes it."""
+        first = LazyPanel(plot_group, long_df, [0, 2])
+        same = LazyPanel(plot_group, long_df.copy(), [0, 2])
+        changed = long_df.copy()
+        changed.loc[2, "y"] = 60.0
+
+        assert callable_fingerprint(first) == callable_fingerprint(same)
+        assert callable_fingerprint(first) != callable_fingerprint(
+            LazyPanel(plot_group, changed, [0, 2])
+        )
+
+    def test_figures_closed_after_render(self, long_df):
+        """Lazily built figures are closed once saved."""
+        plt.close("all")
+        panels = facet_panels(long_df, by="country", plot_fn=plot_group)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = PanelManager().save_panels(
+                [(str(i), p) for i, p in panels["panel"].items()], Path(tmpdir)
+            )
+
+            assert all(r.ok for r in results)
+            assert plt.get_fignums() == []
+
+    def test_user_figures_stay_open(self):
+        """Figures passed in directly are not closed."""
+        plt.close("all")
+        fig = plot_group(pd.DataFrame({"x": [1, 2], "y": [3, 4]}))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            PanelManager().save_panel(fig, Path(tmpdir), "0")
+
+        assert plt.get_fignums() == [fig.number]
+        plt.close("all")
+
+
+class TestSetPanelFunction:
+    """Tests for Display.set_panel_function."""
+
+    def test_panels_from_long_data(self, long_df):
+        """Display rows are matched to source rows by key."""
+        summary = pd.DataFrame({"country": ["C", "A", "Z"], "n": [1, 2, 0]})
+        display = Display(summary, name="lazy")
+        display.set_panel_function(plot_group, by="country", data=long_df)
+
+        assert display.panel_column == "panel"
+        panels = display.data["panel"]
+        assert panels.iloc[0].subset()["y"].tolist() == [3.0]
+        assert panels.iloc[1].subset()["y"].tolist() == [1.0, 2.0]
+        assert len(panels.iloc[2]) == 0
+
+    def test_panels_from_own_rows(self):
+        """Without data, each panel gets its own display row."""
+        display = Display(pd.DataFrame({"x": [1, 2], "y": [3.0, 4.0]}), name="rows")
+        display.set_panel_function(plot_group)
+
+        subset = display.data["panel"].iloc[1].subset()
+        assert subset["y"].tolist() == [4.0]
+        assert "panel" not in subset.columns
+
+    def test_data_requires_by(self, long_df):
+        """Passing data without by raises ValueError."""
+        display = Display(pd.DataFrame({"country": ["A"]}), name="x")
+        with pytest.raises(ValueError, match="by must be given"):
+            display.set_panel_function(plot_group, data=long_df)
+
+    def test_write_renders_lazy_panels(self, long_df):
+        """A lazy display writes one panel file per group and closes figures."""
+        plt.close("all")
+        panels = facet_panels(long_df, by="country", plot_fn=plot_group)
+        display = Display(panels, name="lazy_write").set_panel_column("panel")
+        display.infer_metas()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display.write(Path(tmpdir) / "out", force=True)
+            panel_dir = Path(tmpdir) / "out" / "displays" / "lazy_write" / "panels"
+
+            assert sorted(p.name for p in panel_dir.glob("*.png")) == [
+                "0.png", "1.png", "2.png"
+            ]
+            assert display.panel_errors == {}
+            assert plt.get_fignums() == []
+
+
+class TestFromGroupby:
+    """Tests for Display.from_groupby."""
+
+    def test_keys_cogs_and_panels(self, long_df):
+        """One row per group with aggregated cognostics and lazy panels."""
+        display = Display.from_groupby(
+            long_df,
+            by="country",
+            plot_fn=plot_group,
+            name="grouped",
+            cogs={"mean_y": ("y", "mean"), "n": ("y", "size")},
+        )
+
+        data = display.data
+        assert data["country"].tolist() == ["A", "B", "C"]
+        assert data["mean_y"].tolist() == [1.5, 5.5, 3.0]
+        assert data["n"].tolist() == [2, 2, 1]
+        assert display.panel_column == "panel"
+        assert data["panel"].iloc[0].subset()["y"].tolist() == [1.0, 2.0]
+        assert set(display.list_meta_variables()) == {"country", "mean_y", "n"}
+
+    def test_multiple_keys(self, long_df):
+        """Several key columns identify a panel."""
+        display = Display.from_groupby(
+            long_df, by=["country", "x"], plot_fn=plot_group, name="multi"
+        )
+
+        assert list(display.data.columns) == ["country", "x", "panel"]
+        assert len(display.data) == 5
+
+    def test_no_groups(self):
+        """Data without any non-missing key gives an empty display."""
+        df = pd.DataFrame({"g": [None, None], "x": [1, 2], "y": [1.0, 2.0]})
+        display = Display.from_groupby(
+            df, by="g", plot_fn=plot_group, name="empty",
+            cogs={"mean_y": ("y", "mean")},
+        )
+
+        assert len(display.data) == 0
+
+    def test_name_clash(self, long_df):
+        """Cognostics may not reuse key or panel column names."""
+        with pytest.raises(ValueError, match="clash"):
+            Display.from_groupby(
+                long_df, by="country", plot_fn=plot_group, name="bad",
+                cogs={"country": ("y", "mean")},
+            )
@@ -0,0 +1,400 @@
+"""Tests for the panel manifest and incremental writes."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from trelliscope import Display
+from trelliscope.manifest import (
+    MANIFEST_FILE,
+    frame_digest,
+    plan_incremental,
+    read_manifest,
+    record_content,
+    row_hashes,
+    write_manifest,
+)
+
+
+def plot_values(df):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.plot(df["value"].to_numpy())
+    return fig
+
+
+class TestRowHashes:
+    """Tests for row_hashes."""
+
+    def test_indexed_by_panel_id(self):
+        """Test that hashes are keyed by the index as strings."""
+        df = pd.DataFrame({"x": [1, 2]}, index=[5, 7])
+
+        hashes = row_hashes(df)
+
+        assert list(hashes.index) == ["5", "7"]
+        assert all(len(h) == 16 for h in hashes)
+
+    def test_changes_only_for_changed_rows(self):
+        """Test that editing one row only changes that row's hash."""
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        edited = df.assign(y=["a", "B", "c"])
+
+        before, after = row_hashes(df), row_hashes(edited)
+
+        assert (before != after).tolist() == [False, True, False]
+
+    def test_excluded_columns(self):
+        """Test that excluded columns do not affect the hash."""
+        df = pd.DataFrame({"x": [1, 2], "panel": [object(), object()]})
+        other = df.assign(panel=[object(), object()])
+
+        assert row_hashes(df, exclude=["panel"]).equals(
+            row_hashes(other, exclude=["panel"])
+        )
+
+    def test_extra_keys(self):
+        """Test that per-row extra keys are part of the hash."""
+        df = pd.DataFrame({"x": [1, 2], "panel": [object(), object()]})
+
+        before = row_hashes(df, exclude=["panel"], extra=["k0", "k1"])
+        after = row_hashes(df, exclude=["panel"], extra=["k0", "K1"])
+
+        assert (before != after).tolist() == [False, True]
+        assert not before.equals(row_hashes(df, exclude=["panel"]))
+
+    def test_unhashable_values(self):
+        """Test that list values are hashed by their string form."""
+        df = pd.DataFrame({"x": [[1, 2], [3]]})
+
+        hashes = row_hashes(df)
+
+        assert hashes.iloc[0] != hashes.iloc[1]
+
+
+class TestFrameDigest:
+    """Tests for frame_digest and content keysigs."""
+
+    def test_sensitive_to_middle_rows(self):
+        """Test that a change in any row changes the digest."""
+        df = pd.DataFrame({"x": range(1000), "y": ["a"] * 1000})
+        edited = df.copy()
+        edited.loc[500, "y"] = "b"
+
+        assert frame_digest(df) == frame_digest(df.copy())
+        assert frame_digest(df) != frame_digest(edited)
+
+    def test_dtype_index_and_exclude(self):
+        """Test that dtypes and index count, excluded columns do not."""
+        df = pd.DataFrame({"x": [1, 2], "panel": [object(), object()]})
+
+        assert frame_digest(df, exclude=["panel"]) == frame_digest(
+            df.assign(panel=[object(), object()]), exclude=["panel"]
+        )
+        assert frame_digest(df[["x"]]) != frame_digest(df[["x"]].astype(float))
+        assert frame_digest(df[["x"]]) != frame_digest(df[["x"]].set_axis([5, 6]))
+
+    def test_content_keysig(self):
+        """Test that keysig_mode='content' sees changes the sample mode misses."""
+        df = pd.DataFrame({"x": [1, 2, 3]})
+        edited = df.assign(x=[1, 20, 3])
+
+        assert Display(df, name="k").keysig == Display(edited, name="k").keysig
+        assert (
+            Display(df, name="k", keysig_mode="content").keysig
+            != Display(edited, name="k", keysig_mode="content").keysig
+        )
+        with pytest.raises(ValueError, match="keysig_mode"):
+            Display(df, name="k", keysig_mode="full")
+
+    def test_content_keysig_hashed_once(self, monkeypatch):
+        """Test that the frame is hashed once, when the keysig is first read."""
+        import trelliscope.display as display_module
+
+        calls = []
+
+        def counting(data, exclude=None):
+            calls.append(exclude)
+            return frame_digest(data, exclude)
+
+        monkeypatch.setattr(display_module, "frame_digest", counting)
+        df = pd.DataFrame({"x": [1, 2], "panel": [object(), object()]})
+        display = Display(df, name="k", keysig_mode="content")
+        display.set_panel_column("panel")
+        assert calls == []
+
+        keysig = display.keysig
+        assert display.keysig == keysig
+        assert calls == [["panel"]]
+
+    def test_content_keysig_ignores_callable_panels(self):
+        """Test that identical displays with callable panels share a keysig."""
+        def build():
+            df = pd.DataFrame({
+                "x": [1, 2, 3],
+                "panel": [lambda i=i: i for i in range(3)],
+            })
+            display = Display(df, name="k", keysig_mode="content")
+            return display.set_panel_column("panel")
+
+        first, second = build(), build()
+        assert first.keysig == second.keysig
+
+        edited = build()
+        edited.data.loc[1, "x"] = 20
+        assert Display(
+            edited.data, name="k", keysig_mode="content"
+        ).set_panel_column("panel").keysig != first.keysig
+
+    def test_given_keysig_kept(self):
+        """Test that setting the panel column keeps an explicit keysig."""
+        df = pd.DataFrame({"x": [1], "panel": [lambda: 0]})
+        display = Display(df, name="k", keysig="mine", keysig_mode="content")
+
+        assert display.set_panel_column("panel").keysig == "mine"
+
+    def test_record_content(self):
+        """Test that the fingerprint is kept alongside panel entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            record_content(Path(tmpdir), None)
+            assert read_manifest(Path(tmpdir)) is None
+
+            write_manifest(Path(tmpdir), {"0": {"hash": "h", "file": "0.png"}}, "png")
+            record_content(Path(tmpdir), "abc")
+            manifest = read_manifest(Path(tmpdir))
+
+            assert manifest["content"] == "abc"
+            assert manifest["panels"]["0"]["file"] == "0.png"
+
+
+class TestPlanIncremental:
+    """Tests for plan_incremental and manifest round trips."""
+
+    def test_without_manifest_renders_everything(self):
+        """Test that a missing manifest renders all panels."""
+        hashes = pd.Series({"0": "a", "1": "b"})
+
+        pending, removed = plan_incremental(hashes, None, Path("."))
+
+        assert pending == ["0", "1"]
+        assert removed == []
+
+    def test_new_changed_missing_and_removed(self):
+        """Test classification of panels against a previous manifest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display_dir = Path(tmpdir)
+            panels_dir = display_dir / "panels"
+            panels_dir.mkdir()
+            for name in ["0.png", "1.png", "9.png"]:
+                (panels_dir / name).touch()
+
+            write_manifest(display_dir, {
+                "0": {"hash": "a", "file": "0.png"},
+                "1": {"hash": "b", "file": "1.png"},
+                "2": {"hash": "c", "file": "2.png"},
+                "9": {"hash": "z", "file": "9.png"},
+            }, "png")
+            manifest = read_manifest(display_dir)
+
+            hashes = pd.Series({"0": "a", "1": "B", "2": "c", "3": "d"})
+            pending, removed = plan_incremental(hashes, manifest, panels_dir)
+
+        # 1 changed, 2 lost its file, 3 is new; 0 is unchanged
+        assert pending == ["1", "2", "3"]
+        assert removed == ["9"]
+
+    def test_changed_adapters_render_everything(self):
+        """Test that different adapter settings invalidate every panel."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display_dir = Path(tmpdir)
+            (display_dir / "panels").mkdir()
+            (display_dir / "panels" / "0.png").touch()
+            write_manifest(
+                display_dir, {"0": {"hash": "a", "file": "0.png"}}, "png", ["png"]
+            )
+            manifest = read_manifest(display_dir)
+            hashes = pd.Series({"0": "a"})
+
+            same = plan_incremental(hashes, manifest, display_dir / "panels", ["png"])
+            other = plan_incremental(hashes, manifest, display_dir / "panels", ["svg"])
+
+        assert same == ([], [])
+        assert other == (["0"], [])
+
+    def test_unreadable_manifest_is_ignored(self):
+        """Test that a corrupt manifest reads as missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / MANIFEST_FILE).write_text("{not json")
+
+            assert read_manifest(Path(tmpdir)) is None
+
+
+class TestIncrementalWrite:
+    """Tests for Display.write(incremental=True)."""
+
+    @pytest.fixture
+    def plt(self):
+        matplotlib = pytest.importorskip("matplotlib")
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        yield plt
+        plt.close("all")
+
+    def _display(self, plt, values, index):
+        def make_figure(v):
+            fig, ax = plt.subplots(figsize=(1, 1))
+            ax.plot([0, v])
+            return fig
+
+        df = pd.DataFrame(
+            {"x": values, "panel": [make_figure(v) for v in values]}, index=index
+        )
+        display = Display(df, name="nightly")
+        display.set_panel_column("panel")
+        display.infer_metas()
+        return display
+
+    def test_only_delta_is_rendered(self, plt, capsys):
+        """Test that unchanged panels are not re-rendered."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            self._display(plt, [0, 1, 2], [0, 1, 2]).write(output)
+            panels_dir = output / "displays" / "nightly" / "panels"
+            unchanged_mtime = (panels_dir / "0.png").stat().st_mtime_ns
+            capsys.readouterr()
+
+            # Row 1 changes, row 2 is removed, row 3 is new
+            self._display(plt, [0, 10, 3], [0, 1, 3]).write(output, incremental=True)
+            out = capsys.readouterr().out
+
+            assert "Rendered panel 1" in out
+            assert "Rendered panel 3" in out
+            assert "Rendered panel 0" not in out
+            assert (panels_dir / "0.png").stat().st_mtime_ns == unchanged_mtime
+            assert sorted(p.name for p in panels_dir.iterdir()) == [
+                "0.png", "1.png", "3.png"
+            ]
+
+            with open(output / "displays" / "nightly" / "metaData.json") as f:
+                metadata = json.load(f)
+            assert [row["panelKey"] for row in metadata] == ["0", "1", "3"]
+
+    def test_adapter_change_rerenders_everything(self, plt, capsys):
+        """Test that new adapter settings re-render unchanged rows."""
+        from trelliscope.panels.manager import PanelManager
+        from trelliscope.panels.matplotlib_adapter import MatplotlibAdapter
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            display_dir = output / "displays" / "nightly"
+            self._display(plt, [0, 1], [0, 1]).write(output)
+            capsys.readouterr()
+
+            manager = PanelManager()
+            manager.adapters = [MatplotlibAdapter(format="svg")]
+            self._display(plt, [0, 1], [0, 1]).write(
+                output, incremental=True, panel_manager=manager
+            )
+
+            assert "2 new or changed" in capsys.readouterr().out
+            assert sorted(p.name for p in (display_dir / "panels").iterdir()) == [
+                "0.svg", "1.svg"
+            ]
+            with open(display_dir / "displayInfo.json") as f:
+                assert "svg" in json.dumps(f.read())
+            assert "png" not in json.dumps(
+                read_manifest(display_dir)["panels"]
+            )
+
+    def test_changed_lazy_panel_subset_is_rerendered(self, plt, capsys):
+        """Test that lazy panels are redrawn when only their source rows change."""
+        def display(values):
+            data = pd.DataFrame({"g": ["a", "a", "b", "b"], "value": values})
+            return Display.from_groupby(
+                data, by="g", plot_fn=plot_values, name="nightly",
+                cogs={"n": ("value", "count")},
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            display([1, 2, 3, 4]).write(output)
+            capsys.readouterr()
+
+            display([1, 2, 3, 40]).write(output, incremental=True)
+            out = capsys.readouterr().out
+
+            assert "1 new or changed" in out
+            assert "Rendered panel 1" in out
+            assert "Rendered panel 0" not in out
+
+    def test_incremental_does_not_need_force(self, plt):
+        """Test that incremental writes may target an existing directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            display = self._display(plt, [0, 1], [0, 1])
+            display.write(output)
+
+            with pytest.raises(ValueError, match="incremental=True"):
+                display.write(output)
+            display.write(output, incremental=True)
+
+
+class TestSkipUnchanged:
+    """Tests for Display.write(skip_unchanged=True)."""
+
+    def _display(self, values):
+        df = pd.DataFrame({"x": values, "panel": [f"{v}.png" for v in values]})
+        display = Display(df, name="daily")
+        display.set_panel_column("panel")
+        display.infer_metas()
+        return display
+
+    def test_unchanged_display_is_skipped(self, capsys):
+        """Test that rewriting identical data does nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            self._display([1, 2]).write(output, render_panels=False, skip_unchanged=True)
+            info = output / "displays" / "daily" / "displayInfo.json"
+            mtime = info.stat().st_mtime_ns
+            capsys.readouterr()
+
+            result = self._display([1, 2]).write(
+                output, render_panels=False, skip_unchanged=True
+            )
+
+            assert result == output
+            assert "unchanged, skipping write" in capsys.readouterr().out
+            assert info.stat().st_mtime_ns == mtime
+
+    def test_changed_display_is_written(self):
+        """Test that changed data or options are written (force still needed)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            self._display([1, 2]).write(output, render_panels=False, skip_unchanged=True)
+
+            with pytest.raises(ValueError, match="already exists"):
+                self._display([1, 3]).write(
+                    output, render_panels=False, skip_unchanged=True
+                )
+            self._display([1, 3]).write(
+                output, render_panels=False, skip_unchanged=True, force=True
+            )
+            with pytest.raises(ValueError, match="already exists"):
+                self._display([1, 3]).write(
+                    output, render_panels=False, skip_unchanged=True,
+                    compress_metadata=True,
+                )
+
+    def test_plain_write_clears_fingerprint(self):
+        """Test that a write without skip_unchanged invalidates the record."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "out"
+            self._display([1, 2]).write(output, render_panels=False, skip_unchanged=True)
+            self._display([5, 6]).write(output, render_panels=False, force=True)
+
+            manifest = read_manifest(output / "displays" / "daily")
+            assert manifest["content"] is None
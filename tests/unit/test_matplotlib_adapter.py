@@ -186,3 +186,70 @@ class TestMatplotlibAdapterIntegration:
             # Verify all files created
             files = list(Path(tmpdir).glob("*.png"))
             assert len(files) == 5
+
+
+class TestMatplotlibAdapterFastPath:
+    """Tests for fixed-geometry rendering through the Agg canvas."""
+
+    def test_fast_path_keeps_figure_size(self):
+        """Test that fast path PNGs have the figure's exact pixel size."""
+        from PIL import Image
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fig, ax = plt.subplots(figsize=(3, 2))
+            ax.plot([1, 2, 3])
+            original_dpi = fig.dpi
+            adapter = MatplotlibAdapter(fast_path=True, dpi=50)
+            output_path = adapter.save(fig, Path(tmpdir) / "plot")
+            plt.close(fig)
+
+            with Image.open(output_path) as image:
+                assert image.format == "PNG"
+                assert image.size == (150, 100)
+            assert fig.dpi == original_dpi
+
+    def test_fast_path_jpeg(self):
+        """Test that fast path writes JPEG from the RGBA buffer."""
+        from PIL import Image
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fig, ax = plt.subplots(figsize=(2, 2))
+            ax.plot([1, 2, 3])
+            output_path = MatplotlibAdapter(format="jpeg", fast_path=True).save(
+                fig, Path(tmpdir) / "plot"
+            )
+            plt.close(fig)
+
+            with Image.open(output_path) as image:
+                assert image.format == "JPEG"
+                assert image.size == (200, 200)
+
+    def test_fast_path_ignored_for_vector_formats(self):
+        """Test that SVG output still goes through savefig."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fig, ax = plt.subplots()
+            ax.plot([1, 2, 3])
+            output_path = MatplotlibAdapter(format="svg", fast_path=True).save(
+                fig, Path(tmpdir) / "plot"
+            )
+            plt.close(fig)
+
+            assert output_path.read_text().lstrip().startswith("<?xml")
+
+    def test_fast_path_restores_figure_canvas(self):
+        """Test that a figure from another backend keeps its own canvas."""
+        from matplotlib.backends.backend_svg import FigureCanvasSVG
+        from matplotlib.figure import Figure
+        from PIL import Image
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fig = Figure(figsize=(2, 1))
+            canvas = FigureCanvasSVG(fig)
+            fig.add_subplot().plot([1, 2, 3])
+            output_path = MatplotlibAdapter(fast_path=True, dpi=50).save(
+                fig, Path(tmpdir) / "plot"
+            )
+
+            assert fig.canvas is canvas
+            with Image.open(output_path) as image:
+                assert image.size == (100, 50)
@@ -18,6 +18,7 @@ from trelliscope.meta import (
     CurrencyMeta,
     HrefMeta,
     GraphMeta,
+    level_code_map,
 )
 
 
@@ -142,6 +143,39 @@ class TestFactorMeta:
 
         assert meta.levels == ["A", "B", "C", "D"]
 
+    def test_level_codes(self):
+        """Test that level_codes maps each level to its 0-based index."""
+        meta = FactorMeta(varname="category", levels=["B", "A", "C"])
+
+        assert meta.level_codes == {"B": 0, "A": 1, "C": 2}
+
+    def test_level_codes_follow_level_changes(self):
+        """Test that level_codes is rebuilt when levels change."""
+        meta = FactorMeta(varname="category", levels=["A", "B"])
+        assert meta.level_codes == {"A": 0, "B": 1}
+
+        meta.levels = ["C"]
+        assert meta.level_codes == {"C": 0}
+
+        meta.levels = meta.levels + ["D"]
+        assert meta.level_codes == {"C": 0, "D": 1}
+
+        meta.levels = ["D", "C"]
+        assert meta.level_codes == {"D": 0, "C": 1}
+
+    def test_level_code_map_keeps_first_position(self):
+        """Test that repeated levels map to their first position."""
+        assert level_code_map(["A", "B", "A"]) == {"A": 0, "B": 1}
+        assert level_code_map(None) == {}
+
+    def test_level_codes_not_serialized(self):
+        """Test that the lookup cache does not leak into to_dict or eq."""
+        meta = FactorMeta(varname="category", levels=["A"])
+        meta.level_codes
+
+        assert "level_codes" not in meta.to_dict()
+        assert meta == FactorMeta(varname="category", levels=["A"])
+
 
 class TestNumberMeta:
     """Test NumberMeta class."""
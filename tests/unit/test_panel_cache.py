@@ -0,0 +1,222 @@
+"""
+Tests for the content-addressed panel render cache.
+"""
+
+import functools
+import os
+import subprocess
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from trelliscope.panels.cache import PanelCache, callable_fingerprint, stable_digest
+from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.matplotlib_adapter import MatplotlibAdapter
+
+
+def make_figure(values):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot(values)
+    return fig
+
+
+def range_panel(n):
+    return make_figure(range(n))
+
+
+class CountingPanel:
+    """Panel callable that counts how often it is built."""
+
+    def __init__(self, n):
+        self.n = n
+        self.calls = 0
+
+    def cache_key(self):
+        return ("range", self.n)
+
+    def __call__(self):
+        self.calls += 1
+        return make_figure(range(self.n))
+
+
+class TestFingerprints:
+    """Tests for figure and callable fingerprints."""
+
+    def test_equal_figures_have_equal_fingerprints(self):
+        """Identical figures hash the same despite different figure numbers."""
+        adapter = MatplotlibAdapter()
+        fig1 = make_figure([1, 2, 3])
+        fig2 = make_figure([1, 2, 3])
+        fig3 = make_figure([1, 2, 4])
+        try:
+            assert adapter.fingerprint(fig1) == adapter.fingerprint(fig2)
+            assert adapter.fingerprint(fig1) != adapter.fingerprint(fig3)
+        finally:
+            plt.close("all")
+
+    def test_fingerprint_is_stable_across_processes(self):
+        """A figure hashes the same in a fresh interpreter."""
+        script = (
+            "import matplotlib; matplotlib.use('Agg');"
+            "import matplotlib.pyplot as plt;"
+            "from trelliscope.panels.cache import stable_digest;"
+            "fig, ax = plt.subplots(figsize=(2, 2)); ax.plot([1, 2, 3]);"
+            "print(stable_digest(fig))"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2]))
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True, text=True, check=True, env=env,
+            ).stdout.strip()
+            for _ in range(2)
+        }
+        assert len(digests) == 1
+        assert None not in digests
+
+    def test_callable_fingerprint_tracks_inputs(self):
+        """Partial arguments and closure variables are part of the key."""
+        assert callable_fingerprint(functools.partial(range_panel, 3)) == \
+            callable_fingerprint(functools.partial(range_panel, 3))
+        assert callable_fingerprint(functools.partial(range_panel, 3)) != \
+            callable_fingerprint(functools.partial(range_panel, 4))
+
+        def closure(n):
+            return lambda: make_figure(range(n))
+
+        assert callable_fingerprint(closure(2)) == callable_fingerprint(closure(2))
+        assert callable_fingerprint(closure(2)) != callable_fingerprint(closure(5))
+
+    def test_callable_fingerprint_tracks_module_attributes(self):
+        """Values and functions read from a module are part of the key."""
+        settings = types.ModuleType("panel_settings")
+        settings.SCALE = 2
+        settings.helper = lambda n: n
+        namespace = {"settings": settings}
+        exec("def panel():\n    return settings.helper(settings.SCALE)", namespace)
+        panel = namespace["panel"]
+
+        before = callable_fingerprint(panel)
+        assert before is not None
+        assert callable_fingerprint(panel) == before
+
+        settings.SCALE = 3
+        scaled = callable_fingerprint(panel)
+        assert scaled != before
+
+        settings.helper = lambda n: n + 1
+        assert callable_fingerprint(panel) != scaled
+
+    def test_unpicklable_input_is_not_cacheable(self):
+        """Callables closing over unpicklable values are not fingerprinted."""
+        lock = __import__("threading").Lock()
+        assert callable_fingerprint(lambda: lock) is None
+        assert stable_digest(lock) is None
+
+
+class TestPanelCache:
+    """Tests for PanelCache storage, hits and eviction."""
+
+    def test_figure_cache_hit(self):
+        """A second save of an identical figure is served from the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+
+            path1 = manager.save_panel(make_figure([1, 2]), tmpdir / "a", "0")
+            path2 = manager.save_panel(make_figure([1, 2]), tmpdir / "b", "0")
+            plt.close("all")
+
+            assert manager.cache.misses == 1
+            assert manager.cache.hits == 1
+            assert path2.read_bytes() == path1.read_bytes()
+
+    def test_settings_change_misses(self):
+        """Changing dpi is a different cache key."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            fig = make_figure([1, 2])
+
+            manager.save_panel(fig, tmpdir / "out", "0")
+            manager.save_panel(fig, tmpdir / "out", "0", dpi=50)
+            plt.close("all")
+
+            assert manager.cache.hits == 0
+            assert manager.cache.misses == 2
+
+    def test_callable_hit_skips_call(self):
+        """Cached callables are not called again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            callables = [CountingPanel(i + 2) for i in range(3)]
+            panels = [(str(i), panel) for i, panel in enumerate(callables)]
+
+            first = manager.save_panels(panels, tmpdir / "out")
+            second = manager.save_panels(panels, tmpdir / "out")
+
+            assert [panel.calls for panel in callables] == [1, 1, 1]
+            assert not any(r.cached for r in first)
+            assert all(r.ok and r.cached for r in second)
+
+    def test_rerender_does_not_modify_cache_entry(self):
+        """Saving over a hard-linked panel leaves the cache entry intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+
+            manager.save_panel(make_figure([1, 2]), tmpdir / "out", "0")
+            entry_bytes = next(
+                p for p in (tmpdir / "cache").rglob("*.png")
+            ).read_bytes()
+            manager.save_panel(make_figure([5, 1]), tmpdir / "out", "0")
+            plt.close("all")
+
+            entries = {p.read_bytes() for p in (tmpdir / "cache").rglob("*.png")}
+            assert entry_bytes in entries
+            assert len(entries) == 2
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past max_bytes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            cache = PanelCache(tmpdir / "cache", max_bytes=250)
+            src = tmpdir / "panel.png"
+            src.write_bytes(b"x" * 100)
+
+            cache.store("aa" + "0" * 62, src)
+            cache.store("bb" + "0" * 62, src)
+            # Make the first entry the most recently used
+            old = cache.directory / "bb" / ("bb" + "0" * 62 + ".png")
+            os.utime(old, (0, 0))
+            cache.store("cc" + "0" * 62, src)
+
+            stats = cache.stats()
+            assert stats["entries"] == 2
+            assert stats["bytes"] <= 250
+            assert cache.fetch("bb" + "0" * 62, tmpdir / "out") is None
+            assert cache.fetch("aa" + "0" * 62, tmpdir / "out") is not None
+            assert stats["misses"] == 0
+            assert cache.hits == 1 and cache.misses == 1
+
+    def test_clear(self):
+        """clear() removes entries and resets counters."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            cache = PanelCache(tmpdir / "cache")
+            src = tmpdir / "panel.png"
+            src.write_bytes(b"png")
+            cache.store("ab" * 32, src)
+            cache.fetch("ab" * 32, tmpdir / "out")
+
+            cache.clear()
+
+            assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
@@ -0,0 +1,186 @@
+"""Tests for parallel panel rendering."""
+
+import pytest
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+plt = pytest.importorskip("matplotlib.pyplot")
+
+from trelliscope import Display
+from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.parallel import render_panels, resolve_workers
+
+
+def _make_figure(i):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot([0, 1, 2], [0, i, 2 * i])
+    return fig
+
+
+class TestResolveWorkers:
+    """Tests for normalizing the workers argument."""
+
+    def test_serial_defaults(self):
+        """Test that None and 1 mean serial rendering."""
+        assert resolve_workers(None) == 1
+        assert resolve_workers(1) == 1
+
+    def test_all_cpus(self):
+        """Test that -1 uses every CPU."""
+        assert resolve_workers(-1) >= 1
+
+    def test_explicit_count(self):
+        """Test explicit worker counts pass through."""
+        assert resolve_workers(3) == 3
+
+    def test_invalid_count_raises(self):
+        """Test that other negative counts are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            resolve_workers(-2)
+
+
+class TestSavePanels:
+    """Tests for PanelManager.save_panels."""
+
+    def test_collects_errors_per_panel(self):
+        """Test that a bad panel does not stop the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fig = _make_figure(1)
+            manager = PanelManager()
+            results = manager.save_panels(
+                [("0", fig), ("1", "not a figure")], Path(tmpdir)
+            )
+            plt.close(fig)
+
+            assert [r.panel_id for r in results] == ["0", "1"]
+            assert results[0].ok
+            assert results[0].path.exists()
+            assert not results[1].ok
+            assert results[1].error
+
+
+class TestRenderPanels:
+    """Tests for render_panels."""
+
+    def test_results_in_input_order(self):
+        """Test that executor results keep input order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), _make_figure(i)) for i in range(6)]
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = render_panels(
+                    panels, Path(tmpdir), executor=executor, chunksize=1
+                )
+            plt.close("all")
+
+            assert [r.panel_id for r in results] == [p[0] for p in panels]
+            assert all(r.ok for r in results)
+
+    def test_executor_chunks_sized_by_workers(self, monkeypatch):
+        """Test that workers sizes the chunks submitted to an executor."""
+        import trelliscope.panels.parallel as parallel
+
+        chunks = []
+        render_chunk = parallel._render_chunk
+
+        def recording(chunk, output_dir, manager=None):
+            chunks.append(len(chunk))
+            return render_chunk(chunk, output_dir, manager)
+
+        monkeypatch.setattr(parallel, "_render_chunk", recording)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), _make_figure(i)) for i in range(16)]
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = render_panels(
+                    panels, Path(tmpdir), executor=executor, workers=2
+                )
+            plt.close("all")
+
+            assert chunks == [2] * 8
+            assert all(r.ok for r in results)
+
+    def test_chunk_errors_are_panel_failures(self, monkeypatch):
+        """Test that other chunk errors fail their panels instead of retrying."""
+        import warnings
+        import trelliscope.panels.parallel as parallel
+
+        def failing(chunk, output_dir, manager=None):
+            raise ValueError("worker bug")
+
+        monkeypatch.setattr(parallel, "_render_chunk", failing)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), _make_figure(i)) for i in range(2)]
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    results = render_panels(
+                        panels, Path(tmpdir), executor=executor, chunksize=1
+                    )
+            plt.close("all")
+
+            assert [r.error for r in results] == ["worker bug", "worker bug"]
+            assert not list(Path(tmpdir).glob("*.png"))
+
+    def test_process_pool_matches_serial(self):
+        """Test that worker processes write the same panel files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), _make_figure(i)) for i in range(4)]
+            serial = render_panels(panels, Path(tmpdir) / "serial")
+            parallel = render_panels(panels, Path(tmpdir) / "parallel", workers=2)
+            plt.close("all")
+
+            assert [r.path.name for r in parallel] == [r.path.name for r in serial]
+            assert all(r.ok for r in parallel)
+
+    def test_unpicklable_panels_fall_back(self):
+        """Test that lambdas render in-process when workers can't take them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels = [(str(i), lambda i=i: _make_figure(i)) for i in range(3)]
+            with pytest.warns(RuntimeWarning, match="rendered serially"):
+                results = render_panels(panels, Path(tmpdir), workers=2)
+            plt.close("all")
+
+            assert all(r.ok for r in results)
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "0.png", "1.png", "2.png"
+            ]
+
+
+class TestDisplayWorkers:
+    """Tests for Display.write with workers."""
+
+    def test_write_with_workers(self):
+        """Test that a display renders every panel across workers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            df = pd.DataFrame({
+                "x": range(4),
+                "panel": [_make_figure(i) for i in range(4)],
+            })
+            display = Display(df, name="parallel", path=tmpdir)
+            display.set_panel_column("panel")
+            output = display.write(workers=2)
+            plt.close("all")
+
+            panels_dir = output / "displays" / "parallel" / "panels"
+            assert sorted(p.name for p in panels_dir.iterdir()) == [
+                "0.png", "1.png", "2.png", "3.png"
+            ]
+            assert display.panel_errors == {}
+
+    def test_write_records_panel_errors(self):
+        """Test that failed panels are recorded on the display."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            df = pd.DataFrame({
+                "x": range(2),
+                "panel": [_make_figure(0), "not a figure"],
+            })
+            display = Display(df, name="errors", path=tmpdir)
+            display.set_panel_column("panel")
+            display.write()
+            plt.close("all")
+
+            assert list(display.panel_errors) == ["1"]
@@ -0,0 +1,166 @@
+"""Tests for PlotlyAdapter."""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+go = pytest.importorskip("plotly.graph_objects")
+
+from trelliscope import Display
+from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.plotly_adapter import (
+    PlotlyAdapter,
+    plotlyjs_bundle_name,
+    write_plotlyjs_bundle,
+)
+
+
+def make_figure(i):
+    return go.Figure(data=[go.Bar(x=["a", "b"], y=[i, i + 1])])
+
+
+class TestSharedPlotlyjs:
+    """Tests for include_plotlyjs='shared'."""
+
+    def test_panels_reference_one_bundle(self):
+        """Test that HTML panels reference a bundle in the parent directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels_dir = Path(tmpdir) / "panels"
+            panels_dir.mkdir()
+            adapter = PlotlyAdapter(include_plotlyjs="shared")
+            paths = [adapter.save(make_figure(i), panels_dir / str(i)) for i in range(2)]
+
+            bundle = Path(tmpdir) / plotlyjs_bundle_name()
+            assert bundle.is_file()
+            assert not list(panels_dir.glob("*.js"))
+            for path in paths:
+                content = path.read_text(encoding="utf-8")
+                assert f'src="../{bundle.name}"' in content
+                assert "cdn.plot.ly" not in content
+                # Far smaller than a panel embedding plotly.js
+                assert path.stat().st_size < bundle.stat().st_size / 100
+
+    def test_bundle_not_rewritten(self):
+        """Test that an existing bundle is left in place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle = write_plotlyjs_bundle(Path(tmpdir))
+            mtime = bundle.stat().st_mtime_ns
+
+            assert write_plotlyjs_bundle(Path(tmpdir)) == bundle
+            assert bundle.stat().st_mtime_ns == mtime
+            assert not [p for p in Path(tmpdir).iterdir() if p.name.startswith(".")]
+
+    def test_display_write_with_cached_panels(self):
+        """Test that the bundle is written even when every panel is cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            manager.adapters = [PlotlyAdapter(include_plotlyjs="shared")]
+
+            for out in ("first", "second"):
+                df = pd.DataFrame({
+                    "x": range(2),
+                    "panel": [lambda i=i: make_figure(i) for i in range(2)],
+                })
+                display = Display(df, name="shared", path=tmpdir / out)
+                display.set_panel_column("panel")
+                output = display.write(panel_manager=manager)
+
+            assert manager.cache.hits == 2
+            display_dir = output / "displays" / "shared"
+            assert (display_dir / plotlyjs_bundle_name()).is_file()
+
+    def test_cdn_mode_writes_no_bundle(self):
+        """Test that the default mode keeps using the CDN."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panels_dir = Path(tmpdir) / "panels"
+            panels_dir.mkdir()
+            adapter = PlotlyAdapter()
+            adapter.write_assets(panels_dir)
+            path = adapter.save(make_figure(0), panels_dir / "0")
+
+            assert "cdn.plot.ly" in path.read_text(encoding="utf-8")
+            assert not list(Path(tmpdir).glob("*.js"))
+
+
+class TestBatchedStaticExport:
+    """Tests for batched static image export."""
+
+    @pytest.fixture
+    def fake_exporter(self, monkeypatch):
+        """Replace Kaleido with a recorder that writes placeholder files."""
+        import plotly.io as pio
+
+        calls = {"batch": [], "single": []}
+
+        def write_images(figs, files, format=None, width=None, height=None):
+            calls["batch"].append([Path(f).name for f in files])
+            for fig, file in zip(figs, files):
+                if fig.layout.title.text == "broken":
+                    raise ValueError("cannot export")
+                Path(file).write_bytes(b"image")
+
+        def write_image(fig, file, format=None, width=None, height=None):
+            calls["single"].append(Path(file).name)
+            if fig.layout.title.text == "broken":
+                raise ValueError("cannot export")
+            Path(file).write_bytes(b"image")
+
+        monkeypatch.setattr(pio, "write_images", write_images)
+        monkeypatch.setattr(pio, "write_image", write_image)
+        return calls
+
+    def test_save_panels_batches_static_exports(self, fake_exporter):
+        """Test that static panels are exported batch_size at a time."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = PanelManager(batch_size=2)
+            manager.adapters = [PlotlyAdapter(format="png")]
+            panels = [(str(i), lambda i=i: make_figure(i)) for i in range(5)]
+            results = manager.save_panels(panels, Path(tmpdir))
+
+            assert [r.path.name for r in results] == [f"{i}.png" for i in range(5)]
+            assert fake_exporter["batch"] == [
+                ["0.png", "1.png"], ["2.png", "3.png"], ["4.png"]
+            ]
+            assert fake_exporter["single"] == []
+
+    def test_failed_batch_reports_per_panel(self, fake_exporter):
+        """Test that a failing figure does not fail the rest of its batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = PanelManager()
+            manager.adapters = [PlotlyAdapter(format="png")]
+            broken = make_figure(1).update_layout(title_text="broken")
+            results = manager.save_panels(
+                [("0", make_figure(0)), ("1", broken), ("2", make_figure(2))],
+                Path(tmpdir),
+            )
+
+            assert [r.ok for r in results] == [True, False, True]
+            assert "Failed to save panel '1'" in results[1].error
+            assert fake_exporter["single"] == ["0.png", "1.png", "2.png"]
+
+    def test_html_is_not_batched(self, fake_exporter):
+        """Test that HTML panels are saved one by one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = PanelManager().save_panels(
+                [("0", make_figure(0)), ("1", make_figure(1))], Path(tmpdir)
+            )
+
+            assert [r.path.name for r in results] == ["0.html", "1.html"]
+            assert fake_exporter["batch"] == []
+
+    def test_batched_panels_are_cached(self, fake_exporter):
+        """Test that batched exports are stored in the render cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            manager = PanelManager(cache=tmpdir / "cache")
+            manager.adapters = [PlotlyAdapter(format="png")]
+            panels = [(str(i), make_figure(i)) for i in range(3)]
+
+            manager.save_panels(panels, tmpdir / "first")
+            results = manager.save_panels(panels, tmpdir / "second")
+
+            assert all(r.cached for r in results)
+            assert len(fake_exporter["batch"]) == 1
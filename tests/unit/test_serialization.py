@@ -12,7 +12,10 @@ import tempfile
 import shutil
 
 from trelliscope.display import Display
+from trelliscope.meta import FactorMeta
 from trelliscope.serialization import (
+    build_cog_columns,
+    build_cog_distns,
     serialize_display_info,
     write_display_info,
     serialize_to_json_string,
@@ -242,6 +245,258 @@ class TestWriteDisplayInfo:
             assert data["name"] == "display2"
 
 
+class TestExternalCogData:
+    """Test writing cogData outside displayInfo.json."""
+
+    def test_embedded_by_default(self):
+        """Test that cogData is embedded unless disabled."""
+        df = pd.DataFrame({"value": [1, 2]})
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        info = serialize_display_info(display)
+
+        assert len(info["cogData"]) == 2
+        assert "cogDataFile" not in info
+
+    def test_external_cog_data_reference(self):
+        """Test that external mode references the metadata file."""
+        df = pd.DataFrame({"value": [1, 2]})
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        info = serialize_display_info(
+            display, embed_cog_data=False, cog_data_file="metaData.json.gz"
+        )
+
+        assert "cogData" not in info
+        assert info["cogDataFile"] == "metaData.json.gz"
+
+    def _write(self, tmpdir, **kwargs):
+        df = pd.DataFrame({"value": [1, 2], "panel": ["a", "b"]})
+        display = Display(df, name="test")
+        display.set_panel_column("panel")
+        display.infer_metas()
+        output = display.write(
+            output_path=Path(tmpdir) / "out", render_panels=False, **kwargs
+        )
+        return output / "displays" / "test"
+
+    def test_display_write_external_single_file(self):
+        """Test that external cogData is written to metaData.js only."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display_dir = self._write(tmpdir, embed_cog_data=False)
+
+            with open(display_dir / "displayInfo.json") as f:
+                info = json.load(f)
+            text = (display_dir / "metaData.js").read_text()
+            records = json.loads(text[text.index("=") + 1:].strip().rstrip(";"))
+
+            assert "cogData" not in info
+            assert info["cogDataFile"] == "metaData.js"
+            assert [r["value"] for r in records] == [1, 2]
+            assert sorted(p.name for p in display_dir.glob("metaData*")) == [
+                "metaData.js"
+            ]
+
+    def test_display_write_external_compressed(self):
+        """Test Display.write with external, compressed cogData."""
+        import gzip
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display_dir = self._write(
+                tmpdir, embed_cog_data=False, compress_metadata=True
+            )
+
+            with open(display_dir / "displayInfo.json") as f:
+                info = json.load(f)
+            with gzip.open(display_dir / "metaData.js.gz", "rt") as f:
+                text = f.read()
+
+            assert "cogData" not in info
+            assert info["cogDataFile"] == "metaData.js.gz"
+            assert text.startswith("window.metaData = ")
+            assert sorted(p.name for p in display_dir.glob("metaData*")) == [
+                "metaData.js.gz"
+            ]
+
+    def test_rewrite_removes_stale_metadata(self):
+        """Test that switching modes drops files of the previous write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, compress_metadata=True)
+            display_dir = self._write(tmpdir, embed_cog_data=False, force=True)
+            assert sorted(p.name for p in display_dir.glob("metaData*")) == [
+                "metaData.js"
+            ]
+
+            display_dir = self._write(tmpdir, force=True)
+            assert sorted(p.name for p in display_dir.glob("metaData*")) == [
+                "metaData.js", "metaData.json"
+            ]
+
+
+class TestBuildCogColumns:
+    """Test build_cog_columns function."""
+
+    def test_columns_per_variable(self):
+        """Test that each meta variable becomes one column of values."""
+        df = pd.DataFrame({"value": [1, 2, 3], "name": ["a", "b", "c"]})
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        columns = build_cog_columns(display)
+
+        assert columns["value"] == [1, 2, 3]
+        assert columns["name"] == [1, 2, 3]
+        assert columns["panelKey"] == ["0", "1", "2"]
+
+    def test_missing_values_become_null(self):
+        """Test that NaN and NaT are serialized as null."""
+        df = pd.DataFrame({
+            "value": [1.5, float("nan")],
+            "date": pd.to_datetime(["2024-01-01", None]),
+        })
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        columns = build_cog_columns(display)
+
+        assert columns["value"] == [1.5, None]
+        assert columns["date"] == ["2024-01-01T00:00:00", None]
+
+    def test_datetimes_match_isoformat(self):
+        """Test that datetime columns format like Timestamp.isoformat()."""
+        stamps = pd.to_datetime(["2024-01-01 10:30:00.000", "2024-01-02 00:00:00.250"])
+        df = pd.DataFrame({"time": stamps, "aware": stamps.tz_localize("UTC")})
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        columns = build_cog_columns(display)
+
+        assert columns["time"] == [ts.isoformat() for ts in stamps]
+        assert columns["aware"] == [
+            ts.isoformat() for ts in stamps.tz_localize("UTC")
+        ]
+
+    def test_panel_key_uses_index(self):
+        """Test that panelKey follows the DataFrame index."""
+        df = pd.DataFrame(
+            {"country": ["b", "a"], "panel": ["p", "p"]}, index=[10, 20]
+        )
+        display = Display(df, name="test")
+        display.set_panel_column("panel")
+        display.infer_metas()
+
+        info = serialize_display_info(display)
+
+        assert [row["panelKey"] for row in info["cogData"]] == ["10", "20"]
+        assert [row["panel"] for row in info["cogData"]] == ["10.png", "20.png"]
+        assert [row["country"] for row in info["cogData"]] == [2, 1]
+
+    def test_prebuilt_columns_are_reused(self):
+        """Test that serializers accept prebuilt columns."""
+        df = pd.DataFrame({"value": [1, 2]})
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        columns = build_cog_columns(display)
+        columns["value"] = [7, 8]
+
+        info = serialize_display_info(display, columns)
+
+        assert [row["value"] for row in info["cogData"]] == [7, 8]
+
+    def test_row_slice(self):
+        """Test that a row slice converts only those rows."""
+        df = pd.DataFrame(
+            {"value": [1, 2, 3], "name": ["a", "b", "c"]}, index=[5, 6, 7]
+        )
+        display = Display(df, name="test")
+        display.infer_metas()
+
+        columns = build_cog_columns(display, slice(1, 3))
+
+        assert columns == {"value": [2, 3], "name": [2, 3], "panelKey": ["6", "7"]}
+
+    def test_metadata_converted_per_chunk(self, monkeypatch):
+        """Test that metaData.js without prebuilt columns converts chunk by chunk."""
+        from trelliscope import serialization
+
+        df = pd.DataFrame({"value": range(5), "panel": ["p"] * 5})
+        display = Display(df, name="test")
+        display.set_panel_column("panel")
+        display.infer_metas()
+
+        sizes = []
+        build = serialization.build_cog_columns
+
+        def recording(display, rows=None):
+            columns = build(display, rows)
+            sizes.append(len(columns["panelKey"]))
+            return columns
+
+        monkeypatch.setattr(serialization, "build_cog_columns", recording)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = serialization.write_metadata_js(display, Path(tmpdir), chunk_size=2)
+            text = path.read_text()
+
+        records = json.loads(text[text.index("=") + 1:].strip().rstrip(";"))
+        assert sizes == [2, 2, 1]
+        assert [r["value"] for r in records] == [0, 1, 2, 3, 4]
+        assert records[4]["panel"] == "panels/4.png"
+
+
+class TestBuildCogDistns:
+    """Test precomputed filter distributions (cogDistns)."""
+
+    @pytest.fixture
+    def display(self):
+        df = pd.DataFrame({
+            "cat": ["b", "a", "b", None],
+            "num": [1.0, 2.0, 4.0, float("nan")],
+            "day": pd.to_datetime(["2024-01-03", "2024-01-01", None, "2024-02-01"]),
+            "empty": [float("nan")] * 4,
+        })
+        return Display(df, name="distns").infer_metas()
+
+    def test_factor_counts_in_level_order(self, display):
+        """Factor distributions count every level, including unused ones."""
+        display.add_meta_variable(
+            FactorMeta(varname="cat", levels=["a", "b", "c"]), replace=True
+        )
+        distn = build_cog_distns(display)["cat"]
+
+        assert distn["dist"] == {"a": 1, "b": 2, "c": 0}
+        assert distn["n"] == 3 and distn["n_missing"] == 1
+
+    def test_number_histogram(self, display):
+        """Numeric distributions hold a range and fixed-bin histogram."""
+        distn = build_cog_distns(display, bins=3)["num"]
+
+        assert distn["range"] == [1.0, 4.0]
+        assert distn["dist"]["breaks"] == [1.0, 2.0, 3.0, 4.0]
+        assert distn["dist"]["freq"] == [1, 1, 1]
+
+    def test_date_range_and_empty_number(self, display):
+        """Dates get an ISO range; all-missing columns get no range."""
+        distns = build_cog_distns(display)
+
+        assert distns["day"]["range"] == ["2024-01-01T00:00:00", "2024-02-01T00:00:00"]
+        assert distns["empty"]["range"] is None
+
+    def test_written_to_display_info(self, display):
+        """Display.write stores the distributions in displayInfo.json."""
+        display.data["panel"] = ["a", "b", "c", "d"]
+        display.set_panel_column("panel")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display.write(Path(tmpdir), force=True, render_panels=False)
+            info_path = Path(tmpdir) / "displays" / "distns" / "displayInfo.json"
+            info = json.loads(info_path.read_text())
+
+        assert set(info["cogDistns"]) == {"cat", "num", "day", "empty"}
+        json.dumps(info["cogDistns"], allow_nan=False)
+
+
 class TestSerializeToJsonString:
     """Test serialize_to_json_string function."""
 
@@ -283,6 +283,33 @@ class TestDisplayServerIntegration:
             finally:
                 server.stop()
 
+    def test_serve_gzipped_file(self):
+        """Test that a missing file is served from its .gz with gzip encoding."""
+        pytest.importorskip("requests")
+        import gzip
+        import requests
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            display_dir = Path(tmpdir) / "my_display"
+            display_dir.mkdir()
+            with gzip.open(display_dir / "metaData.js.gz", "wt") as f:
+                f.write("window.metaData = [];\n")
+
+            server = DisplayServer(display_dir, port=8017)
+            try:
+                server.start(blocking=False)
+                time.sleep(0.5)  # Give server time to start
+
+                response = requests.get(
+                    f"{server.get_url()}/my_display/metaData.js", timeout=2
+                )
+                assert response.status_code == 200
+                assert response.headers["Content-Encoding"] == "gzip"
+                assert "javascript" in response.headers["Content-Type"]
+                assert response.text == "window.metaData = [];\n"
+            finally:
+                server.stop()
+
     def test_multiple_requests(self):
         """Test server can handle multiple requests."""
         pytest.importorskip("requests")
@@ -38,6 +38,10 @@ from trelliscope.panels import PanelRenderer
 from trelliscope.panels.matplotlib_adapter import MatplotlibAdapter
 from trelliscope.panels.plotly_adapter import PlotlyAdapter
 from trelliscope.panels.manager import PanelManager
+from trelliscope.panels.cache import PanelCache
+from trelliscope.panels.lazy import LazyPanel, facet_panels
+from trelliscope.panels.template import FigureTemplate
+from trelliscope.cognostics import compute_cognostics
 from trelliscope.server import DisplayServer
 from trelliscope.viewer import generate_viewer_html, write_index_html
 from trelliscope.export import (
@@ -71,6 +75,11 @@ __all__ = [
     "MatplotlibAdapter",
     "PlotlyAdapter",
     "PanelManager",
+    "PanelCache",
+    "LazyPanel",
+    "facet_panels",
+    "FigureTemplate",
+    "compute_cognostics",
     "DisplayServer",
     "generate_viewer_html",
     "write_index_html",
@@ -0,0 +1,274 @@
+"""
+Automatic cognostics for grouped data.
+
+Computes standard per-group summaries of a value column (count, mean,
+min/max, slope, last value, missing fraction, date span, ...) for every
+group at once. All metrics are derived from group numbers with ``bincount``
+reductions and pandas' grouped reductions, so the cost is a few passes over
+the data regardless of the number of groups; no Python code runs per group.
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from trelliscope.inference import infer_meta_dict
+from trelliscope.meta import MetaVariable
+
+
+#: Metrics computed when none are requested.
+DEFAULT_METRICS = (
+    "count", "mean", "min", "max", "slope", "last", "missing_frac",
+)
+
+#: Metrics that need a date column.
+DATE_METRICS = ("first_date", "last_date", "date_span")
+
+#: Every metric compute_cognostics understands, with its description.
+METRICS = {
+    "count": "Number of non-missing values of {value}",
+    "mean": "Mean of {value}",
+    "sd": "Standard deviation of {value}",
+    "min": "Minimum of {value}",
+    "max": "Maximum of {value}",
+    "slope": "Linear trend of {value} per {unit}",
+    "last": "Last non-missing value of {value}",
+    "missing_frac": "Fraction of missing values of {value}",
+    "first_date": "First {date}",
+    "last_date": "Last {date}",
+    "date_span": "Days between first and last {date}",
+}
+
+
+def _metric_column(metric: str, prefix: str, date: Optional[str]) -> str:
+    """Output column name of a metric (e.g. value_mean, date_first)."""
+    if metric in DATE_METRICS:
+        return f"{date}_{metric.replace('_date', '').replace('date_', '')}"
+    return f"{prefix}_{metric}"
+
+
+def _group_codes(data: pd.DataFrame, by: List[str]):
+    """Group numbers per row (-1 for missing keys) and the sorted group keys."""
+    grouped = data.groupby(by, sort=True, observed=True)
+    keys = grouped.size().index.to_frame(index=False)
+    codes = grouped.ngroup().to_numpy()
+    codes = np.where(np.isnan(codes), -1, codes).astype(np.intp)
+    return grouped, keys, codes
+
+
+def _last_valid(
+    y: np.ndarray,
+    codes: np.ndarray,
+    order_key: np.ndarray,
+    n_groups: int,
+) -> np.ndarray:
+    """Last non-missing value per group, ordered by order_key within group."""
+    result = np.full(n_groups, np.nan)
+    valid = (codes >= 0) & ~np.isnan(y)
+    idx = np.flatnonzero(valid)
+    if len(idx) == 0:
+        return result
+    order = idx[np.lexsort((order_key[idx], codes[idx]))]
+    group = codes[order]
+    is_last = np.r_[group[1:] != group[:-1], True]
+    result[group[is_last]] = y[order[is_last]]
+    return result
+
+
+def compute_cognostics(
+    data: pd.DataFrame,
+    by: Union[str, List[str]],
+    value: str,
+    date: Optional[str] = None,
+    metrics: Optional[Sequence[str]] = None,
+    prefix: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Compute standard summaries of a value column for every group.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Long-format data, several rows per group.
+    by : str or list of str
+        Grouping columns.
+    value : str
+        Numeric column to summarize.
+    date : str, optional
+        Date column. Orders rows for ``last`` and ``slope`` (otherwise row
+        order is used) and enables the date metrics.
+    metrics : sequence of str, optional
+        Metrics to compute, from ``METRICS``. Defaults to
+        ``DEFAULT_METRICS`` plus ``DATE_METRICS`` when ``date`` is given.
+    prefix : str, optional
+        Prefix for the metric column names. Defaults to ``value``
+        (e.g. ``value_mean``). Date metrics are prefixed with ``date``.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per group, sorted by key (the same order as
+        ``Display.from_groupby``): the grouping columns followed by one
+        column per metric. Groups with a missing key are left out.
+
+    Raises
+    ------
+    ValueError
+        If a column is missing, a metric is unknown, or a date metric is
+        requested without ``date``.
+
+    Notes
+    -----
+    ``slope`` is the least-squares slope of the value against the date in
+    days, or against the row position within the group when there is no
+    date column. It is NaN for groups with fewer than two distinct x values.
+
+    Examples
+    --------
+    >>> cogs = compute_cognostics(jodi, by="country", value="value", date="date")
+    >>> list(cogs.columns)[:4]
+    ['country', 'value_count', 'value_mean', 'value_min']
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    required = by + [value] + ([date] if date else [])
+    missing = [col for col in required if col not in data.columns]
+    if missing:
+        raise ValueError(
+            f"Columns not found in DataFrame: {missing}. "
+            f"Available columns: {list(data.columns)}"
+        )
+
+    if metrics is None:
+        metrics = DEFAULT_METRICS + (DATE_METRICS if date else ())
+    unknown = [m for m in metrics if m not in METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics: {unknown}. Available: {list(METRICS)}"
+        )
+    if not date and any(m in DATE_METRICS for m in metrics):
+        raise ValueError(f"Metrics {list(DATE_METRICS)} require a date column")
+
+    if prefix is None:
+        prefix = value
+
+    grouped, keys, codes = _group_codes(data, by)
+    n_groups = len(keys)
+    in_group = codes >= 0
+    group = codes[in_group]
+
+    y = pd.to_numeric(data[value], errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
+    )[in_group]
+    valid = ~np.isnan(y)
+    y0 = np.where(valid, y, 0.0)
+
+    if date:
+        dates = pd.to_datetime(data[date])
+        # Days since the epoch, as float; NaT becomes NaN
+        x_all = (
+            dates.to_numpy(dtype="datetime64[ns]").astype(np.int64) / 86_400e9
+        )
+        x_all[dates.isna().to_numpy()] = np.nan
+    else:
+        x_all = grouped.cumcount().to_numpy(dtype=float)
+    x = x_all[in_group]
+
+    rows = np.bincount(group, minlength=n_groups).astype(float)
+    count = np.bincount(group, weights=valid, minlength=n_groups)
+    total = np.bincount(group, weights=y0, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+
+    result = {}
+    for metric in metrics:
+        name = _metric_column(metric, prefix, date)
+
+        if metric == "count":
+            result[name] = count.astype(np.int64)
+        elif metric == "mean":
+            result[name] = mean
+        elif metric == "sd":
+            dev = np.where(valid, y - mean[group], 0.0)
+            ss = np.bincount(group, weights=dev * dev, minlength=n_groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result[name] = np.where(count > 1, np.sqrt(ss / (count - 1)), np.nan)
+        elif metric in ("min", "max"):
+            reduced = getattr(grouped[value], metric)()
+            result[name] = reduced.to_numpy(dtype=float, na_value=np.nan)
+        elif metric == "slope":
+            fit = valid & ~np.isnan(x)
+            n_fit = np.bincount(group, weights=fit, minlength=n_groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mx = np.bincount(
+                    group, weights=np.where(fit, x, 0.0), minlength=n_groups
+                ) / n_fit
+                my = np.bincount(
+                    group, weights=np.where(fit, y, 0.0), minlength=n_groups
+                ) / n_fit
+                dx = np.where(fit, x - mx[group], 0.0)
+                dy = np.where(fit, y - my[group], 0.0)
+                sxx = np.bincount(group, weights=dx * dx, minlength=n_groups)
+                sxy = np.bincount(group, weights=dx * dy, minlength=n_groups)
+                result[name] = np.where(sxx > 0, sxy / sxx, np.nan)
+        elif metric == "last":
+            order_key = np.nan_to_num(x_all, nan=-np.inf)
+            full_y = np.full(len(codes), np.nan)
+            full_y[in_group] = y
+            result[name] = _last_valid(full_y, codes, order_key, n_groups)
+        elif metric == "missing_frac":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result[name] = 1.0 - count / rows
+        elif metric == "first_date":
+            result[name] = grouped[date].min().to_numpy()
+        elif metric == "last_date":
+            result[name] = grouped[date].max().to_numpy()
+        elif metric == "date_span":
+            span = pd.to_datetime(grouped[date].max()) - pd.to_datetime(grouped[date].min())
+            result[name] = (span.dt.total_seconds() / 86_400).to_numpy()
+
+    cogs = pd.DataFrame(result)
+    return pd.concat([keys, cogs], axis=1)
+
+
+def cognostic_metas(
+    cogs: pd.DataFrame,
+    value: str,
+    date: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> Dict[str, MetaVariable]:
+    """
+    Infer meta variables for the metric columns of ``compute_cognostics``.
+
+    Types come from ``infer_meta_dict`` (``NumberMeta`` for numeric
+    metrics, ``DateMeta``/``TimeMeta`` for first/last date), and each meta
+    gets a description of the metric.
+
+    Parameters
+    ----------
+    cogs : pd.DataFrame
+        Output of ``compute_cognostics``.
+    value : str
+        Value column the metrics summarize.
+    date : str, optional
+        Date column passed to ``compute_cognostics``.
+    prefix : str, optional
+        Prefix passed to ``compute_cognostics``. Defaults to ``value``.
+
+    Returns
+    -------
+    dict
+        Metric column name -> MetaVariable. Grouping columns are not
+        included.
+    """
+    if prefix is None:
+        prefix = value
+
+    names = {_metric_column(metric, prefix, date): metric for metric in METRICS}
+
+    columns = [col for col in cogs.columns if col in names]
+    metas = infer_meta_dict(cogs, columns)
+    unit = "day" if date else "row"
+    for col, meta in metas.items():
+        meta.desc = METRICS[names[col]].format(value=value, date=date, unit=unit)
+    return metas
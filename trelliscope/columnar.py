@@ -0,0 +1,220 @@
+"""
+Columnar cognostics store (Parquet or Arrow IPC).
+
+Writes the same cognostics as metaData.json in a typed, columnar file next
+to displayInfo.json. Numbers, dates and strings keep their dtypes, and
+factor variables are stored as dictionary-encoded categoricals whose
+categories are the factor levels. Requires the optional ``pyarrow``
+dependency (``pip install py-trelliscope[arrow]``).
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Store file name for each supported format
+COG_STORE_FILES = {
+    "arrow": "cogData.arrow",
+    "parquet": "cogData.parquet",
+}
+
+
+def _require_pyarrow():
+    """Import pyarrow, raising a helpful ImportError if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Columnar cognostics require the pyarrow package. "
+            "Install with: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def build_cog_frame(display) -> pd.DataFrame:
+    """
+    Build a typed DataFrame of the Display's cognostics.
+
+    Contains one column per meta variable present in the data, followed by
+    ``panelKey`` and the panel reference column, in the same order as
+    metaData.json.
+
+    Parameters
+    ----------
+    display : Display
+        Display object with data.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cognostics with native dtypes. Factor columns are categoricals
+        whose categories start with the factor levels.
+    """
+    from trelliscope.serialization import _panel_refs
+
+    data = display.data
+    columns = {}
+
+    for varname, meta in display._meta_vars.items():
+        if varname not in data.columns:
+            continue
+        series = data[varname]
+        if meta.type == "factor":
+            columns[varname] = _factor_categorical(series, meta)
+        else:
+            columns[varname] = series.to_numpy()
+
+    panel_keys = [str(idx) for idx in data.index]
+    columns["panelKey"] = panel_keys
+    if display.panel_column is not None:
+        columns[display.panel_column] = _panel_refs(display, panel_keys, "panels/")
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(data)))
+
+
+def _factor_categorical(series: pd.Series, meta) -> pd.Categorical:
+    """
+    Encode a factor column as a categorical over its levels.
+
+    Follows the same rules as the JSON serializer: numeric values are
+    0-based level codes and other values are matched to levels by their
+    string form. Values outside the levels are kept as extra categories
+    after the levels.
+    """
+    levels = list(dict.fromkeys(getattr(meta, 'levels', None) or []))
+    missing = series.isna().to_numpy()
+
+    if (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        and not pd.api.types.is_bool_dtype(series.dtype)
+    ):
+        codes = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = ~missing & (codes >= 0) & (codes < len(levels))
+        values = np.full(len(series), None, dtype=object)
+        values[valid] = np.asarray(levels, dtype=object)[codes[valid].astype(int)]
+        # Out-of-range codes keep their numeric value as a category
+        extra = ~missing & ~valid
+        values[extra] = [str(int(v)) for v in codes[extra]]
+    else:
+        values = series.astype(object).to_numpy()
+        values[~missing] = [str(v) for v in values[~missing]]
+        values[missing] = None
+
+    known = set(levels)
+    extras = sorted({v for v in values if v is not None and v not in known})
+    return pd.Categorical(values, categories=levels + extras)
+
+
+def write_cog_store(display, output_path: Path, format: str = "arrow") -> Path:
+    """
+    Write the Display's cognostics to a columnar file.
+
+    Parameters
+    ----------
+    display : Display
+        Display object to serialize.
+    output_path : Path
+        Output directory (the display directory holding displayInfo.json).
+    format : {"arrow", "parquet"}, default="arrow"
+        Arrow IPC (uncompressed, memory-mappable) or Parquet (compressed).
+
+    Returns
+    -------
+    Path
+        Path to the written cogData.arrow or cogData.parquet file.
+
+    Raises
+    ------
+    ValueError
+        If format is not supported.
+    ImportError
+        If pyarrow is not installed.
+    """
+    if format not in COG_STORE_FILES:
+        raise ValueError(
+            f"Invalid cognostics format '{format}'. "
+            f"Must be one of: {sorted(COG_STORE_FILES)}"
+        )
+    pa = _require_pyarrow()
+
+    table = pa.Table.from_pandas(build_cog_frame(display), preserve_index=False)
+    store_path = Path(output_path) / COG_STORE_FILES[format]
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, store_path)
+    else:
+        import pyarrow.ipc as ipc
+        with pa.OSFile(str(store_path), "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    return store_path
+
+
+def find_cog_store(display_dir: Path) -> Optional[Path]:
+    """
+    Find a columnar cognostics file in a display directory.
+
+    Arrow IPC is preferred over Parquet when both exist.
+
+    Parameters
+    ----------
+    display_dir : Path
+        Directory containing displayInfo.json.
+
+    Returns
+    -------
+    Path or None
+        Path to the store, or None if there is none.
+    """
+    for format in ("arrow", "parquet"):
+        path = Path(display_dir) / COG_STORE_FILES[format]
+        if path.exists():
+            return path
+    return None
+
+
+def read_cog_store(path: Path, memory_map: bool = True) -> pd.DataFrame:
+    """
+    Read a columnar cognostics file written by ``write_cog_store``.
+
+    Arrow IPC files are memory-mapped: numeric and datetime columns without
+    missing values become read-only views of the mapped file rather than
+    copies, so opening a large display costs little more than its string
+    and categorical columns. Parquet files are decoded into memory.
+
+    Parameters
+    ----------
+    path : Path
+        Path to cogData.arrow or cogData.parquet.
+    memory_map : bool, default=True
+        Memory-map Arrow IPC files instead of reading them into memory.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cognostics with their stored dtypes. Columns backed by the mapped
+        file are read-only.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    path = Path(path)
+
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.read_table(path).to_pandas()
+
+    import pyarrow.ipc as ipc
+    source = pa.memory_map(str(path), "r") if memory_map else str(path)
+    table = ipc.open_file(source).read_all()
+    # split_blocks keeps each column in its own block so primitive columns
+    # are not consolidated (copied) into 2D blocks
+    return table.to_pandas(split_blocks=True)
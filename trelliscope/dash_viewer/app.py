@@ -9,6 +9,7 @@ import threading
 import time
 
 import dash
+import numpy as np
 from dash import html, dcc, Input, Output, State, ALL, MATCH, ctx
 import dash_bootstrap_components as dbc
 
@@ -19,7 +20,7 @@ from trelliscope.dash_viewer.components.sorts import create_sort_panel, update_s
 from trelliscope.dash_viewer.components.controls import create_control_bar, create_header
 from trelliscope.dash_viewer.components.layout import create_panel_grid
 from trelliscope.dash_viewer.components.views import create_views_panel, update_views_panel_state
-from trelliscope.dash_viewer.components.search import create_search_panel, search_dataframe, get_searchable_columns
+from trelliscope.dash_viewer.components.search import create_search_panel, search_mask, get_searchable_columns
 from trelliscope.dash_viewer.components.panel_detail import create_panel_detail_modal
 from trelliscope.dash_viewer.components.layout_controls import create_layout_controls, get_layout_from_state
 from trelliscope.dash_viewer.components.label_config import create_label_config_panel, get_labelable_metas
@@ -33,6 +34,8 @@ from trelliscope.dash_viewer.components.export import create_export_panel, prepa
 from trelliscope.dash_viewer.components.notifications import create_toast_container, create_success_toast, create_error_toast, create_info_toast
 from trelliscope.dash_viewer.components.help import create_help_modal, create_help_button
 from trelliscope.dash_viewer.views_manager import ViewsManager
+from trelliscope.dash_viewer.performance import LRUCache
+from trelliscope.dash_viewer.thumbnails import ThumbnailStore, register_thumbnail_route
 
 
 def _convert_paths_to_strings(data_dict):
@@ -101,6 +104,21 @@ class DashViewer:
 
         # Initialize state
         self.state = DisplayState(display_info=self.display_info)
+        self.state.build_index(self.cog_data)
+
+        # Ordered row positions of recent results, by result key. The
+        # browser only holds a handle ({key, count, search}); page and
+        # detail rows are resolved here.
+        self._results = LRUCache(max_size=20)
+
+        # Grid-sized thumbnails of image panels, served by URL
+        self.thumbnails = ThumbnailStore(
+            self.display_data['panel_base_path'],
+            size=(
+                self.display_info.get('width') or 500,
+                self.display_info.get('height') or 500,
+            ),
+        )
 
         # Initialize views manager
         self.views_manager = ViewsManager(self.display_path)
@@ -141,6 +159,9 @@ class DashViewer:
                 suppress_callback_exceptions=True
             )
 
+        # Serve panel thumbnails with HTTP caching
+        register_thumbnail_route(app.server, self.thumbnails)
+
         # Register callbacks FIRST (before setting layout)
         # This ensures callbacks are available when layout is validated
         self._register_callbacks(app)
@@ -150,6 +171,57 @@ class DashViewer:
 
         return app
 
+    def _query_positions(self, search_query: Optional[str] = None):
+        """
+        Filter, search and sort the cognostics data.
+
+        Returns
+        -------
+        tuple
+            (positions, total_before_search): row positions in display
+            order, and the number of rows passing the filters alone
+        """
+        mask = self.state.filter_mask(self.cog_data)
+        total_before_search = int(mask.sum())
+
+        # Apply search (on top of filters), only over the filtered rows
+        if search_query and search_query.strip():
+            searchable_cols = get_searchable_columns(self.display_info)
+            rows = np.flatnonzero(mask)
+            found = search_mask(self.cog_data.iloc[rows], search_query, searchable_cols)
+            mask = np.zeros(len(self.cog_data), dtype=bool)
+            mask[rows[found]] = True
+
+        # Apply sorts (cached permutation, no sorting on page flips)
+        positions = self.state.ordered_positions(self.cog_data, mask)
+        return positions, total_before_search
+
+    def _result_handle(
+        self,
+        positions: np.ndarray,
+        search_query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cache a result's positions and return its compact handle."""
+        key = self.state.result_key(search_query)
+        self._results.set(key, positions)
+        return {'key': key, 'count': len(positions), 'search': search_query or ''}
+
+    def _resolve_positions(self, handle: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Row positions of a result handle, recomputed if evicted."""
+        if handle:
+            positions = self._results.get(handle.get('key'))
+            if positions is not None:
+                return positions
+            search_query = handle.get('search')
+        else:
+            search_query = None
+        positions, _ = self._query_positions(search_query)
+        return positions
+
+    def _rows(self, positions: np.ndarray):
+        """Cognostics rows at the given positions."""
+        return self.cog_data.iloc[positions]
+
     def _create_layout(self) -> html.Div:
         """Create main application layout."""
         # Get filterable and sortable metas
@@ -157,20 +229,16 @@ class DashViewer:
         sortable_metas = self.loader.get_sortable_metas()
 
         # Create initial panel grid
-        filtered_data = self.state.filter_data(self.cog_data)
-        sorted_data = self.state.sort_data(filtered_data)
-        page_data = self.state.get_page_data(sorted_data)
+        positions, _ = self._query_positions()
+        page_data = self._rows(positions[self.state.page_slice()])
 
-        total_panels = len(filtered_data)
+        total_panels = len(positions)
         total_pages = self.state.get_total_pages(total_panels)
 
-        # Convert DataFrame to dict, ensuring Path objects are converted to strings
-        filtered_data_dict = _convert_paths_to_strings(filtered_data.to_dict('records'))
-        
         return html.Div(
             [
-                # Store components for state
-                dcc.Store(id='filtered-data-store', data=filtered_data_dict),
+                # Store components for state (result handle, not rows)
+                dcc.Store(id='filtered-data-store', data=self._result_handle(positions)),
                 dcc.Store(id='current-page-store', data=self.state.current_page),
                 dcc.Store(id='active-sorts-store', data=self.state.active_sorts),
                 dcc.Store(id='current-panel-index', storage_type='memory'),
@@ -191,7 +259,11 @@ class DashViewer:
                                         self.display_info.get('metas', []),
                                         self.state.active_labels
                                     ),
-                                    create_filter_panel(filterable_metas, self.cog_data),
+                                    create_filter_panel(
+                                        filterable_metas,
+                                        self.cog_data,
+                                        self.display_info.get('cogDistns'),
+                                    ),
                                     create_sort_panel(sortable_metas, self.state.active_sorts),
                                     create_views_panel(self.views_manager.get_views()),
                                     create_export_panel()
@@ -230,7 +302,8 @@ class DashViewer:
                                             ncol=self.state.ncol,
                                             nrow=self.state.nrow,
                                             active_labels=self.state.active_labels,
-                                            display_info=self.display_info
+                                            display_info=self.display_info,
+                                            image_src=self.thumbnails.url
                                         ),
                                         id='panel-grid-container'
                                     )
@@ -333,8 +406,8 @@ class DashViewer:
                     print(f"[DEBUG] Previous page clicked. New page: {self.state.current_page}")
             elif triggered_id == 'next-page-btn':
                 # Calculate total pages before updating (need filtered data)
-                filtered_data_temp = self.state.filter_data(self.cog_data)
-                total_pages = self.state.get_total_pages(len(filtered_data_temp))
+                filtered_count = int(self.state.filter_mask(self.cog_data).sum())
+                total_pages = self.state.get_total_pages(filtered_count)
                 self.state.next_page(total_pages)
                 if self.debug:
                     print(f"[DEBUG] Next page clicked. New page: {self.state.current_page}, Total pages: {total_pages}")
@@ -381,29 +454,19 @@ class DashViewer:
                 elif triggered_id['type'] == 'sort-remove':
                     self.state.remove_sort(triggered_id['varname'])
 
-            # Apply filters
-            filtered_data = self.state.filter_data(self.cog_data)
-
-            # Apply search (on top of filters)
-            searchable_cols = get_searchable_columns(self.display_info)
-            searched_data, match_count, total_before_search = search_dataframe(
-                filtered_data,
-                search_query if search_query else "",
-                searchable_cols
-            )
+            # Apply filters, search and sorts
+            positions, total_before_search = self._query_positions(search_query)
+            match_count = len(positions)
 
             # Format search summary
             from trelliscope.dash_viewer.components.search import format_search_summary
             search_summary = format_search_summary(match_count, total_before_search, search_query if search_query else "")
 
-            # Apply sorts
-            sorted_data = self.state.sort_data(searched_data)
-
             # Get page data
-            page_data = self.state.get_page_data(sorted_data)
+            page_data = self._rows(positions[self.state.page_slice()])
 
             # Calculate totals
-            total_panels = len(searched_data)
+            total_panels = len(positions)
             total_pages = self.state.get_total_pages(total_panels)
 
             # Calculate panel range
@@ -427,7 +490,8 @@ class DashViewer:
                 ncol=self.state.ncol,
                 nrow=self.state.nrow,
                 active_labels=self.state.active_labels,
-                display_info=self.display_info
+                display_info=self.display_info,
+                image_src=self.thumbnails.url
             )
 
             # Update panel count text
@@ -448,7 +512,7 @@ class DashViewer:
             )
 
             return (
-                _convert_paths_to_strings(searched_data.to_dict('records')),
+                self._result_handle(positions, search_query),
                 panel_grid,
                 panel_count_text,
                 page_info_text,
@@ -684,12 +748,9 @@ class DashViewer:
             if triggered_id in ['panel-detail-close', 'panel-detail-close-footer']:
                 return False, "", "", "", True, True, None
 
-            # Convert filtered data to DataFrame
-            if not filtered_data:
-                raise dash.exceptions.PreventUpdate
-
-            df = pd.DataFrame(filtered_data)
-            total_panels = len(df)
+            # Resolve the current result server-side
+            positions = self._resolve_positions(filtered_data)
+            total_panels = len(positions)
 
             if total_panels == 0:
                 raise dash.exceptions.PreventUpdate
@@ -707,15 +768,15 @@ class DashViewer:
                 
                 # Find which panel was clicked
                 clicked_index = triggered_id['index']
-                # Find this index in filtered data
-                panel_indices = df.index.tolist()
-                if clicked_index in panel_indices:
-                    panel_index = df.index.get_loc(clicked_index)
-                else:
-                    # Index not found, try to find by position
-                    # The triggered_id['index'] should match a DataFrame index
-                    # If not found, prevent update
+                # Find this index in the current result
+                if clicked_index not in self.cog_data.index:
                     raise dash.exceptions.PreventUpdate
+                row_position = self.cog_data.index.get_loc(clicked_index)
+                matches = np.flatnonzero(positions == row_position)
+                if len(matches) == 0:
+                    # Panel not in the current result
+                    raise dash.exceptions.PreventUpdate
+                panel_index = int(matches[0])
 
             elif triggered_id == 'panel-detail-prev' and current_index is not None:
                 # Navigate to previous
@@ -731,7 +792,7 @@ class DashViewer:
                 panel_index = 0
 
             # Get panel data
-            panel_row = df.iloc[panel_index]
+            panel_row = self.cog_data.iloc[positions[panel_index]]
 
             # Get panel path and type
             panel_path = panel_row.get('_panel_full_path')
@@ -745,7 +806,10 @@ class DashViewer:
             panel_content = format_panel_content(Path(panel_path), panel_type)
 
             # Format metadata
-            metadata_table = format_metadata_table(panel_row.to_dict(), self.display_info)
+            metadata_table = format_metadata_table(
+                _convert_paths_to_strings([panel_row.to_dict()])[0],
+                self.display_info
+            )
 
             # Get navigation info
             title, prev_disabled, next_disabled = get_panel_navigation_info(
@@ -896,21 +960,21 @@ class DashViewer:
             self.state.active_labels = selected_labels
 
             # Re-render grid with new labels
-            import pandas as pd
-            df = pd.DataFrame(filtered_data) if filtered_data else pd.DataFrame()
+            positions = self._resolve_positions(filtered_data)
 
-            if df.empty:
+            if len(positions) == 0:
                 return html.Div("No panels to display", className="text-center mt-5")
 
             # Apply pagination
-            page_data = self.state.get_page_data(df)
+            page_data = self._rows(positions[self.state.page_slice()])
 
             return create_panel_grid(
                 page_data,
                 ncol or self.state.ncol,
                 nrow or self.state.nrow,
                 selected_labels,
-                self.display_info
+                self.display_info,
+                image_src=self.thumbnails.url
             )
 
         # Help Modal Callbacks
@@ -1069,9 +1133,8 @@ class DashViewer:
                 )
             elif action == 'last_page':
                 # Go to last page
-                import pandas as pd
-                df = pd.DataFrame(filtered_data) if filtered_data else pd.DataFrame()
-                total_pages = self.state.get_total_pages(len(df))
+                total_count = (filtered_data or {}).get('count', 0)
+                total_pages = self.state.get_total_pages(total_count)
                 new_page = total_pages if total_pages > 0 else 1
                 self.state.current_page = new_page
                 return (
@@ -1141,8 +1204,7 @@ class DashViewer:
         def export_csv(n_clicks, filtered_data):
             """Export filtered data as CSV."""
             if n_clicks and filtered_data:
-                import pandas as pd
-                df = pd.DataFrame(filtered_data)
+                df = self._rows(self._resolve_positions(filtered_data))
                 csv_content = prepare_csv_export(df, self.display_info, include_internal=False)
                 filename = generate_export_filename(self.display_name, 'data', 'csv')
                 return dict(content=csv_content, filename=filename)
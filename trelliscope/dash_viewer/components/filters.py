@@ -2,7 +2,7 @@
 Filter components for different meta types.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 
 from dash import html, dcc
@@ -11,7 +11,8 @@ import dash_bootstrap_components as dbc
 
 def create_filter_panel(
     filterable_metas: List[Dict[str, Any]],
-    cog_data: pd.DataFrame
+    cog_data: pd.DataFrame,
+    cog_distns: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> html.Div:
     """
     Create filter panel with all filter controls.
@@ -22,6 +23,9 @@ def create_filter_panel(
         List of meta dictionaries for filterable variables
     cog_data : pd.DataFrame
         Cognostics data for determining filter ranges
+    cog_distns : dict, optional
+        Precomputed distributions (displayInfo ``cogDistns``). Filters
+        with a distribution are built from it instead of scanning cog_data.
 
     Returns
     -------
@@ -71,7 +75,9 @@ def create_filter_panel(
         import sys
         print(f"[DEBUG FILTERS] >>> About to call create_filter_component for {varname} (type: {meta_type})", file=sys.stderr)
         try:
-            filter_comp = create_filter_component(meta, data)
+            filter_comp = create_filter_component(
+                meta, data, (cog_distns or {}).get(varname)
+            )
             print(f"[DEBUG FILTERS] >>> create_filter_component returned for {varname}: {type(filter_comp)}", file=sys.stderr)
         except Exception as e:
             print(f"[DEBUG FILTERS] >>> ERROR creating filter component for {varname}: {e}", file=sys.stderr)
@@ -152,7 +158,8 @@ def create_filter_panel(
 
 def create_filter_component(
     meta: Dict[str, Any],
-    data: pd.Series
+    data: pd.Series,
+    distn: Optional[Dict[str, Any]] = None
 ) -> Any:
     """
     Create filter component based on meta type.
@@ -163,6 +170,9 @@ def create_filter_component(
         Meta configuration
     data : pd.Series
         Data for this variable
+    distn : dict, optional
+        Precomputed distribution for this variable (a ``cogDistns``
+        entry). Used instead of data when given.
 
     Returns
     -------
@@ -172,26 +182,33 @@ def create_filter_component(
     varname = meta['varname']
     meta_type = meta.get('type', 'string')
 
+    if distn is not None and distn.get('type') != meta_type:
+        distn = None
+
     if meta_type == 'factor':
-        return create_factor_filter(meta, data)
+        return create_factor_filter(meta, data, distn)
 
     elif meta_type in ['number', 'currency']:
-        return create_number_filter(meta, data)
+        return create_number_filter(meta, data, distn)
 
     elif meta_type == 'date':
-        return create_date_filter(meta, data)
+        return create_date_filter(meta, data, distn)
 
     elif meta_type == 'time':
-        return create_datetime_filter(meta, data)
+        return create_datetime_filter(meta, data, distn)
 
     elif meta_type == 'string':
-        return create_string_filter(meta, data)
+        return create_string_filter(meta, data, distn=distn)
 
     else:
         return None
 
 
-def create_factor_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
+def create_factor_filter(
+    meta: Dict[str, Any],
+    data: pd.Series,
+    distn: Optional[Dict[str, Any]] = None
+) -> dcc.Dropdown:
     """
     Create multi-select dropdown for factor filtering.
 
@@ -201,6 +218,8 @@ def create_factor_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
         Meta configuration
     data : pd.Series
         Factor data (can be indices or labels)
+    distn : dict, optional
+        Precomputed level counts (``cogDistns`` entry)
 
     Returns
     -------
@@ -208,14 +227,21 @@ def create_factor_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
         Multi-select dropdown component
     """
     varname = meta['varname']
-    
-    # Get value counts from the data
-    # Note: If data comes from label column, it already has string values
-    # If data comes from index column, it has 0-based numeric indices
-    value_counts = data.value_counts()
-    
-    # If data contains numeric indices (0-based), map them to level strings
     levels = meta.get('levels', [])
+
+    if distn and distn.get('dist') is not None:
+        # Level counts precomputed at build time; drop unused levels
+        value_counts = pd.Series(
+            {level: count for level, count in distn['dist'].items() if count},
+            dtype=int,
+        )
+    else:
+        # Get value counts from the data
+        # Note: If data comes from label column, it already has string values
+        # If data comes from index column, it has 0-based numeric indices
+        value_counts = data.value_counts()
+
+    # If data contains numeric indices (0-based), map them to level strings
     if levels and len(value_counts) > 0:
         sample_val = value_counts.index[0]
         # Check if values are numeric indices (not already strings)
@@ -256,7 +282,11 @@ def create_factor_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
     )
 
 
-def create_number_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.RangeSlider:
+def create_number_filter(
+    meta: Dict[str, Any],
+    data: pd.Series,
+    distn: Optional[Dict[str, Any]] = None
+) -> dcc.RangeSlider:
     """
     Create range slider for number/currency filtering.
 
@@ -266,6 +296,8 @@ def create_number_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.RangeSlid
         Meta configuration
     data : pd.Series
         Numeric data
+    distn : dict, optional
+        Precomputed range and histogram (``cogDistns`` entry)
 
     Returns
     -------
@@ -274,14 +306,19 @@ def create_number_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.RangeSlid
     """
     varname = meta['varname']
 
-    # Remove NaN values
-    clean_data = data.dropna()
+    if distn and 'range' in distn:
+        if distn['range'] is None:
+            return html.Div("No data available")
+        min_val, max_val = (float(v) for v in distn['range'])
+    else:
+        # Remove NaN values
+        clean_data = data.dropna()
 
-    if clean_data.empty:
-        return html.Div("No data available")
+        if clean_data.empty:
+            return html.Div("No data available")
 
-    min_val = float(clean_data.min())
-    max_val = float(clean_data.max())
+        min_val = float(clean_data.min())
+        max_val = float(clean_data.max())
 
     if min_val == max_val:
         return html.Div(f"Value: {min_val}")
@@ -315,7 +352,11 @@ def create_number_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.RangeSlid
     ])
 
 
-def create_date_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePickerRange:
+def create_date_filter(
+    meta: Dict[str, Any],
+    data: pd.Series,
+    distn: Optional[Dict[str, Any]] = None
+) -> dcc.DatePickerRange:
     """
     Create date range picker for date filtering.
 
@@ -325,6 +366,8 @@ def create_date_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePickerR
         Meta configuration
     data : pd.Series
         Date data
+    distn : dict, optional
+        Precomputed date range (``cogDistns`` entry)
 
     Returns
     -------
@@ -333,14 +376,19 @@ def create_date_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePickerR
     """
     varname = meta['varname']
 
-    # Convert to datetime
-    date_data = pd.to_datetime(data, errors='coerce').dropna()
+    if distn and 'range' in distn:
+        if distn['range'] is None:
+            return html.Div("No date data available")
+        min_date, max_date = (pd.Timestamp(v) for v in distn['range'])
+    else:
+        # Convert to datetime
+        date_data = pd.to_datetime(data, errors='coerce').dropna()
 
-    if date_data.empty:
-        return html.Div("No date data available")
+        if date_data.empty:
+            return html.Div("No date data available")
 
-    min_date = date_data.min()
-    max_date = date_data.max()
+        min_date = date_data.min()
+        max_date = date_data.max()
 
     return dcc.DatePickerRange(
         id={'type': 'filter', 'varname': varname},
@@ -353,7 +401,11 @@ def create_date_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePickerR
     )
 
 
-def create_datetime_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePickerRange:
+def create_datetime_filter(
+    meta: Dict[str, Any],
+    data: pd.Series,
+    distn: Optional[Dict[str, Any]] = None
+) -> dcc.DatePickerRange:
     """
     Create datetime range picker for time filtering.
 
@@ -363,6 +415,8 @@ def create_datetime_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePic
         Meta configuration
     data : pd.Series
         Datetime data
+    distn : dict, optional
+        Precomputed time range (``cogDistns`` entry)
 
     Returns
     -------
@@ -371,12 +425,21 @@ def create_datetime_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.DatePic
     """
     # For now, use same as date filter
     # TODO: Add time selection component
-    return create_date_filter(meta, data)
+    return create_date_filter(meta, data, distn)
 
 
-def create_string_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
+def create_string_filter(
+    meta: Dict[str, Any],
+    data: pd.Series,
+    max_options: int = 100,
+    distn: Optional[Dict[str, Any]] = None
+) -> Any:
     """
-    Create multi-select dropdown for string filtering.
+    Create multi-select dropdown or text search for string filtering.
+
+    Columns with more than ``max_options`` distinct values (IDs, free
+    text) get a text input instead of a dropdown; its value filters rows
+    by case-insensitive substring match.
 
     Parameters
     ----------
@@ -384,31 +447,42 @@ def create_string_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
         Meta configuration
     data : pd.Series
         String data
+    max_options : int, default=100
+        Largest number of distinct values shown as dropdown options
+    distn : dict, optional
+        Precomputed distinct count and top value counts (``cogDistns``
+        entry)
 
     Returns
     -------
-    dcc.Dropdown
-        Multi-select dropdown component
+    dcc.Dropdown or dcc.Input
+        Multi-select dropdown, or text search input for high-cardinality
+        columns
     """
     import sys
     varname = meta['varname']
     
     print(f"[DEBUG STRING FILTER] Creating string filter for {varname}", file=sys.stderr)
     print(f"[DEBUG STRING FILTER] Data type: {type(data)}, length: {len(data)}", file=sys.stderr)
-    print(f"[DEBUG STRING FILTER] Sample values: {data.head().tolist()}", file=sys.stderr)
-    print(f"[DEBUG STRING FILTER] Unique values: {data.unique()}", file=sys.stderr)
 
-    # Get unique values with counts
-    value_counts = data.value_counts()
-    print(f"[DEBUG STRING FILTER] Value counts: {value_counts.to_dict()}", file=sys.stderr)
-    
-    # Create options with counts (limit to reasonable number for dropdown)
-    # If too many unique values, show top N
-    max_options = 100
-    if len(value_counts) > max_options:
-        # Show top N most common values
-        value_counts = value_counts.head(max_options)
-    
+    if distn and distn.get('dist') is not None:
+        # Top value counts precomputed at build time
+        n_distinct = distn.get('n_distinct', len(distn['dist']))
+        value_counts = pd.Series(distn['dist'], dtype=int)
+    else:
+        # Get unique values with counts
+        value_counts = data.value_counts()
+        n_distinct = len(value_counts)
+
+    if n_distinct > max_options:
+        return dcc.Input(
+            id={'type': 'filter', 'varname': varname},
+            type='text',
+            debounce=True,
+            placeholder=f"Search {meta.get('label', varname)}...",
+            style={'fontSize': '13px', 'width': '100%'}
+        )
+
     options = [
         {
             'label': f"{value} ({count})",
@@ -417,9 +491,7 @@ def create_string_filter(meta: Dict[str, Any], data: pd.Series) -> dcc.Dropdown:
         for value, count in value_counts.items()
         if pd.notna(value)
     ]
-    
-    print(f"[DEBUG STRING FILTER] Created {len(options)} options: {options}", file=sys.stderr)
-    
+
     # Sort by label
     options.sort(key=lambda x: x['label'])
 
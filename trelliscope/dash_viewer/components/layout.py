@@ -2,7 +2,7 @@
 Grid layout components for panel display.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 import pandas as pd
 
@@ -17,7 +17,8 @@ def create_panel_grid(
     active_labels: List[str],
     display_info: Dict[str, Any],
     panel_width: Optional[int] = None,
-    panel_height: Optional[int] = None
+    panel_height: Optional[int] = None,
+    image_src: Optional[Callable[[Path], str]] = None
 ) -> html.Div:
     """
     Create grid of panels with labels.
@@ -38,6 +39,9 @@ def create_panel_grid(
         Panel width in pixels
     panel_height : int, optional
         Panel height in pixels
+    image_src : callable, optional
+        Maps an image panel file to the URL it is loaded from (e.g.
+        ``ThumbnailStore.url``). Images are embedded as base64 if not given.
 
     Returns
     -------
@@ -103,7 +107,8 @@ def create_panel_grid(
                 Path(panel_path),
                 width=panel_width,
                 height=panel_height,
-                panel_key=panel_key
+                panel_key=panel_key,
+                src=image_src(Path(panel_path)) if image_src else None
             )
         elif panel_type == 'plotly':
             panel_component = renderer.render_plotly_panel(
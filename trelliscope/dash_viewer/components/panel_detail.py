@@ -127,15 +127,13 @@ def format_panel_content(panel_path: Path, panel_type: str) -> html.Div:
             return html.Div(f"Error loading image: {e}", style={'color': 'red'})
 
     elif panel_type == 'plotly':
-        # Extract Plotly figure from HTML and render as dcc.Graph
+        # Load Plotly figure of the HTML file and render as dcc.Graph
         try:
             from trelliscope.dash_viewer.components.panels import PanelRenderer
-            
-            # Extract figure from HTML file
-            fig = PanelRenderer.extract_plotly_figure(panel_path)
-            
-            # Update figure size for modal display
-            fig.update_layout(
+
+            # Resize figure for modal display
+            fig = PanelRenderer.load_plotly_figure(
+                panel_path,
                 height=600,
                 width=None,  # Let it be responsive
                 margin=dict(l=50, r=50, t=50, b=50)
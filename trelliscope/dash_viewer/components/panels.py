@@ -3,7 +3,7 @@ Panel rendering components for Dash viewer.
 """
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 import base64
 import re
 import json
@@ -11,6 +11,15 @@ import json
 from dash import html, dcc
 import plotly.graph_objects as go
 
+from trelliscope.dash_viewer.performance import LRUCache
+from trelliscope.panels.plotly_adapter import figure_sidecar_path
+
+# Number of parsed Plotly figures kept in memory
+FIGURE_CACHE_SIZE = 256
+
+# Parsed figure dicts, keyed by panel file path, mtime and size
+_figure_cache = LRUCache(max_size=FIGURE_CACHE_SIZE)
+
 
 class PanelRenderer:
     """
@@ -22,7 +31,8 @@ class PanelRenderer:
         panel_path: Path,
         width: Optional[int] = None,
         height: Optional[int] = None,
-        panel_key: Optional[str] = None
+        panel_key: Optional[str] = None,
+        src: Optional[str] = None
     ) -> html.Img:
         """
         Render image panel (PNG, JPEG, etc.).
@@ -37,6 +47,9 @@ class PanelRenderer:
             Image height in pixels
         panel_key : str, optional
             Panel key for component ID
+        src : str, optional
+            URL to load the image from (e.g. a thumbnail route). If not
+            given, the file is embedded as a base64 data URI.
 
         Returns
         -------
@@ -58,26 +71,27 @@ class PanelRenderer:
                 }
             )
 
-        # Read image and encode as base64
-        with open(panel_path, 'rb') as f:
-            image_bytes = f.read()
+        if src is None:
+            # Read image and encode as base64
+            with open(panel_path, 'rb') as f:
+                image_bytes = f.read()
 
-        encoded = base64.b64encode(image_bytes).decode('utf-8')
+            encoded = base64.b64encode(image_bytes).decode('utf-8')
 
-        # Detect image type
-        ext = panel_path.suffix.lower()
-        if ext == '.png':
-            mime_type = 'image/png'
-        elif ext in ['.jpg', '.jpeg']:
-            mime_type = 'image/jpeg'
-        elif ext == '.gif':
-            mime_type = 'image/gif'
-        elif ext == '.svg':
-            mime_type = 'image/svg+xml'
-        else:
-            mime_type = 'image/png'
+            # Detect image type
+            ext = panel_path.suffix.lower()
+            if ext == '.png':
+                mime_type = 'image/png'
+            elif ext in ['.jpg', '.jpeg']:
+                mime_type = 'image/jpeg'
+            elif ext == '.gif':
+                mime_type = 'image/gif'
+            elif ext == '.svg':
+                mime_type = 'image/svg+xml'
+            else:
+                mime_type = 'image/png'
 
-        src = f'data:{mime_type};base64,{encoded}'
+            src = f'data:{mime_type};base64,{encoded}'
 
         style = {
             'width': '100%',
@@ -108,7 +122,8 @@ class PanelRenderer:
         """
         Render Plotly HTML panel as native Dash Graph.
 
-        Extracts Plotly figure from HTML file and renders natively.
+        Loads the Plotly figure of the HTML file (see
+        ``load_plotly_figure``) and renders it natively.
 
         Parameters
         ----------
@@ -142,16 +157,13 @@ class PanelRenderer:
             )
 
         try:
-            fig = PanelRenderer.extract_plotly_figure(panel_path)
-
             # Update figure size if specified
-            if width or height:
-                update_dict = {}
-                if width:
-                    update_dict['width'] = width
-                if height:
-                    update_dict['height'] = height
-                fig.update_layout(**update_dict)
+            update_dict = {}
+            if width:
+                update_dict['width'] = width
+            if height:
+                update_dict['height'] = height
+            fig = PanelRenderer.load_plotly_figure(panel_path, **update_dict)
 
             component_id = f'panel-plotly-{panel_key}' if panel_key else None
 
@@ -185,6 +197,68 @@ class PanelRenderer:
                 }
             )
 
+    @staticmethod
+    def load_plotly_figure(panel_path: Path, **layout: Any) -> Dict[str, Any]:
+        """
+        Load the figure of a Plotly HTML panel, parsing it at most once.
+
+        The figure is read from the JSON sidecar written next to the panel
+        by ``PlotlyAdapter``, or extracted from the HTML if there is no
+        sidecar or it is older than the panel. Parsed figures are kept in
+        an LRU cache keyed by the panel's path, modification time and size,
+        so re-rendering a page does not read the file again, and a
+        re-written panel is picked up.
+
+        Parameters
+        ----------
+        panel_path : Path
+            Path to Plotly HTML file
+        **layout
+            Layout attributes to override in the returned figure. None
+            removes the attribute (e.g. ``width=None`` for a responsive
+            figure).
+
+        Returns
+        -------
+        dict
+            Figure specification ({'data': ..., 'layout': ...}) for
+            ``dcc.Graph``. Nested data is shared with the cache and must
+            not be modified.
+
+        Raises
+        ------
+        ValueError
+            If figure cannot be extracted from HTML
+        """
+        panel_path = Path(panel_path)
+        stat = panel_path.stat()
+        key = f"{panel_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        fig_dict = _figure_cache.get(key)
+        if fig_dict is None:
+            sidecar = figure_sidecar_path(panel_path)
+            try:
+                sidecar_mtime = sidecar.stat().st_mtime_ns
+            except OSError:
+                sidecar_mtime = None
+
+            if sidecar_mtime is not None and sidecar_mtime >= stat.st_mtime_ns:
+                with open(sidecar, 'r', encoding='utf-8') as f:
+                    fig_dict = json.load(f)
+            else:
+                fig_dict = PanelRenderer.extract_plotly_figure(
+                    panel_path
+                ).to_plotly_json()
+            _figure_cache.set(key, fig_dict)
+
+        figure_layout = dict(fig_dict.get('layout') or {})
+        for name, value in layout.items():
+            if value is None:
+                figure_layout.pop(name, None)
+            else:
+                figure_layout[name] = value
+        return {**fig_dict, 'layout': figure_layout}
+
     @staticmethod
     def extract_plotly_figure(html_path: Path) -> go.Figure:
         """
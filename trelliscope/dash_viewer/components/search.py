@@ -3,6 +3,7 @@ Global search component for searching across all metadata.
 """
 
 from typing import List, Dict, Any
+import numpy as np
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 
@@ -106,39 +107,36 @@ def create_search_panel() -> html.Div:
     )
 
 
-def search_dataframe(
+def search_mask(
     df,
     search_query: str,
     searchable_columns: List[str]
-) -> tuple:
+) -> np.ndarray:
     """
-    Search DataFrame for query string.
+    Find the rows of a DataFrame matching a query string.
 
     Parameters
     ----------
     df : pd.DataFrame
         DataFrame to search
     search_query : str
-        Search query string
+        Search query string (case-insensitive substring)
     searchable_columns : list
         List of column names to search in
 
     Returns
     -------
-    tuple
-        (filtered_df, match_count, total_count)
+    np.ndarray
+        Boolean array, True for matching rows. All True for an empty query.
     """
-    import pandas as pd
-
     if not search_query or not search_query.strip():
-        # No search query - return all data
-        return df, len(df), len(df)
+        return np.ones(len(df), dtype=bool)
 
     # Normalize search query (lowercase, strip whitespace)
     query = search_query.strip().lower()
 
     # Create boolean mask for matching rows
-    matches = pd.Series([False] * len(df), index=df.index)
+    matches = np.zeros(len(df), dtype=bool)
 
     # Search in each searchable column
     for col in searchable_columns:
@@ -147,11 +145,41 @@ def search_dataframe(
 
         # Convert column to string and search
         col_str = df[col].astype(str).str.lower()
-        col_matches = col_str.str.contains(query, case=False, na=False, regex=False)
-        matches = matches | col_matches
+        matches |= col_str.str.contains(
+            query, case=False, na=False, regex=False
+        ).to_numpy()
+
+    return matches
+
+
+def search_dataframe(
+    df,
+    search_query: str,
+    searchable_columns: List[str]
+) -> tuple:
+    """
+    Search DataFrame for query string.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to search
+    search_query : str
+        Search query string
+    searchable_columns : list
+        List of column names to search in
+
+    Returns
+    -------
+    tuple
+        (filtered_df, match_count, total_count)
+    """
+    if not search_query or not search_query.strip():
+        # No search query - return all data
+        return df, len(df), len(df)
 
     # Filter DataFrame
-    filtered_df = df[matches].copy()
+    filtered_df = df[search_mask(df, search_query, searchable_columns)].copy()
 
     return filtered_df, len(filtered_df), len(df)
 
@@ -0,0 +1,258 @@
+"""
+Bitmap filter index for the Dash viewer.
+
+Filters are evaluated against an index built from the cognostics data
+rather than by rescanning every row on each callback:
+
+- factor columns keep their integer codes plus one bitset per level,
+  built the first time the level is selected
+- number, date and time columns keep their valid values in sorted order,
+  so a range filter is two binary searches plus setting the bits of the
+  matching rows
+
+Each active filter's bitset is cached together with the filter value, so
+when one filter changes only that filter's bitset is recomputed and the
+result is a bitwise AND of the cached bitsets. Bitsets are packed eight
+rows per byte.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def scan_mask(
+    data: pd.DataFrame,
+    varname: str,
+    meta: Dict[str, Any],
+    filter_value: Any
+) -> Optional[np.ndarray]:
+    """
+    Evaluate a single filter by scanning its column.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Cognostics data
+    varname : str
+        Filtered variable
+    meta : dict
+        Meta configuration of the variable
+    filter_value : any
+        Filter value (format depends on meta type)
+
+    Returns
+    -------
+    np.ndarray or None
+        Boolean row mask, or None if the filter does not restrict rows
+        (empty or malformed value, unknown type)
+    """
+    meta_type = meta.get('type')
+
+    if meta_type == 'factor':
+        # Multi-select filter
+        if isinstance(filter_value, list) and filter_value:
+            # Use label column if available
+            label_col = f"{varname}_label"
+            col = label_col if label_col in data.columns else varname
+            return data[col].isin(filter_value).to_numpy()
+
+    elif meta_type in ['number', 'currency']:
+        # Range filter [min, max]
+        if isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
+            min_val, max_val = filter_value
+            values = data[varname]
+            return ((values >= min_val) & (values <= max_val)).to_numpy()
+
+    elif meta_type in ['date', 'time']:
+        # Date range filter
+        if isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
+            start_date, end_date = filter_value
+            if start_date and end_date:
+                values = data[varname]
+                if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+                    values = pd.to_datetime(values)
+                return (
+                    (values >= pd.to_datetime(start_date)) &
+                    (values <= pd.to_datetime(end_date))
+                ).to_numpy()
+
+    elif meta_type == 'string':
+        # Multi-select filter (same as factor)
+        if isinstance(filter_value, list) and filter_value:
+            return data[varname].astype(str).isin(filter_value).to_numpy()
+        # Text search (high-cardinality columns)
+        elif isinstance(filter_value, str) and filter_value:
+            return data[varname].astype(str).str.contains(
+                filter_value, case=False, regex=False, na=False
+            ).to_numpy()
+
+    return None
+
+
+class FilterIndex:
+    """
+    Per-column filter index over a cognostics DataFrame.
+
+    Column indexes are built on the first filter that uses them and kept
+    for the lifetime of the index; the data must not change afterwards.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Cognostics data to index
+
+    Examples
+    --------
+    >>> index = FilterIndex(cog_data)
+    >>> mask = index.mask(filters, metas)   # boolean array, one per row
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.n = len(data)
+        # varname -> ("factor", codes, uniques, level bitsets)
+        #          | ("range", order, sorted values)
+        self._columns: Dict[str, Tuple[Any, ...]] = {}
+        # varname -> (filter value key, bitset or None)
+        self._filters: Dict[str, Tuple[str, Optional[np.ndarray]]] = {}
+
+    def mask(
+        self,
+        filters: Dict[str, Any],
+        metas: Dict[str, Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Evaluate filters as a boolean row mask.
+
+        Parameters
+        ----------
+        filters : dict
+            Active filters: {varname: filter_value}
+        metas : dict
+            Meta configuration by variable name
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True for rows that pass every filter
+        """
+        result = None
+        for varname in list(self._filters):
+            if varname not in filters:
+                del self._filters[varname]
+
+        for varname, filter_value in filters.items():
+            meta = metas.get(varname)
+            if filter_value is None or not meta or varname not in self.data.columns:
+                continue
+            bits = self._filter_bits(varname, meta, filter_value)
+            if bits is None:
+                continue
+            result = bits.copy() if result is None else np.bitwise_and(result, bits, out=result)
+
+        if result is None:
+            return np.ones(self.n, dtype=bool)
+        return np.unpackbits(result, count=self.n, bitorder='little').view(bool)
+
+    def _filter_bits(
+        self,
+        varname: str,
+        meta: Dict[str, Any],
+        filter_value: Any
+    ) -> Optional[np.ndarray]:
+        """Bitset of one filter, reused while its value is unchanged."""
+        key = repr((meta.get('type'), filter_value))
+        cached = self._filters.get(varname)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        bits = self._compute_bits(varname, meta, filter_value)
+        self._filters[varname] = (key, bits)
+        return bits
+
+    def _compute_bits(
+        self,
+        varname: str,
+        meta: Dict[str, Any],
+        filter_value: Any
+    ) -> Optional[np.ndarray]:
+        """Evaluate one filter against the column index."""
+        meta_type = meta.get('type')
+
+        if meta_type == 'factor' and isinstance(filter_value, list):
+            if not filter_value:
+                return None
+            return self._factor_bits(varname, filter_value)
+
+        if (meta_type in ['number', 'currency', 'date', 'time'] and
+                isinstance(filter_value, (list, tuple)) and len(filter_value) == 2):
+            bits = self._range_bits(varname, meta_type, *filter_value)
+            if bits is not NotImplemented:
+                return bits
+
+        # No index for this filter (strings, tz-aware dates): scan once
+        mask = scan_mask(self.data, varname, meta, filter_value)
+        return None if mask is None else _pack(mask)
+
+    def _factor_bits(self, varname: str, values: list) -> np.ndarray:
+        """OR of the bitsets of the selected levels."""
+        if varname not in self._columns:
+            label_col = f"{varname}_label"
+            col = label_col if label_col in self.data.columns else varname
+            codes, uniques = pd.factorize(self.data[col], use_na_sentinel=True)
+            self._columns[varname] = ("factor", codes, pd.Index(uniques), {})
+        _, codes, uniques, level_bits = self._columns[varname]
+
+        result = np.zeros((self.n + 7) // 8, dtype=np.uint8)
+        for code in np.flatnonzero(uniques.isin(values)):
+            if code not in level_bits:
+                level_bits[code] = _pack(codes == code)
+            np.bitwise_or(result, level_bits[code], out=result)
+        return result
+
+    def _range_bits(self, varname: str, meta_type: str, low: Any, high: Any):
+        """Rows with low <= value <= high, found by binary search."""
+        is_date = meta_type in ['date', 'time']
+        if is_date:
+            if not (low and high):
+                return None
+            low = pd.to_datetime(low)
+            high = pd.to_datetime(high)
+            if low.tzinfo is not None or high.tzinfo is not None:
+                return NotImplemented
+
+        if varname not in self._columns:
+            values = self.data[varname]
+            if is_date:
+                if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+                    values = pd.to_datetime(values)
+                if getattr(values.dtype, 'tz', None) is not None:
+                    return NotImplemented
+                values = values.to_numpy(dtype='datetime64[ns]')
+                valid = ~np.isnat(values)
+            else:
+                values = pd.to_numeric(values, errors='coerce').to_numpy(
+                    dtype=float, na_value=np.nan
+                )
+                valid = ~np.isnan(values)
+            positions = np.flatnonzero(valid)
+            order = positions[np.argsort(values[positions], kind='stable')]
+            self._columns[varname] = ("range", order, values[order])
+        _, order, sorted_values = self._columns[varname]
+
+        if is_date:
+            low = np.datetime64(low.to_datetime64(), 'ns')
+            high = np.datetime64(high.to_datetime64(), 'ns')
+        start = np.searchsorted(sorted_values, low, side='left')
+        stop = np.searchsorted(sorted_values, high, side='right')
+
+        mask = np.zeros(self.n, dtype=bool)
+        mask[order[start:stop]] = True
+        return _pack(mask)
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    """Pack a boolean mask into a bitset (eight rows per byte)."""
+    return np.packbits(np.asarray(mask, dtype=bool), bitorder='little')
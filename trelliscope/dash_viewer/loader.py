@@ -2,11 +2,15 @@
 Load display configuration and data for Dash viewer.
 """
 
+import gzip
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 
+from trelliscope.meta import level_code_map
+
 
 class DisplayLoader:
     """
@@ -62,11 +66,15 @@ class DisplayLoader:
         with open(display_info_path, 'r', encoding='utf-8') as f:
             self._display_info = json.load(f)
 
-        # Extract cogData
-        if 'cogData' not in self._display_info:
-            raise ValueError("displayInfo.json missing 'cogData' field")
-
-        self._cog_data = pd.DataFrame(self._display_info['cogData'])
+        # Prefer the typed columnar store; otherwise cogData is embedded
+        # or in an external metadata file
+        self._cog_data = self._load_cog_store(display_info_path.parent)
+        if self._cog_data is None:
+            if 'cogData' in self._display_info:
+                cog_data = self._display_info['cogData']
+            else:
+                cog_data = self._load_external_cog_data(display_info_path.parent)
+            self._cog_data = pd.DataFrame(cog_data)
 
         # Convert factor indices from 1-based to 0-based for Python
         self._convert_factor_indices()
@@ -84,6 +92,80 @@ class DisplayLoader:
             'display_name': self._display_info.get('name', 'display')
         }
 
+    @staticmethod
+    def _load_cog_store(display_dir: Path) -> Optional[pd.DataFrame]:
+        """
+        Load cogData from a columnar store (cogData.arrow / cogData.parquet).
+
+        Parameters
+        ----------
+        display_dir : Path
+            Directory containing displayInfo.json
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Typed cogData, or None if there is no store or pyarrow is not
+            installed.
+        """
+        from trelliscope.columnar import find_cog_store, read_cog_store
+
+        store_path = find_cog_store(display_dir)
+        if store_path is None:
+            return None
+        try:
+            return read_cog_store(store_path)
+        except ImportError:
+            return None
+
+    def _load_external_cog_data(self, display_dir: Path) -> List[Dict[str, Any]]:
+        """
+        Load cogData stored outside displayInfo.json.
+
+        Uses the file named by ``cogDataFile`` if present, otherwise the
+        first of metaData.json, metaData.json.gz, metaData.js or
+        metaData.js.gz that exists.
+
+        Parameters
+        ----------
+        display_dir : Path
+            Directory containing displayInfo.json
+
+        Returns
+        -------
+        list of dict
+            cogData records
+
+        Raises
+        ------
+        ValueError
+            If no cogData file can be found
+        """
+        if 'cogDataFile' in self._display_info:
+            candidates = [self._display_info['cogDataFile']]
+        else:
+            candidates = [
+                "metaData.json", "metaData.json.gz", "metaData.js", "metaData.js.gz"
+            ]
+
+        for name in candidates:
+            path = display_dir / name
+            if not path.exists():
+                continue
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, 'rt', encoding='utf-8') as f:
+                if not path.name.endswith((".js", ".js.gz")):
+                    return json.load(f)
+                # window.metaData = [...];
+                text = f.read()
+            start = text.index('=') + 1
+            return json.loads(text[start:].strip().rstrip(';'))
+
+        raise ValueError(
+            "displayInfo.json missing 'cogData' field and no metadata file "
+            f"found (looked for {', '.join(candidates)})"
+        )
+
     def _find_display_info(self) -> Path:
         """
         Find displayInfo.json in display directory.
@@ -141,18 +223,89 @@ class DisplayLoader:
         # Convert indices in DataFrame
         for varname, meta in factor_metas.items():
             if varname in self._cog_data.columns:
-                # Convert from 1-based to 0-based
-                self._cog_data[varname] = self._cog_data[varname].apply(
-                    lambda x: int(x) - 1 if pd.notna(x) and isinstance(x, (int, float)) else x
-                )
+                column = self._cog_data[varname]
+                if isinstance(column.dtype, pd.CategoricalDtype):
+                    # Columnar store: categories are level strings
+                    codes = self._categorical_to_codes(column, meta.get('levels', []))
+                else:
+                    # Convert from 1-based to 0-based
+                    codes = self._to_zero_based(column)
+                self._cog_data[varname] = codes
 
                 # Map to level strings for easier filtering/display
                 levels = meta.get('levels', [])
                 if levels:
-                    self._cog_data[f"{varname}_label"] = self._cog_data[varname].apply(
-                        lambda x: levels[int(x)] if pd.notna(x) and 0 <= int(x) < len(levels) else None
+                    self._cog_data[f"{varname}_label"] = self._codes_to_labels(
+                        codes, levels
                     )
 
+    @staticmethod
+    def _to_zero_based(column: pd.Series) -> pd.Series:
+        """
+        Shift numeric factor codes down by one, leaving other values as-is.
+
+        Numeric columns are shifted in a single vectorized operation. Mixed
+        columns (codes alongside raw strings or None) are converted once per
+        distinct value and broadcast back through factorized codes.
+        """
+        dtype = column.dtype
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            return column - 1
+
+        codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        mapped = np.empty(len(uniques) + 1, dtype=object)
+        for i, value in enumerate(uniques):
+            if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+                value = int(value) - 1
+            mapped[i] = value
+        mapped[-1] = None
+        return pd.Series(mapped[codes], index=column.index, name=column.name)
+
+    @staticmethod
+    def _categorical_to_codes(column: pd.Series, levels: List[str]) -> pd.Series:
+        """
+        Convert a categorical factor column to 0-based level codes.
+
+        Categories are matched to levels by name. Values that are not a
+        level are kept as-is, like raw strings in JSON cogData.
+        """
+        level_codes = level_code_map(levels)
+        # Trailing -1 so missing values (category code -1) map to -1
+        category_codes = np.array(
+            [level_codes.get(c, -1) for c in column.cat.categories] + [-1],
+            dtype=np.int64
+        )
+
+        cat_codes = column.cat.codes.to_numpy()
+        codes = category_codes[cat_codes]
+        missing = cat_codes < 0
+        unknown = (codes < 0) & ~missing
+
+        if unknown.any():
+            values = codes.astype(object)
+            values[unknown] = column.to_numpy(dtype=object)[unknown]
+            values[missing] = None
+        elif missing.any():
+            values = np.where(missing, np.nan, codes)
+        else:
+            values = codes
+        return pd.Series(values, index=column.index, name=column.name)
+
+    @staticmethod
+    def _codes_to_labels(codes: pd.Series, levels: List[str]) -> pd.Series:
+        """
+        Look up level labels for 0-based codes in bulk.
+
+        Codes that are missing, non-numeric or out of range map to None.
+        """
+        numeric = pd.to_numeric(codes, errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnan(numeric)
+        valid[valid] = (numeric[valid] >= 0) & (numeric[valid] < len(levels))
+
+        labels = np.full(len(codes), None, dtype=object)
+        labels[valid] = np.asarray(levels, dtype=object)[numeric[valid].astype(int)]
+        return pd.Series(labels, index=codes.index)
+
     def _add_panel_paths(self, panel_base_path: Path):
         """
         Add full panel file paths to cogData DataFrame.
@@ -4,9 +4,11 @@ Performance optimization utilities for Dash viewer.
 Provides caching, debouncing, and optimization strategies for large datasets.
 """
 
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Any, Dict, List
 import pandas as pd
+import threading
 import time
 
 
@@ -231,5 +233,49 @@ class DataFrameCache:
         return key in self.cache
 
 
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+
+    Dash serves callbacks from several threads, so every access holds a
+    lock.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of entries kept.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Get cached value (None if missing) and mark it recently used."""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Set cached value, evicting the least recently used if full."""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear cache."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
 # Global DataFrame cache
 df_cache = DataFrameCache(max_size=20)
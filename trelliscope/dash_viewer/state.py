@@ -5,10 +5,15 @@ Manages filters, sorts, pagination, layout, and views.
 """
 
 from dataclasses import dataclass, field, asdict
+import hashlib
+import json
 from typing import Dict, Any, List, Tuple, Optional
+import numpy as np
 import pandas as pd
 from copy import deepcopy
 
+from trelliscope.dash_viewer.filter_index import FilterIndex, scan_mask
+
 
 @dataclass
 class DisplayState:
@@ -35,6 +40,9 @@ class DisplayState:
         List of variable names to display as labels
     panels_per_page : int
         Number of panels per page (ncol * nrow)
+    filter_index : FilterIndex, optional
+        Index used to evaluate filters on the data it was built for
+        (see ``build_index``)
     """
 
     display_info: Dict[str, Any]
@@ -45,6 +53,13 @@ class DisplayState:
     nrow: int = 2
     arrangement: str = "row"
     active_labels: List[str] = field(default_factory=list)
+    filter_index: Optional[FilterIndex] = field(
+        default=None, repr=False, compare=False
+    )
+    # (data, sort spec, permutation) of the last sort_permutation call
+    _sort_cache: Optional[Tuple[pd.DataFrame, Tuple, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize state from display info."""
@@ -83,9 +98,36 @@ class DisplayState:
         """Calculate panels per page from layout."""
         return self.ncol * self.nrow
 
-    def filter_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def build_index(self, data: pd.DataFrame) -> FilterIndex:
         """
-        Apply current filters to data.
+        Attach a filter index for the given cognostics data.
+
+        Later ``filter_mask``/``filter_data`` calls on the same frame
+        intersect cached per-filter bitsets instead of rescanning rows.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Cognostics data; must not be modified afterwards
+
+        Returns
+        -------
+        FilterIndex
+            The attached index
+        """
+        self.filter_index = FilterIndex(data)
+        return self.filter_index
+
+    def filter_mask(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate current filters as a boolean row mask.
+
+        When ``data`` is the frame the filter index was built for, the
+        mask is the intersection of cached per-filter bitsets and only
+        filters whose value changed are re-evaluated. Otherwise filters
+        are evaluated column by column against the underlying arrays, so
+        no intermediate DataFrames are built. This works directly on
+        memory-mapped columns loaded from a columnar cognostics store.
 
         Parameters
         ----------
@@ -94,16 +136,20 @@ class DisplayState:
 
         Returns
         -------
-        pd.DataFrame
-            Filtered data
+        np.ndarray
+            Boolean array, True for rows that pass every filter
         """
-        if not self.active_filters:
-            return data.copy()
+        if self.filter_index is not None and self.filter_index.data is data:
+            metas = {
+                varname: self._get_meta(varname)
+                for varname in self.active_filters
+            }
+            return self.filter_index.mask(self.active_filters, metas)
 
-        filtered = data.copy()
+        mask = np.ones(len(data), dtype=bool)
 
         for varname, filter_value in self.active_filters.items():
-            if filter_value is None or varname not in filtered.columns:
+            if filter_value is None or varname not in data.columns:
                 continue
 
             # Get meta for this variable
@@ -111,44 +157,106 @@ class DisplayState:
             if not meta:
                 continue
 
-            meta_type = meta.get('type')
-
-            # Apply filter based on type
-            if meta_type == 'factor':
-                # Multi-select filter
-                if isinstance(filter_value, list) and filter_value:
-                    # Use label column if available
-                    label_col = f"{varname}_label"
-                    col = label_col if label_col in filtered.columns else varname
-                    filtered = filtered[filtered[col].isin(filter_value)]
-
-            elif meta_type in ['number', 'currency']:
-                # Range filter [min, max]
-                if isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
-                    min_val, max_val = filter_value
-                    filtered = filtered[
-                        (filtered[varname] >= min_val) &
-                        (filtered[varname] <= max_val)
-                    ]
-
-            elif meta_type in ['date', 'time']:
-                # Date range filter
-                if isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
-                    start_date, end_date = filter_value
-                    if start_date and end_date:
-                        filtered = filtered[
-                            (pd.to_datetime(filtered[varname]) >= pd.to_datetime(start_date)) &
-                            (pd.to_datetime(filtered[varname]) <= pd.to_datetime(end_date))
-                        ]
-
-            elif meta_type == 'string':
-                # Multi-select filter (same as factor)
-                if isinstance(filter_value, list) and filter_value:
-                    filtered = filtered[
-                        filtered[varname].astype(str).isin(filter_value)
-                    ]
-
-        return filtered
+            column_mask = scan_mask(data, varname, meta, filter_value)
+            if column_mask is not None:
+                mask &= column_mask
+
+        return mask
+
+    def filter_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply current filters to data.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Input cognostics data
+
+        Returns
+        -------
+        pd.DataFrame
+            Filtered data. The input frame itself is returned when no filter
+            removes any rows, so callers must not modify the result in place.
+        """
+        if not self.active_filters:
+            return data
+
+        mask = self.filter_mask(data)
+        if mask.all():
+            return data
+        return data[mask]
+
+    def sort_permutation(self, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Get row positions of data in current sort order.
+
+        The permutation is cached per frame and sort spec, so repeated
+        calls (page flips, filter changes) do no sorting until the sorts
+        change. Ties keep their original row order.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Input data
+
+        Returns
+        -------
+        np.ndarray or None
+            Row positions in sort order, or None if no active sort applies
+            to data
+        """
+        # Apply sorts in order (first sort has highest priority)
+        spec = tuple(
+            (varname, direction) for varname, direction in self.active_sorts
+            if varname in data.columns
+        )
+        if not spec:
+            return None
+
+        cached = self._sort_cache
+        if cached is not None and cached[0] is data and cached[1] == spec:
+            return cached[2]
+
+        keys = data[[varname for varname, _ in spec]].reset_index(drop=True)
+        order = keys.sort_values(
+            by=list(keys.columns),
+            ascending=[direction == 'asc' for _, direction in spec],
+            kind='mergesort',
+        ).index.to_numpy()
+
+        self._sort_cache = (data, spec, order)
+        return order
+
+    def ordered_positions(
+        self,
+        data: pd.DataFrame,
+        mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Get positions of the rows passing a mask, in current sort order.
+
+        Applies the cached sort permutation to the mask, so no sorting
+        happens when only filters or the page change.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Input cognostics data
+        mask : np.ndarray, optional
+            Boolean row mask. Defaults to ``filter_mask(data)``.
+
+        Returns
+        -------
+        np.ndarray
+            Row positions; slice with ``page_slice()`` for the current page
+        """
+        if mask is None:
+            mask = self.filter_mask(data)
+
+        order = self.sort_permutation(data)
+        if order is None:
+            return np.flatnonzero(mask)
+        return order[mask[order]]
 
     def sort_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -164,27 +272,47 @@ class DisplayState:
         pd.DataFrame
             Sorted data
         """
-        if not self.active_sorts:
+        order = self.sort_permutation(data)
+        if order is None:
             return data
+        return data.iloc[order]
 
-        sorted_data = data.copy()
-
-        # Apply sorts in order (first sort has highest priority)
-        sort_cols = []
-        sort_ascending = []
+    def result_key(self, search_query: Optional[str] = None) -> str:
+        """
+        Get a key identifying the current filter, sort and search result.
 
-        for varname, direction in self.active_sorts:
-            if varname in sorted_data.columns:
-                sort_cols.append(varname)
-                sort_ascending.append(direction == 'asc')
+        Parameters
+        ----------
+        search_query : str, optional
+            Active global search query
 
-        if sort_cols:
-            sorted_data = sorted_data.sort_values(
-                by=sort_cols,
-                ascending=sort_ascending
-            )
+        Returns
+        -------
+        str
+            Hex digest of the filter/sort spec and search query
+        """
+        spec = json.dumps(
+            {
+                'filters': self.active_filters,
+                'sorts': self.active_sorts,
+                'search': (search_query or '').strip().lower(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.md5(spec.encode()).hexdigest()
+
+    def page_slice(self) -> slice:
+        """
+        Get the slice of sorted rows shown on the current page.
 
-        return sorted_data
+        Returns
+        -------
+        slice
+            Slice of positions for the current page
+        """
+        start_idx = (self.current_page - 1) * self.panels_per_page
+        return slice(start_idx, start_idx + self.panels_per_page)
 
     def get_page_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -200,10 +328,7 @@ class DisplayState:
         pd.DataFrame
             Data for current page only
         """
-        start_idx = (self.current_page - 1) * self.panels_per_page
-        end_idx = start_idx + self.panels_per_page
-
-        return data.iloc[start_idx:end_idx]
+        return data.iloc[self.page_slice()]
 
     def get_total_pages(self, total_panels: int) -> int:
         """
@@ -0,0 +1,200 @@
+"""
+Grid thumbnails for image panels, served over a cached HTTP route.
+
+The panel grid shows images at a few hundred pixels, so full-resolution
+panel files are downscaled once into a thumbnail cache and the grid
+references them by URL instead of embedding base64 data in every
+callback response. URLs carry the source file's modification time, so
+responses can be marked immutable and browsers only revalidate (via
+ETag) when a panel is re-rendered. Full-size images are only used in the
+panel detail modal.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+# URL prefix of the thumbnail route
+THUMBNAIL_ROUTE = "/_trelliscope/thumbs/"
+
+# Panel formats that are downscaled; others (SVG, GIF) are served as-is
+RASTER_SUFFIXES = {'.png', '.jpg', '.jpeg'}
+
+# Thumbnail URLs change whenever the source changes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ThumbnailStore:
+    """
+    Lazily generated, disk-cached thumbnails of a display's panel images.
+
+    Thumbnails are created on first request and kept in ``cache_dir``;
+    a thumbnail older than its source panel is regenerated.
+
+    Parameters
+    ----------
+    panel_dir : Path
+        Directory holding the display's panel files
+    cache_dir : Path, optional
+        Directory for generated thumbnails. Defaults to a ``thumbs``
+        directory next to ``panel_dir``, or a temporary directory if that
+        is not writable.
+    size : tuple of int, default=(500, 500)
+        Bounding box (width, height) thumbnails are scaled down to fit
+    quality : int, default=80
+        WebP quality of generated thumbnails
+
+    Examples
+    --------
+    >>> store = ThumbnailStore(display_dir / "panels", size=(400, 400))
+    >>> store.url(display_dir / "panels" / "0.png")
+    '/_trelliscope/thumbs/0.png?v=...'
+    """
+
+    def __init__(
+        self,
+        panel_dir: Path,
+        cache_dir: Optional[Path] = None,
+        size: Tuple[int, int] = (500, 500),
+        quality: int = 80
+    ):
+        self.panel_dir = Path(panel_dir)
+        self.size = (int(size[0]), int(size[1]))
+        self.quality = quality
+
+        if cache_dir is None:
+            cache_dir = self.panel_dir.parent / "thumbs"
+        cache_dir = Path(cache_dir) / f"{self.size[0]}x{self.size[1]}"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # Read-only display directory: keep thumbnails in temp space
+            digest = hashlib.md5(str(self.panel_dir.resolve()).encode()).hexdigest()
+            cache_dir = (
+                Path(tempfile.gettempdir()) / "trelliscope-thumbs" / digest
+                / f"{self.size[0]}x{self.size[1]}"
+            )
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+
+    def url(self, panel_path: Path) -> str:
+        """
+        Get the thumbnail URL of a panel file.
+
+        Parameters
+        ----------
+        panel_path : Path
+            Panel image file in ``panel_dir``
+
+        Returns
+        -------
+        str
+            Route URL, versioned by the file's modification time
+        """
+        panel_path = Path(panel_path)
+        try:
+            version = format(panel_path.stat().st_mtime_ns, 'x')
+        except OSError:
+            version = "0"
+        return f"{THUMBNAIL_ROUTE}{panel_path.name}?v={version}"
+
+    def resolve(self, name: str) -> Optional[Path]:
+        """
+        Map a requested file name to a panel file.
+
+        Parameters
+        ----------
+        name : str
+            File name from the route
+
+        Returns
+        -------
+        Path or None
+            Panel file, or None if the name is not a plain file name or
+            the file does not exist
+        """
+        if not name or Path(name).name != name or name.startswith('.'):
+            return None
+        path = self.panel_dir / name
+        return path if path.is_file() else None
+
+    def thumbnail(self, panel_path: Path) -> Path:
+        """
+        Get the thumbnail of a panel file, generating it if needed.
+
+        Parameters
+        ----------
+        panel_path : Path
+            Panel image file
+
+        Returns
+        -------
+        Path
+            Thumbnail file. The panel file itself for non-raster formats,
+            images already within ``size``, or when Pillow is not
+            installed.
+        """
+        panel_path = Path(panel_path)
+        if panel_path.suffix.lower() not in RASTER_SUFFIXES:
+            return panel_path
+
+        try:
+            from PIL import Image
+        except ImportError:
+            return panel_path
+
+        thumb_path = self.cache_dir / f"{panel_path.stem}{panel_path.suffix}.webp"
+        source_mtime = panel_path.stat().st_mtime_ns
+        if thumb_path.exists() and thumb_path.stat().st_mtime_ns >= source_mtime:
+            return thumb_path
+
+        with Image.open(panel_path) as image:
+            if image.width <= self.size[0] and image.height <= self.size[1]:
+                return panel_path
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            image.thumbnail(self.size, Image.Resampling.LANCZOS)
+            # Write under a temporary name, then move into place
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".webp")
+            os.close(fd)
+            try:
+                image.save(tmp_name, format="WEBP", quality=self.quality, method=4)
+                os.replace(tmp_name, thumb_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return thumb_path
+
+
+def register_thumbnail_route(server, store: ThumbnailStore) -> None:
+    """
+    Serve thumbnails from a Flask server under ``THUMBNAIL_ROUTE``.
+
+    Responses carry an ETag and honour If-None-Match, and are marked
+    immutable because thumbnail URLs are versioned.
+
+    Parameters
+    ----------
+    server : flask.Flask
+        Server of the Dash app (``app.server``)
+    store : ThumbnailStore
+        Thumbnail store to serve from
+    """
+    import flask
+
+    @server.route(THUMBNAIL_ROUTE + "<path:name>", endpoint="trelliscope_thumbnail")
+    def serve_thumbnail(name):
+        panel_path = store.resolve(name)
+        if panel_path is None:
+            flask.abort(404)
+
+        response = flask.send_file(
+            store.thumbnail(panel_path),
+            conditional=True,
+            etag=True,
+            max_age=31536000,
+        )
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -5,18 +5,35 @@ This module provides the primary interface for creating trelliscope displays
 from pandas DataFrames with visualization panels and metadata.
 """
 
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Callable
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import hashlib
 import json
 
 from trelliscope.meta import MetaVariable
-from trelliscope.inference import infer_meta_from_series
+from trelliscope.inference import (
+    DEFAULT_MAX_FACTOR_LEVELS,
+    infer_meta_from_series,
+)
 from trelliscope.serialization import (
+    build_cog_columns,
+    build_cog_distns,
+    serialize_display_info,
     write_display_info,
     write_metadata_json,
     write_metadata_js,
+    METADATA_FILES,
+)
+from trelliscope.columnar import COG_STORE_FILES, _require_pyarrow, write_cog_store
+from trelliscope.manifest import (
+    frame_digest,
+    plan_incremental,
+    read_manifest,
+    record_content,
+    row_hashes,
+    write_manifest,
 )
 from trelliscope.viewer_html import write_viewer_html
 from trelliscope.multi_display import create_multi_display_structure
@@ -43,6 +60,23 @@ class Display:
         if not provided.
     path : Path or str, optional
         Output directory path. Defaults to './trelliscope_output'.
+    keysig_mode : {"sample", "content"}, default="sample"
+        How to generate ``keysig`` when it is not given. "sample" hashes the
+        name, columns, shape and first and last rows, which is constant-time
+        but misses changes in other rows. "content" hashes every value
+        (see ``trelliscope.manifest.frame_digest``), so any change to the
+        data gives a new keysig and browsers do not show stale cached data.
+        The content hash is computed once, when ``keysig`` is first read
+        (normally at write time), from the data at that point. Panel
+        objects are not hashed.
+    copy : bool, default=True
+        If True, the display works on a deep copy of ``data``. If False, it
+        keeps a shallow copy that shares the column buffers with ``data``,
+        so building a display over a very large frame costs no extra
+        memory. Columns the display derives (e.g. ``add_cognostics``) are
+        added to the shallow copy only and listed in ``derived_columns``;
+        ``data`` itself is never modified. Modifying ``data`` in place
+        afterwards is visible to the display.
 
     Attributes
     ----------
@@ -66,6 +100,11 @@ class Display:
         Named view configurations.
     panel_options : dict
         Panel dimension options (width, height, aspect).
+    panel_errors : dict
+        Errors from the last panel render, keyed by panel ID.
+    derived_columns : list of str
+        Columns added by the display itself (panels from
+        ``set_panel_function``, ``add_cognostics`` metrics).
 
     Examples
     --------
@@ -97,6 +136,8 @@ class Display:
         description: str = "",
         keysig: Optional[str] = None,
         path: Optional[Union[str, Path]] = None,
+        keysig_mode: str = "sample",
+        copy: bool = True,
     ):
         # Validate data type
         if not isinstance(data, pd.DataFrame):
@@ -110,16 +151,25 @@ class Display:
         if not name or not name.strip():
             raise ValueError("name cannot be empty")
 
+        if keysig_mode not in ("sample", "content"):
+            raise ValueError(
+                f"keysig_mode must be 'sample' or 'content', got '{keysig_mode}'"
+            )
+        self.keysig_mode = keysig_mode
+
         # Store core attributes
-        self.data = data.copy()
+        self.data = data.copy(deep=copy)
+        self.derived_columns: List[str] = []
         self.name = name.strip()
         self.description = description
 
-        # Generate or use provided key signature
-        if keysig is None:
-            self.keysig = self._generate_keysig()
-        else:
-            self.keysig = keysig
+        # Generate or use provided key signature. A content keysig hashes
+        # the whole frame, so it is only computed when first needed.
+        self.panel_column: Optional[str] = None
+        self._keysig_generated = keysig is None
+        self._keysig = keysig
+        if keysig is None and keysig_mode == "sample":
+            self._keysig = self._generate_keysig()
 
         # Set output path
         if path is None:
@@ -128,7 +178,6 @@ class Display:
             self.path = Path(path)
 
         # Initialize configuration
-        self.panel_column: Optional[str] = None
         self._meta_vars: Dict[str, MetaVariable] = {}
         self.state: Dict[str, Any] = {
             "layout": {"ncol": 4, "nrow": None, "page": 1, "arrangement": "row"},
@@ -147,6 +196,9 @@ class Display:
         # Panel interface configuration (how panels are loaded)
         self.panel_interface: Optional[Any] = None  # PanelInterface instance
 
+        # Per-panel render errors from the last write (panel ID -> message)
+        self.panel_errors: Dict[str, str] = {}
+
         # Track output paths for viewer integration
         self._output_path: Optional[Path] = None  # Display directory (for writing files)
         self._root_path: Optional[Path] = None    # Root directory (for serving HTTP)
@@ -154,18 +206,216 @@ class Display:
         # Viewer configuration
         self.viewer_config: Optional[Any] = None
 
+    @classmethod
+    def from_groupby(
+        cls,
+        data: pd.DataFrame,
+        by: Union[str, List[str]],
+        plot_fn: Callable[..., Any],
+        name: str,
+        cogs: Optional[Dict[str, Any]] = None,
+        description: str = "",
+        keysig: Optional[str] = None,
+        path: Optional[Union[str, Path]] = None,
+        panel_column: str = "panel",
+        infer: bool = True,
+        cognostics: Optional[Dict[str, Any]] = None,
+        **plot_kwargs,
+    ) -> "Display":
+        """
+        Create a display with one lazy panel per group of long-format data.
+
+        Cognostics are computed for all groups at once with
+        ``data.groupby(by).agg(**cogs)``, and each panel is a ``LazyPanel``
+        that applies ``plot_fn`` to its group's rows only when rendered. No
+        Python code runs per group until panels are written.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Long-format data, several rows per panel.
+        by : str or list of str
+            Columns identifying a panel. They become cognostics as well.
+        plot_fn : callable
+            Function taking one group's DataFrame and returning a figure.
+        name : str
+            Display name.
+        cogs : dict, optional
+            Named aggregations computed per group, as accepted by
+            ``DataFrameGroupBy.agg``: ``{output_name: (column, func)}``.
+        description : str, optional
+            Display description.
+        keysig : str, optional
+            Key signature. Auto-generated if not provided.
+        path : Path or str, optional
+            Output directory path.
+        panel_column : str, default="panel"
+            Name of the panel column.
+        infer : bool, default=True
+            If True, infer meta variables for the key and cognostic columns.
+        cognostics : dict, optional
+            Automatic cognostics (count, mean, min/max, slope, last value,
+            ...) for a value column, given as keyword arguments of
+            ``add_cognostics``, e.g. ``{"value": "value", "date": "date"}``.
+        **plot_kwargs
+            Extra keyword arguments passed to ``plot_fn``.
+
+        Returns
+        -------
+        Display
+            New display, one row per group (sorted by key). Rows with a
+            missing key are left out.
+
+        Examples
+        --------
+        >>> display = Display.from_groupby(
+        ...     jodi,
+        ...     by=["country", "category"],
+        ...     plot_fn=plot_series,
+        ...     name="production",
+        ...     cogs={
+        ...         "mean_value": ("value", "mean"),
+        ...         "max_value": ("value", "max"),
+        ...         "last_date": ("date", "max"),
+        ...     },
+        ... )
+        >>> display.write()
+        """
+        from trelliscope.panels.lazy import LazyPanel, group_rows
+
+        keys, rows = group_rows(data, by)
+        by = list(keys.columns)
+
+        clashes = [c for c in (cogs or {}) if c in by or c == panel_column]
+        if panel_column in by:
+            clashes.append(panel_column)
+        if clashes:
+            raise ValueError(
+                f"Cognostic names clash with key or panel columns: {clashes}"
+            )
+
+        frame = keys
+        if cogs:
+            # Same grouping and ordering as group_rows, so rows line up
+            aggregated = (
+                data.groupby(by, sort=True, observed=True)
+                .agg(**cogs)
+                .reset_index(drop=True)
+            )
+            frame = pd.concat([keys, aggregated], axis=1)
+
+        frame[panel_column] = [
+            LazyPanel(plot_fn, data, positions, **plot_kwargs)
+            for positions in rows
+        ]
+
+        # frame is built here, so the display can own it without a copy
+        display = cls(
+            frame, name=name, description=description, keysig=keysig, path=path,
+            copy=False,
+        )
+        display.set_panel_column(panel_column)
+        if cognostics is not None:
+            display.add_cognostics(data, by=by, **cognostics)
+        if infer:
+            display.infer_metas()
+        return display
+
+    def add_cognostics(
+        self,
+        data: pd.DataFrame,
+        by: Union[str, List[str]],
+        value: str,
+        date: Optional[str] = None,
+        metrics: Optional[List[str]] = None,
+        prefix: Optional[str] = None,
+    ) -> "Display":
+        """
+        Add automatic per-group summaries of a value column as cognostics.
+
+        Metrics are computed for all groups of ``data`` in one vectorized
+        pass (see ``trelliscope.cognostics.compute_cognostics``), joined to
+        the display rows on the ``by`` columns, and registered with meta
+        types inferred by ``infer_meta_dict``.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Long-format source data.
+        by : str or list of str
+            Key columns, present in both ``data`` and the display data.
+        value : str
+            Numeric column of ``data`` to summarize.
+        date : str, optional
+            Date column of ``data``; orders rows and enables date metrics.
+        metrics : list of str, optional
+            Metrics to compute. Defaults to count, mean, min, max, slope,
+            last and missing_frac, plus first/last date and date span when
+            ``date`` is given.
+        prefix : str, optional
+            Column name prefix. Defaults to ``value``.
+
+        Returns
+        -------
+        Display
+            Self for method chaining.
+
+        Raises
+        ------
+        ValueError
+            If a key column is missing or a metric column already exists.
+
+        Examples
+        --------
+        >>> display.add_cognostics(jodi, by="country", value="value", date="date")
+        >>> display.list_meta_variables()
+        ['country', 'value_count', 'value_mean', ...]
+        """
+        from trelliscope.cognostics import cognostic_metas, compute_cognostics
+
+        by = [by] if isinstance(by, str) else list(by)
+        missing = [col for col in by if col not in self.data.columns]
+        if missing:
+            raise ValueError(f"Key columns not found in display data: {missing}")
+
+        cogs = compute_cognostics(
+            data, by, value, date=date, metrics=metrics, prefix=prefix
+        )
+        new_columns = [col for col in cogs.columns if col not in by]
+        clashes = [col for col in new_columns if col in self.data.columns]
+        if clashes:
+            raise ValueError(f"Columns already exist in display data: {clashes}")
+
+        # Align on keys without disturbing the display index (panel IDs)
+        aligned = self.data[by].merge(cogs, on=by, how="left")
+        for col in new_columns:
+            self.data[col] = aligned[col].to_numpy()
+        self.derived_columns.extend(new_columns)
+
+        metas = cognostic_metas(self.data[new_columns], value, date=date, prefix=prefix)
+        for meta in metas.values():
+            self.add_meta_variable(meta, replace=True)
+        return self
+
     def _generate_keysig(self) -> str:
         """
         Generate unique key signature for display based on data content.
 
-        Uses MD5 hash of display name, column names, data shape, and sample
-        rows to create a unique identifier.
+        In "sample" mode, uses MD5 hash of display name, column names, data
+        shape, and sample rows to create a unique identifier. In "content"
+        mode, hashes the display name and every value of the data except
+        panel objects (see ``_unhashed_columns``).
 
         Returns
         -------
         str
             MD5 hash as hexadecimal string.
         """
+        if self.keysig_mode == "content":
+            digest = frame_digest(self.data, exclude=self._unhashed_columns())
+            content = f"{self.name}:{digest}"
+            return hashlib.md5(content.encode()).hexdigest()
+
         components = {
             "name": self.name,
             "columns": list(self.data.columns),
@@ -181,6 +431,26 @@ class Display:
         content = json.dumps(components, sort_keys=True, default=str)
         return hashlib.md5(content.encode()).hexdigest()
 
+    @property
+    def keysig(self) -> str:
+        """Key signature, generating a content keysig on first access."""
+        if self._keysig is None:
+            self._keysig = self._generate_keysig()
+        return self._keysig
+
+    @keysig.setter
+    def keysig(self, value: str) -> None:
+        self._keysig = value
+        self._keysig_generated = False
+
+    def _refresh_keysig(self) -> None:
+        """
+        Drop a computed content keysig once the panel column changes, so it
+        is regenerated without the panel objects.
+        """
+        if self._keysig_generated and self.keysig_mode == "content":
+            self._keysig = None
+
     def set_panel_column(self, column: str) -> "Display":
         """
         Specify which column contains panel data (plots/figures).
@@ -212,6 +482,98 @@ class Display:
             )
 
         self.panel_column = column
+        self._refresh_keysig()
+        return self
+
+    def set_panel_function(
+        self,
+        plot_fn: Callable[..., Any],
+        by: Optional[Union[str, List[str]]] = None,
+        data: Optional[pd.DataFrame] = None,
+        column: str = "panel",
+        **kwargs,
+    ) -> "Display":
+        """
+        Build panels on demand from a plot function.
+
+        Fills ``column`` with ``LazyPanel`` objects and makes it the panel
+        column. No figure exists until its panel is rendered, and each one
+        is closed right after it is saved, so memory use does not grow with
+        the number of panels.
+
+        Parameters
+        ----------
+        plot_fn : callable
+            Function taking a DataFrame and returning a figure.
+        by : str or list of str, optional
+            Key columns linking display rows to rows of ``data``. Required
+            when ``data`` is given.
+        data : pd.DataFrame, optional
+            Long-format source data. Each panel is drawn from the rows of
+            ``data`` whose ``by`` columns match the display row. If omitted,
+            each panel is drawn from its own display row (as a one-row
+            DataFrame).
+        column : str, default="panel"
+            Name of the panel column to create.
+        **kwargs
+            Extra keyword arguments passed to ``plot_fn``.
+
+        Returns
+        -------
+        Display
+            Self for method chaining.
+
+        Raises
+        ------
+        ValueError
+            If ``data`` is given without ``by``, or a ``by`` column is
+            missing from either frame.
+
+        Examples
+        --------
+        >>> summary = sales.groupby("country", as_index=False)["units"].sum()
+        >>> display = Display(summary, name="sales")
+        >>> display.set_panel_function(plot_country, by="country", data=sales)
+        """
+        from trelliscope.panels.lazy import LazyPanel, group_rows
+
+        if data is None:
+            # Shallow snapshot without the panel column, so panels do not
+            # refer to the frame that holds them (shares column buffers)
+            source = self.data.copy(deep=False)
+            if column in source.columns:
+                del source[column]
+            panels = [
+                LazyPanel(plot_fn, source, [i], **kwargs)
+                for i in range(len(source))
+            ]
+        else:
+            if by is None:
+                raise ValueError("by must be given together with data")
+            by = [by] if isinstance(by, str) else list(by)
+            missing = [col for col in by if col not in self.data.columns]
+            if missing:
+                raise ValueError(
+                    f"Key columns not found in display data: {missing}"
+                )
+
+            keys, rows = group_rows(data, by)
+            keys["__group__"] = np.arange(len(keys))
+            groups = self.data[by].merge(keys, on=by, how="left")["__group__"]
+
+            no_rows = np.array([], dtype=np.intp)
+            panels = [
+                LazyPanel(
+                    plot_fn, data, no_rows if pd.isna(g) else rows[int(g)], **kwargs
+                )
+                for g in groups
+            ]
+
+        self.data[column] = pd.Series(panels, index=self.data.index, dtype=object)
+        if column not in self.derived_columns:
+            self.derived_columns.append(column)
+        self.panel_column = column
+        self._refresh_keysig()
         return self
 
     def set_default_layout(
@@ -554,6 +916,8 @@ class Display:
         self,
         columns: Optional[List[str]] = None,
         replace: bool = False,
+        sample_size: Optional[int] = None,
+        max_factor_levels: Optional[int] = DEFAULT_MAX_FACTOR_LEVELS,
     ) -> "Display":
         """
         Automatically infer and add meta variables from DataFrame columns.
@@ -564,6 +928,15 @@ class Display:
             Columns to infer meta for. Defaults to all columns.
         replace : bool, default=False
             If True, replace existing metas for these columns.
+        sample_size : int, optional
+            Decide each column's type from a random sample of this many
+            rows, which bounds the cost on tall frames. Factor levels are
+            still exact. None (default) uses every row.
+        max_factor_levels : int, default=1000
+            Text columns with more distinct values than this become
+            StringMeta (filtered by text search) instead of FactorMeta, so
+            ID and free-text columns do not carry huge level lists. None
+            disables the limit.
 
         Returns
         -------
@@ -577,6 +950,9 @@ class Display:
         >>>
         >>> # Infer specific columns
         >>> display.infer_metas(columns=["category", "value"])
+        >>>
+        >>> # Decide types from 10,000 sampled rows
+        >>> display.infer_metas(sample_size=10_000)
         """
         if columns is None:
             columns = list(self.data.columns)
@@ -596,7 +972,12 @@ class Display:
             if col in self._meta_vars and not replace:
                 continue
 
-            meta = infer_meta_from_series(self.data[col], varname=col)
+            meta = infer_meta_from_series(
+                self.data[col],
+                varname=col,
+                sample_size=sample_size,
+                max_factor_levels=max_factor_levels,
+            )
             self._meta_vars[col] = meta
 
         return self
@@ -674,6 +1055,14 @@ class Display:
         create_index: bool = True,
         viewer_debug: bool = False,
         use_multi_display: bool = True,
+        workers: Optional[int] = None,
+        executor: Optional[Any] = None,
+        panel_manager: Optional[Any] = None,
+        embed_cog_data: Optional[bool] = None,
+        compress_metadata: bool = False,
+        cog_format: Optional[str] = None,
+        incremental: bool = False,
+        skip_unchanged: bool = False,
     ) -> Path:
         """
         Write display to disk as JSON specification and render panels.
@@ -700,6 +1089,55 @@ class Display:
         use_multi_display : bool, default=True
             If True, use multi-display structure with config.json and displays/
             subdirectory. If False, use single-display structure (EXPERIMENTAL).
+        workers : int, optional
+            Number of worker processes used to render panels. None or 1
+            renders serially; -1 uses one worker per CPU. Workers render
+            with the non-interactive Agg backend.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to render panels on instead of a new process
+            pool; the caller owns its lifetime. ``workers`` then only sets
+            the chunk size (pass the executor's worker count).
+        panel_manager : PanelManager, optional
+            Panel manager (adapters and their settings) used to render
+            panels. Defaults to ``PanelManager()``.
+        embed_cog_data : bool, optional
+            If True, embed cogData in displayInfo.json and also write
+            metaData.json and metaData.js. If False, the rows are written
+            once, to metaData.js (read by the HTML viewer), and
+            displayInfo.json only holds the schema and state and points to
+            it via ``cogDataFile``. Defaults to True, or False when
+            ``cog_format`` is given (readers then load the columnar store
+            and never parse per-row JSON).
+        compress_metadata : bool, default=False
+            If True, gzip the metadata file as metaData.json.gz, or as
+            metaData.js.gz when ``embed_cog_data`` is False. A gzipped
+            metaData.js is only readable by the HTML viewer through
+            ``DisplayServer``, not from file:// URLs.
+        cog_format : {"arrow", "parquet"}, optional
+            Also write a typed, columnar cognostics file (cogData.arrow or
+            cogData.parquet) next to displayInfo.json. The Dash viewer loads
+            it in preference to the JSON cogData. Requires pyarrow.
+        incremental : bool, default=False
+            If True, update an existing output directory in place (``force``
+            is not needed): only panels whose rows are new or changed, or
+            whose files are missing, are rendered, and panels for rows no
+            longer in the data are deleted. Row changes are detected against
+            panelManifest.json from the previous write. Panel objects with
+            a ``cache_key()`` (lazy panels from ``from_groupby`` and
+            ``set_panel_function``, template panels) are hashed by it; other
+            panel objects that are not strings are not part of the row
+            hash, so a re-drawn figure in an otherwise unchanged row is not
+            re-rendered. If the panel adapter settings changed (format,
+            dpi, ...), every panel is re-rendered. Metadata files are
+            rewritten for the full data.
+        skip_unchanged : bool, default=False
+            If True, return without writing anything when the output
+            directory already holds a complete write of the same display:
+            same data (every value is hashed), metas, state, write options
+            and panel adapter settings, with every panel file present.
+            ``force`` is only needed if the display did change. As with
+            ``incremental``, panel objects that are not strings are not
+            hashed.
 
         Returns
         -------
@@ -709,8 +1147,10 @@ class Display:
         Raises
         ------
         ValueError
-            If output directory exists and force=False, or if panel_column
-            is not set (currently required).
+            If output directory exists and force=False, if panel_column
+            is not set (currently required), or if cog_format is invalid.
+        ImportError
+            If cog_format is given and pyarrow is not installed.
         OSError
             If directory cannot be created or files cannot be written.
 
@@ -754,17 +1194,48 @@ class Display:
                 "Use set_panel_column() to specify which column contains panels."
             )
 
+        if cog_format is not None and cog_format not in COG_STORE_FILES:
+            raise ValueError(
+                f"Invalid cog_format '{cog_format}'. "
+                f"Must be one of: {sorted(COG_STORE_FILES)}"
+            )
+        if cog_format is not None:
+            # Fail before any panels are rendered, not after
+            _require_pyarrow()
+
         # Determine output path
         if output_path is None:
             output_path = self.path / self.name
         else:
             output_path = Path(output_path)
 
+        fingerprint = None
+        if skip_unchanged:
+            fingerprint = self._content_fingerprint(
+                panel_manager,
+                render_panels=render_panels,
+                create_index=create_index,
+                viewer_debug=viewer_debug,
+                use_multi_display=use_multi_display,
+                embed_cog_data=embed_cog_data,
+                compress_metadata=compress_metadata,
+                cog_format=cog_format,
+            )
+            display_dir = (
+                output_path / "displays" / self.name
+                if use_multi_display else output_path
+            )
+            if self._is_unchanged(display_dir, fingerprint, render_panels):
+                print(f"Display '{self.name}' unchanged, skipping write")
+                self._output_path = display_dir
+                self._root_path = output_path
+                return output_path
+
         # Check if directory exists
-        if output_path.exists() and not force:
+        if output_path.exists() and not (force or incremental):
             raise ValueError(
                 f"Output directory already exists: {output_path}. "
-                f"Use force=True to overwrite."
+                f"Use force=True to overwrite or incremental=True to update."
             )
 
         # Create directory structure
@@ -786,20 +1257,64 @@ class Display:
 
         # Render panels if requested
         if render_panels:
-            self._render_panels(display_output_path)
-
-        # Write displayInfo.json
-        write_display_info(self, display_output_path)
+            self._render_and_record_panels(
+                display_output_path,
+                incremental=incremental,
+                workers=workers,
+                executor=executor,
+                panel_manager=panel_manager,
+            )
 
-        # Write metaData.json (required for file-based panels)
-        write_metadata_json(self, display_output_path)
+        if embed_cog_data is None:
+            embed_cog_data = cog_format is None
+
+        # Embedded cogData needs every row in memory anyway, so convert
+        # once and share it between the outputs. Otherwise metaData.js is
+        # converted and written a chunk at a time.
+        cog_columns = build_cog_columns(self) if embed_cog_data else None
+
+        if embed_cog_data:
+            # metaData.json (required for file-based panels) and metaData.js
+            # (CRITICAL: required by viewer even with embedded cogData)
+            metadata_paths = [
+                write_metadata_json(
+                    self, display_output_path, cog_columns, compress=compress_metadata
+                ),
+                write_metadata_js(self, display_output_path, cog_columns),
+            ]
+        else:
+            # Rows live in one file only, the one the HTML viewer loads
+            metadata_paths = [
+                write_metadata_js(
+                    self, display_output_path, cog_columns, compress=compress_metadata
+                )
+            ]
+        # Remove stale metadata files from a previous write
+        written = {path.name for path in metadata_paths}
+        for name in METADATA_FILES:
+            if name not in written:
+                (display_output_path / name).unlink(missing_ok=True)
 
-        # Write metaData.js (CRITICAL: required by viewer even with embedded cogData)
-        write_metadata_js(self, display_output_path)
+        # Write displayInfo.json
+        write_display_info(
+            self,
+            display_output_path,
+            cog_columns,
+            embed_cog_data=embed_cog_data,
+            cog_data_file=metadata_paths[0].name,
+            cog_distns=build_cog_distns(self),
+        )
 
         # Write metadata CSV with cognostics
         self._write_metadata_csv(display_output_path)
 
+        # Write columnar cognostics store, dropping any stale one
+        for store_format, store_name in COG_STORE_FILES.items():
+            if store_format != cog_format:
+                (display_output_path / store_name).unlink(missing_ok=True)
+        if cog_format is not None:
+            write_cog_store(self, display_output_path, format=cog_format)
+
         # Generate index.html viewer file at root
         if create_index:
             config_path = "./config.json" if use_multi_display else "./displayInfo.json"
@@ -812,13 +1327,195 @@ class Display:
             )
             print(f"  Generated index.html viewer at {root_path}")
 
+        # Last step: mark the write complete (or clear a stale fingerprint)
+        record_content(display_output_path, fingerprint)
+
         # Store BOTH display path and root path for viewer integration
         self._output_path = display_output_path
         self._root_path = root_path
 
         return root_path
 
-    def _render_panels(self, output_path: Path) -> None:
+    def _content_fingerprint(
+        self, panel_manager: Optional[Any] = None, **options
+    ) -> str:
+        """
+        Fingerprint everything a write depends on.
+
+        Combines a hash of the data (without unhashable panel objects), the
+        serialized display schema and state, the write options and the
+        panel adapters' settings.
+
+        Parameters
+        ----------
+        panel_manager : PanelManager, optional
+            Panel manager the write renders with.
+        **options
+            Write options that affect the output.
+
+        Returns
+        -------
+        str
+            MD5 hex digest.
+        """
+        if panel_manager is None:
+            from trelliscope.panels.manager import PanelManager
+            panel_manager = PanelManager()
+
+        info = serialize_display_info(
+            self, cog_columns={}, embed_cog_data=False, cog_distns={}
+        )
+        payload = json.dumps(
+            {
+                "data": frame_digest(self.data, exclude=self._unhashed_columns()),
+                "info": info,
+                "options": options,
+                "adapters": [a.cache_key() for a in panel_manager.adapters],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def _is_unchanged(
+        self, display_dir: Path, fingerprint: str, render_panels: bool
+    ) -> bool:
+        """
+        Check whether display_dir holds a complete write with this fingerprint.
+        """
+        manifest = read_manifest(display_dir)
+        if manifest is None or manifest.get("content") != fingerprint:
+            return False
+        if not (display_dir / "displayInfo.json").is_file():
+            return False
+        if render_panels:
+            hashes = self._row_hashes()
+            pending, removed = plan_incremental(
+                hashes, manifest, display_dir / "panels"
+            )
+            if pending or removed:
+                return False
+        return True
+
+    def _render_and_record_panels(
+        self,
+        output_path: Path,
+        incremental: bool = False,
+        **render_kwargs,
+    ) -> None:
+        """
+        Render panels and update the panel manifest.
+
+        In incremental mode, only panels that ``plan_incremental`` reports as
+        new, changed or missing are rendered, and files of panels whose rows
+        were removed are deleted. If the panel adapters' settings differ
+        from the manifest's, every panel is rendered again. Panels that fail
+        to render are left out of the manifest so the next incremental write
+        retries them.
+
+        Parameters
+        ----------
+        output_path : Path
+            Display output directory.
+        incremental : bool, default=False
+            Render only what changed since the previous manifest.
+        **render_kwargs
+            Passed to ``_render_panels`` (workers, executor, panel_manager).
+        """
+        from trelliscope.panels.manager import PanelManager
+
+        if render_kwargs.get("panel_manager") is None:
+            render_kwargs["panel_manager"] = PanelManager()
+        adapters = [a.cache_key() for a in render_kwargs["panel_manager"].adapters]
+
+        panels_dir = output_path / "panels"
+        hashes = self._row_hashes()
+        previous = read_manifest(output_path) if incremental else None
+
+        pending, removed = plan_incremental(hashes, previous, panels_dir, adapters)
+        if previous is not None:
+            print(
+                f"Incremental write: {len(pending)} new or changed, "
+                f"{len(removed)} removed, "
+                f"{len(hashes) - len(pending)} unchanged panels"
+            )
+            for panel_id in removed:
+                panel_file = previous["panels"][panel_id].get("file")
+                if panel_file:
+                    (panels_dir / panel_file).unlink(missing_ok=True)
+            if previous.get("format"):
+                self._panel_format = previous["format"]
+
+        results = self._render_panels(
+            output_path, panel_ids=pending, **render_kwargs
+        )
+
+        # Unchanged panels keep their entries; re-rendered ones are replaced
+        entries = {}
+        pending_set = set(pending)
+        if previous is not None:
+            for panel_id, digest in hashes.items():
+                if panel_id not in pending_set:
+                    entries[panel_id] = previous["panels"][panel_id]
+        for result in results:
+            if result.ok:
+                old_entry = (previous or {}).get("panels", {}).get(result.panel_id)
+                if old_entry and old_entry.get("file") != result.path.name:
+                    # Re-rendered in another format: drop the old file
+                    (panels_dir / old_entry["file"]).unlink(missing_ok=True)
+                entries[result.panel_id] = {
+                    "hash": hashes[result.panel_id],
+                    "file": result.path.name,
+                }
+        # Keep row order in the manifest
+        entries = {pid: entries[pid] for pid in hashes.index if pid in entries}
+
+        write_manifest(
+            output_path, entries, getattr(self, "_panel_format", None), adapters
+        )
+
+    def _row_hashes(self) -> pd.Series:
+        """
+        Hash each row for the panel manifest.
+
+        Panel objects are not hashable values, but those with a
+        ``cache_key()`` (e.g. ``LazyPanel``, whose key covers the source
+        rows it plots) are hashed by it, so a changed subset behind an
+        otherwise unchanged row is re-rendered.
+        """
+        unhashed = self._unhashed_columns()
+        keys = None
+        if unhashed:
+            keys = []
+            for panel in self.data[self.panel_column]:
+                cache_key = getattr(panel, "cache_key", None)
+                key = cache_key() if callable(cache_key) else None
+                keys.append("" if key is None else repr(key))
+            if not any(keys):
+                keys = None
+        return row_hashes(self.data, exclude=unhashed, extra=keys)
+
+    def _unhashed_columns(self) -> List[str]:
+        """
+        Columns left out of row hashes: the panel column, unless it holds
+        plain strings (e.g. paths to pre-rendered panels). See
+        ``_row_hashes`` for panel objects with a content key.
+        """
+        if self.panel_column is None or self.panel_column not in self.data.columns:
+            return []
+        panel_values = self.data[self.panel_column]
+        if pd.api.types.infer_dtype(panel_values, skipna=True) in ("string", "empty"):
+            return []
+        return [self.panel_column]
+
+    def _render_panels(
+        self,
+        output_path: Path,
+        workers: Optional[int] = None,
+        executor: Optional[Any] = None,
+        panel_manager: Optional[Any] = None,
+        panel_ids: Optional[List[str]] = None,
+    ) -> List[Any]:
         """
         Render all panels to files in the panels/ directory.
 
@@ -826,62 +1523,77 @@ class Display:
         panel column and renders it using the appropriate adapter (matplotlib,
         plotly, etc.). Callables are executed before rendering (lazy evaluation).
 
+        Panels are named after the DataFrame index, so panel IDs are the same
+        whether rendering is serial or spread across worker processes. Panels
+        that fail to render are skipped and recorded in ``panel_errors``.
+
         Parameters
         ----------
         output_path : Path
             Output directory path (panels will be saved to output_path/panels/)
+        workers : int, optional
+            Number of worker processes. None or 1 renders serially.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to render on. ``workers`` then only sets the
+            chunk size.
+        panel_manager : PanelManager, optional
+            Panel manager to render with. Defaults to ``PanelManager()``.
+        panel_ids : list of str, optional
+            Render only these panel IDs. Defaults to every row.
 
-        Raises
-        ------
-        ValueError
-            If no adapter can handle a panel object.
-        Exception
-            If panel rendering fails.
+        Returns
+        -------
+        list of PanelResult
+            One result per rendered panel, in row order.
         """
-        from trelliscope.panels.manager import PanelManager
+        from trelliscope.panels.parallel import render_panels
 
         # Create panels directory
         panels_dir = output_path / "panels"
         panels_dir.mkdir(exist_ok=True)
 
-        # Create panel manager
-        manager = PanelManager()
-
-        # Get panel column
-        panel_col = self.panel_column
+        panels = [
+            (str(idx), panel_obj)
+            for idx, panel_obj in self.data[self.panel_column].items()
+        ]
+        if panel_ids is not None:
+            wanted = set(panel_ids)
+            panels = [panel for panel in panels if panel[0] in wanted]
+
+        print(f"Rendering {len(panels)} panels...")
+        results = render_panels(
+            panels,
+            panels_dir,
+            manager=panel_manager,
+            workers=workers,
+            executor=executor,
+        )
 
-        # Track panel format (will be set from first rendered panel)
+        self.panel_errors = {}
         panel_format = None
-
-        # Render each panel
-        print(f"Rendering {len(self.data)} panels...")
-        for idx, row in self.data.iterrows():
-            panel_obj = row[panel_col]
-
-            # Use index as panel ID
-            panel_id = str(idx)
-
-            try:
-                panel_path = manager.save_panel(
-                    panel_obj,
-                    panels_dir,
-                    panel_id
-                )
-                print(f"  Rendered panel {idx}: {panel_path.name}")
-
-                # Capture panel format from first rendered panel
+        for result in results:
+            if result.ok:
+                action = "Reused cached" if result.cached else "Rendered"
+                print(f"  {action} panel {result.panel_id}: {result.path.name}")
+                # Capture panel format from first rendered panel (row order)
                 if panel_format is None:
-                    panel_format = panel_path.suffix.lstrip('.')  # Remove leading dot
+                    panel_format = result.path.suffix.lstrip('.')
+            else:
+                print(f"  Error rendering panel {result.panel_id}: {result.error}")
+                self.panel_errors[result.panel_id] = result.error
 
-            except Exception as e:
-                print(f"  Error rendering panel {idx}: {e}")
-                # Continue with remaining panels
-                continue
+        if self.panel_errors:
+            print(f"  {len(self.panel_errors)} of {len(panels)} panels failed to render")
+        n_cached = sum(result.cached for result in results)
+        if n_cached:
+            print(f"  {n_cached} of {len(panels)} panels served from the render cache")
 
         # Store panel format for serialization
         if panel_format:
             self._panel_format = panel_format
 
+        return results
+
     def _write_metadata_csv(self, output_path: Path) -> Path:
         """
         Write metadata CSV file with panel metadata (cognostics).
@@ -902,12 +1614,9 @@ class Display:
         # Get non-panel columns only
         meta_cols = [col for col in self.data.columns if col != self.panel_column]
 
-        # Extract metadata (without panel column)
-        metadata_df = self.data[meta_cols].copy()
-
-        # Write CSV
+        # Write CSV (selecting columns in to_csv avoids copying the frame)
         csv_path = output_path / "metadata.csv"
-        metadata_df.to_csv(csv_path, index=False)
+        self.data.to_csv(csv_path, columns=meta_cols, index=False)
 
         return csv_path
 
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional, Union
 
 from trelliscope.viewer import generate_viewer_html, generate_deployment_readme
+from trelliscope.panels.plotly_adapter import FIGURE_SIDECAR_SUFFIX
 
 
 def export_static(
@@ -319,7 +320,10 @@ def validate_export(export_path: Union[str, Path]) -> dict:
     else:
         # Count panel files
         panel_files = list(panels_dir.glob("*"))
-        panel_files = [f for f in panel_files if f.is_file()]
+        panel_files = [
+            f for f in panel_files
+            if f.is_file() and not f.name.endswith(FIGURE_SIDECAR_SUFFIX)
+        ]
         report["panel_count"] = len(panel_files)
 
     # Check for README (optional but recommended)
@@ -15,12 +15,36 @@ from trelliscope.meta import (
     NumberMeta,
     DateMeta,
     TimeMeta,
+    StringMeta,
 )
 
 
+#: Text columns with more distinct values than this become StringMeta.
+DEFAULT_MAX_FACTOR_LEVELS = 1000
+
+# Object-column kinds (``pd.api.types.infer_dtype``) treated as numbers
+_NUMERIC_KINDS = ("integer", "floating", "mixed-integer-float", "decimal")
+
+
+def _sample(series: pd.Series, sample_size: Optional[int]) -> pd.Series:
+    """
+    Take a reproducible random sample of a series' non-missing values.
+
+    Returns the non-missing values unchanged when there are no more than
+    ``sample_size`` rows, or when ``sample_size`` is None.
+    """
+    if sample_size is None or len(series) <= sample_size:
+        return series.dropna()
+    rng = np.random.default_rng(0)
+    positions = np.sort(rng.choice(len(series), size=sample_size, replace=False))
+    return series.iloc[positions].dropna()
+
+
 def infer_meta_from_series(
     series: pd.Series,
     varname: Optional[str] = None,
+    sample_size: Optional[int] = None,
+    max_factor_levels: Optional[int] = DEFAULT_MAX_FACTOR_LEVELS,
     **kwargs
 ) -> MetaVariable:
     """
@@ -31,14 +55,30 @@ def infer_meta_from_series(
     - datetime64[ns] with timezone OR time values → TimeMeta
     - Numeric dtypes (int, float) → NumberMeta
     - Categorical, object, string → FactorMeta
+    - Object, string with more than ``max_factor_levels`` distinct
+      values (IDs, free text) → StringMeta
     - Boolean → FactorMeta with levels ["False", "True"]
 
+    With ``sample_size``, types are decided from a random sample of that
+    many rows, so the cost per column is bounded: object columns whose
+    sampled values are all numbers become NumberMeta (all booleans become a
+    boolean FactorMeta), and datetime columns are checked for a time
+    component on the sample. Factor levels are always computed exactly, but
+    only for columns classified as factors.
+
     Parameters
     ----------
     series : pd.Series
         Data series to infer type from.
     varname : str, optional
         Variable name. Uses series.name if not provided.
+    sample_size : int, optional
+        Number of rows to decide the type from. None uses every row.
+    max_factor_levels : int, optional
+        Largest number of levels a text column may have and still become a
+        FactorMeta. Above it the column becomes a StringMeta, so no level
+        list is stored and the viewer filters it with a text search.
+        Categorical columns are always factors. None disables the limit.
     **kwargs
         Additional parameters passed to specific meta type constructor.
 
@@ -98,25 +138,84 @@ def infer_meta_from_series(
 
     # Datetime types → DateMeta or TimeMeta
     if pd.api.types.is_datetime64_any_dtype(dtype):
-        return _infer_datetime_meta(series, varname, **kwargs)
+        return _infer_datetime_meta(
+            series, varname, sample_size=sample_size, **kwargs
+        )
 
     # Numeric types → NumberMeta
     if pd.api.types.is_numeric_dtype(dtype):
         return NumberMeta.from_series(series, varname=varname, **kwargs)
 
-    # Categorical, object, string → FactorMeta
-    if (isinstance(dtype, pd.CategoricalDtype) or
-        pd.api.types.is_object_dtype(dtype) or
-        pd.api.types.is_string_dtype(dtype)):
+    # Object columns holding numbers or booleans (decided from a sample)
+    if sample_size is not None and pd.api.types.is_object_dtype(dtype):
+        kind = pd.api.types.infer_dtype(_sample(series, sample_size), skipna=True)
+        if kind in _NUMERIC_KINDS:
+            return NumberMeta.from_series(series, varname=varname, **kwargs)
+        if kind == "boolean":
+            kwargs.setdefault("levels", ["False", "True"])
+            return FactorMeta(varname=varname, **kwargs)
+
+    # Categorical → FactorMeta
+    if isinstance(dtype, pd.CategoricalDtype):
         return FactorMeta.from_series(series, varname=varname, **kwargs)
 
+    # Object, string → FactorMeta, or StringMeta past max_factor_levels
+    if (pd.api.types.is_object_dtype(dtype) or
+            pd.api.types.is_string_dtype(dtype)):
+        return _infer_text_meta(
+            series, varname, sample_size, max_factor_levels, **kwargs
+        )
+
     # Fallback to FactorMeta for unknown types
     return FactorMeta.from_series(series, varname=varname, **kwargs)
 
 
+def _infer_text_meta(
+    series: pd.Series,
+    varname: str,
+    sample_size: Optional[int],
+    max_factor_levels: Optional[int],
+    **kwargs
+) -> MetaVariable:
+    """
+    Infer FactorMeta or, for high-cardinality text, StringMeta.
+
+    When a sample already holds more than ``max_factor_levels`` distinct
+    values, the column is a StringMeta without hashing every row.
+    """
+    if max_factor_levels is None or "levels" in kwargs:
+        return FactorMeta.from_series(series, varname=varname, **kwargs)
+
+    if (sample_size is not None and
+            _sample(series, sample_size).nunique() > max_factor_levels):
+        return StringMeta.from_series(series, varname=varname, **kwargs)
+
+    meta = FactorMeta.from_series(series, varname=varname, **kwargs)
+    if len(meta.levels) > max_factor_levels:
+        return StringMeta.from_series(series, varname=varname, **kwargs)
+    return meta
+
+
+def _has_time_component(series: pd.Series) -> bool:
+    """
+    Check whether any value of a naive datetime series is not at midnight.
+
+    Works on the underlying int64 ticks (one modulo per value) instead of
+    the ``.dt`` accessors, which build several intermediate arrays.
+    """
+    values = series.to_numpy()
+    if values.dtype.kind != "M":
+        values = pd.to_datetime(series).to_numpy()
+    unit = np.datetime_data(values.dtype)[0]
+    ticks_per_day = int(np.timedelta64(1, "D") / np.timedelta64(1, unit))
+    valid = values[~np.isnat(values)]
+    return bool((valid.view(np.int64) % ticks_per_day != 0).any())
+
+
 def _infer_datetime_meta(
     series: pd.Series,
     varname: str,
+    sample_size: Optional[int] = None,
     **kwargs
 ) -> MetaVariable:
     """
@@ -133,6 +232,8 @@ def _infer_datetime_meta(
         Datetime series.
     varname : str
         Variable name.
+    sample_size : int, optional
+        Check only a random sample of this many rows for a time component.
     **kwargs
         Additional parameters.
 
@@ -147,22 +248,12 @@ def _infer_datetime_meta(
 
     # Check if any non-NaT values have time component (non-midnight)
     # by checking if any times are not exactly on day boundaries
-    non_nat = series.dropna()
-    if len(non_nat) > 0:
-        # Convert to datetime if needed and check for time component
-        try:
-            # Check if any values have hour/minute/second components
-            has_time = (
-                (non_nat.dt.hour != 0).any() or
-                (non_nat.dt.minute != 0).any() or
-                (non_nat.dt.second != 0).any() or
-                (non_nat.dt.microsecond != 0).any()
-            )
-            if has_time:
-                return TimeMeta.from_series(series, varname=varname, **kwargs)
-        except (AttributeError, TypeError):
-            # If datetime accessor fails, fall back to DateMeta
-            pass
+    try:
+        if _has_time_component(_sample(series, sample_size)):
+            return TimeMeta.from_series(series, varname=varname, **kwargs)
+    except (AttributeError, TypeError, ValueError):
+        # If conversion fails, fall back to DateMeta
+        pass
 
     # Default to DateMeta for date-only data
     return DateMeta.from_series(series, varname=varname, **kwargs)
@@ -171,6 +262,8 @@ def _infer_datetime_meta(
 def infer_meta_dict(
     df: pd.DataFrame,
     columns: Optional[list] = None,
+    sample_size: Optional[int] = None,
+    max_factor_levels: Optional[int] = DEFAULT_MAX_FACTOR_LEVELS,
 ) -> dict:
     """
     Infer meta variables for multiple DataFrame columns.
@@ -181,6 +274,12 @@ def infer_meta_dict(
         DataFrame to infer from.
     columns : list of str, optional
         Columns to infer. Defaults to all columns.
+    sample_size : int, optional
+        Decide each column's type from a random sample of this many rows
+        (see ``infer_meta_from_series``). None uses every row.
+    max_factor_levels : int, optional
+        Text columns with more distinct values become StringMeta (see
+        ``infer_meta_from_series``). None disables the limit.
 
     Returns
     -------
@@ -207,6 +306,11 @@ def infer_meta_dict(
         columns = list(df.columns)
 
     return {
-        col: infer_meta_from_series(df[col], varname=col)
+        col: infer_meta_from_series(
+            df[col],
+            varname=col,
+            sample_size=sample_size,
+            max_factor_levels=max_factor_levels,
+        )
         for col in columns
     }
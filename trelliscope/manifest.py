@@ -0,0 +1,258 @@
+"""
+Panel manifest for incremental display writes.
+
+The manifest records, for every rendered panel, a hash of the row it was
+rendered from and the name of the panel file, plus the settings of the
+panel adapters that rendered them. ``Display.write`` keeps it in
+``panelManifest.json`` next to displayInfo.json. An incremental write
+compares the current rows against it and only renders panels whose rows are
+new or changed, or whose files are missing. If the adapter settings changed
+(e.g. another format or dpi), every panel is rendered again.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+MANIFEST_FILE = "panelManifest.json"
+MANIFEST_VERSION = 1
+
+
+def row_hashes(
+    data: pd.DataFrame,
+    exclude: Optional[List[str]] = None,
+    extra: Optional[List[str]] = None,
+) -> pd.Series:
+    """
+    Hash each row of a DataFrame.
+
+    Uses ``pd.util.hash_pandas_object`` on the row values (not the index),
+    so the hash changes exactly when a row's content changes. Columns whose
+    values cannot be hashed directly (e.g. lists) are hashed by their string
+    representation.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to hash.
+    exclude : list of str, optional
+        Columns to leave out of the hash.
+    extra : list of str, optional
+        One string per row hashed along with the row, e.g. content keys of
+        panel objects whose column is excluded.
+
+    Returns
+    -------
+    pd.Series
+        16-character hex digests indexed by panel ID (the index as strings).
+    """
+    columns = [c for c in data.columns if c not in set(exclude or [])]
+    frame = data[columns]
+
+    parts = []
+    if columns:
+        try:
+            parts.append(pd.util.hash_pandas_object(frame, index=False))
+        except TypeError:
+            parts.append(pd.util.hash_pandas_object(frame.astype(str), index=False))
+    if extra is not None:
+        parts.append(pd.util.hash_pandas_object(pd.Series(list(extra)), index=False))
+
+    if len(parts) > 1:
+        combined = pd.DataFrame({i: part.to_numpy() for i, part in enumerate(parts)})
+        parts = [pd.util.hash_pandas_object(combined, index=False)]
+    if parts:
+        digests = [format(h, "016x") for h in parts[0].to_numpy()]
+    else:
+        digests = [""] * len(data)
+
+    return pd.Series(digests, index=[str(idx) for idx in data.index], dtype=object)
+
+
+def frame_digest(data: pd.DataFrame, exclude: Optional[List[str]] = None) -> str:
+    """
+    Hash the full content of a DataFrame.
+
+    Column names, dtypes, the index and every value are hashed. Values are
+    hashed one column at a time with ``pd.util.hash_pandas_object``, so the
+    work is vectorized and the only temporary memory is one 8-byte hash per
+    row. Columns whose values cannot be hashed directly (e.g. lists) are
+    hashed by their string representation.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to hash.
+    exclude : list of str, optional
+        Columns to leave out (e.g. a column of figure objects).
+
+    Returns
+    -------
+    str
+        32-character hex MD5 digest.
+    """
+    excluded = set(exclude or [])
+    digest = hashlib.md5()
+    digest.update(pd.util.hash_pandas_object(data.index).to_numpy().tobytes())
+
+    for col in data.columns:
+        if col in excluded:
+            continue
+        values = data[col]
+        try:
+            hashes = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:
+            hashes = pd.util.hash_pandas_object(values.astype(str), index=False)
+        digest.update(f"{col!r}:{values.dtype}".encode("utf-8"))
+        digest.update(hashes.to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+def read_manifest(display_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read the panel manifest from a display directory.
+
+    Parameters
+    ----------
+    display_dir : Path
+        Display directory containing panelManifest.json.
+
+    Returns
+    -------
+    dict or None
+        Manifest with ``format``, ``adapters`` (adapter cache keys),
+        ``panels`` ({panel_id: {"hash", "file"}}) and, after a complete
+        write, ``content`` (the display fingerprint), or None if there is
+        no readable manifest.
+    """
+    path = Path(display_dir) / MANIFEST_FILE
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_manifest(
+    display_dir: Path,
+    panels: Dict[str, Dict[str, str]],
+    panel_format: Optional[str] = None,
+    adapters: Optional[List[str]] = None,
+) -> Path:
+    """
+    Write the panel manifest to a display directory.
+
+    Parameters
+    ----------
+    display_dir : Path
+        Display directory.
+    panels : dict
+        {panel_id: {"hash": row hash, "file": panel file name}}.
+    panel_format : str, optional
+        Panel file format (e.g. "png"), used when nothing is re-rendered.
+    adapters : list of str, optional
+        ``cache_key()`` of each panel adapter the panels were rendered with.
+
+    Returns
+    -------
+    Path
+        Path to written panelManifest.json.
+    """
+    path = Path(display_dir) / MANIFEST_FILE
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "format": panel_format,
+        "adapters": adapters,
+        "panels": panels,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    return path
+
+
+def record_content(display_dir: Path, content: Optional[str]) -> None:
+    """
+    Record the fingerprint of a completely written display in its manifest.
+
+    ``Display.write`` calls this last, so the fingerprint is only present
+    when every output file was written. A manifest is created if the write
+    did not render panels.
+
+    Parameters
+    ----------
+    display_dir : Path
+        Display directory.
+    content : str or None
+        Display fingerprint. None clears a previously recorded one.
+    """
+    manifest = read_manifest(display_dir)
+    if manifest is None and content is None:
+        return
+    manifest = manifest or {
+        "version": MANIFEST_VERSION,
+        "format": None,
+        "adapters": None,
+        "panels": {},
+    }
+    manifest["content"] = content
+    path = Path(display_dir) / MANIFEST_FILE
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+
+def plan_incremental(
+    hashes: pd.Series,
+    manifest: Optional[Dict[str, Any]],
+    panels_dir: Path,
+    adapters: Optional[List[str]] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Work out which panels an incremental write must render and remove.
+
+    Parameters
+    ----------
+    hashes : pd.Series
+        Current row hashes from ``row_hashes``.
+    manifest : dict or None
+        Previous manifest from ``read_manifest``. None renders everything.
+    panels_dir : Path
+        Directory holding the panel files.
+    adapters : list of str, optional
+        ``cache_key()`` of each current panel adapter. If given and
+        different from the manifest's, every panel is rendered.
+
+    Returns
+    -------
+    tuple of (list of str, list of str)
+        Panel IDs to render (new, changed, or missing their file) in row
+        order, and panel IDs that are no longer in the data.
+    """
+    if manifest is None:
+        return list(hashes.index), []
+
+    previous = manifest.get("panels", {})
+    current = set(hashes.index)
+    removed = [panel_id for panel_id in previous if panel_id not in current]
+    if adapters is not None and manifest.get("adapters") != adapters:
+        return list(hashes.index), removed
+
+    pending = []
+    for panel_id, digest in hashes.items():
+        entry = previous.get(panel_id)
+        if (
+            entry is None
+            or entry.get("hash") != digest
+            or not (panels_dir / entry.get("file", "")).is_file()
+        ):
+            pending.append(panel_id)
+    return pending, removed
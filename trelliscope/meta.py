@@ -8,9 +8,39 @@ hierarchy for different meta variable types.
 
 from typing import Optional, List, Any, Dict
 import attrs
+import numpy as np
 import pandas as pd
 
 
+def level_code_map(levels: Optional[List[Any]]) -> Dict[Any, int]:
+    """
+    Map each level to its 0-based position.
+
+    Levels that appear more than once map to their first position, like
+    ``list.index``.
+
+    Parameters
+    ----------
+    levels : list or None
+        Factor levels.
+
+    Returns
+    -------
+    dict
+        Level to 0-based index. Empty if levels is None.
+    """
+    codes = {}
+    for i, level in enumerate(levels or []):
+        codes.setdefault(level, i)
+    return codes
+
+
+def _reset_level_codes(instance, attribute, value):
+    """Drop the cached level lookup when levels are reassigned."""
+    instance._level_codes = None
+    return value
+
+
 @attrs.define
 class MetaVariable:
     """
@@ -141,10 +171,44 @@ class FactorMeta(MetaVariable):
         Always "factor".
     levels : list of str or None
         Category levels.
+    level_codes : dict
+        Mapping of level to its 0-based position in ``levels``.
     """
 
-    levels: Optional[List[str]] = None
+    levels: Optional[List[str]] = attrs.field(
+        default=None, on_setattr=_reset_level_codes
+    )
     type: str = attrs.field(init=False, default="factor")
+    # level -> code cache for level_codes, dropped when levels is assigned
+    _level_codes: Optional[Dict[str, int]] = attrs.field(
+        init=False, default=None, eq=False, repr=False
+    )
+
+    @property
+    def level_codes(self) -> Dict[str, int]:
+        """
+        Mapping of level to 0-based code, built once per set of levels.
+
+        Gives O(1) level lookups when encoding factor values, instead of
+        scanning ``levels`` for every value. Levels that appear more than
+        once map to their first position, like ``list.index``. The mapping
+        is rebuilt when ``levels`` is assigned; assign a new list rather
+        than changing it in place.
+
+        Returns
+        -------
+        dict
+            Level to 0-based index. Empty if levels are not set.
+
+        Examples
+        --------
+        >>> meta = FactorMeta("category", levels=["A", "B", "C"])
+        >>> meta.level_codes["B"]
+        1
+        """
+        if self._level_codes is None:
+            self._level_codes = level_code_map(self.levels)
+        return self._level_codes
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with levels."""
@@ -180,9 +244,16 @@ class FactorMeta(MetaVariable):
         if varname is None:
             varname = str(series.name)
 
-        # Infer levels from unique values (excluding NaN)
+        # Infer levels from unique values (excluding NaN). Nulls are
+        # dropped from the uniques rather than from the (much longer) column.
         if "levels" not in kwargs:
-            unique_vals = series.dropna().unique()
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                used = np.unique(codes[codes >= 0])
+                unique_vals = series.cat.categories.take(used)
+            else:
+                unique_vals = series.unique()
+                unique_vals = unique_vals[~pd.isna(unique_vals)]
             kwargs["levels"] = sorted([str(v) for v in unique_vals])
 
         return cls(varname=varname, **kwargs)
@@ -7,7 +7,7 @@ visualization libraries (matplotlib, plotly, altair) to disk formats
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional, Union
 
 
 class PanelRenderer(ABC):
@@ -21,6 +21,9 @@ class PanelRenderer(ABC):
     - save(): Save object to file
     - get_interface_type(): Return panelInterface type
     - get_format(): Return file extension
+
+    Subclasses may override fingerprint() and cache_key() to make their
+    panels cacheable by PanelCache.
     """
 
     @abstractmethod
@@ -93,5 +96,99 @@ class PanelRenderer(ABC):
         """
         pass
 
+    def cache_key(self) -> str:
+        """Identify the adapter's output settings for render caching.
+
+        Two adapters with equal cache keys must render the same object to
+        the same file. The default combines the class name with the
+        adapter's public attributes; subclasses should add the version of
+        the library they render with.
+
+        Returns:
+            str: Cache key component for this adapter
+
+        Example:
+            >>> MatplotlibAdapter(dpi=150).cache_key()
+            "...MatplotlibAdapter:{'bbox_inches': 'tight', 'dpi': 150, ...}"
+        """
+        settings = {
+            k: v for k, v in sorted(vars(self).items()) if not k.startswith("_")
+        }
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}:{settings!r}"
+
+    def supports_batch(self, **kwargs) -> bool:
+        """Whether save_batch() is faster than saving objects one by one.
+
+        PanelManager.save_panels() collects panels of adapters that return
+        True and saves them with save_batch(). The default returns False.
+
+        Args:
+            **kwargs: Options the objects would be saved with
+
+        Returns:
+            bool: True if objects should be saved in batches
+        """
+        return False
+
+    def save_batch(
+        self, objs: List[Any], paths: List[Path], **kwargs
+    ) -> List[Union[Path, Exception]]:
+        """Save several objects, reporting errors per object.
+
+        The default calls save() for each object.
+
+        Args:
+            objs: Objects detected by this adapter
+            paths: Base path for each object (extension added automatically)
+            **kwargs: Options passed to save()
+
+        Returns:
+            List: For each object, the saved path or the exception raised
+        """
+        outcomes: List[Union[Path, Exception]] = []
+        for obj, path in zip(objs, paths):
+            try:
+                outcomes.append(self.save(obj, path, **kwargs))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def write_assets(self, output_dir: Path) -> None:
+        """Write files shared by the panels of an output directory.
+
+        Called once per output directory before panels are rendered, also
+        when every panel is served from the render cache. The default
+        writes nothing.
+
+        Args:
+            output_dir: Directory panels are saved in
+        """
+
+    def release(self, obj: Any) -> None:
+        """Free resources held by an object after it has been saved.
+
+        Called by PanelManager for objects it created itself (the results of
+        callable panels), so figures built on demand do not accumulate. The
+        default does nothing.
+
+        Args:
+            obj: Object that was just saved
+        """
+
+    def fingerprint(self, obj: Any) -> Optional[str]:
+        """Return a stable digest of the object's content.
+
+        Equal digests must mean the object renders to the same file. The
+        default returns None, meaning the object is not cacheable.
+
+        Args:
+            obj: Object detected by this adapter
+
+        Returns:
+            str: Hex digest, or None if the object cannot be fingerprinted
+        """
+        return None
+
 
 __all__ = ["PanelRenderer"]
@@ -0,0 +1,403 @@
+"""Content-addressed on-disk cache of rendered panels.
+
+Rendered panel files are stored under a key derived from the panel's
+content (a figure's serialized state, or a callable's code and inputs)
+together with the adapter's settings and library version. When the same
+panel is saved again, the cached file is hard-linked (or copied) into
+place instead of re-rendering it.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import types
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+class _HashWriter:
+    """File-like object that feeds written bytes into a hash."""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        return len(data)
+
+
+class _StablePickler(pickle.Pickler):
+    """Pickler whose output does not depend on object identity.
+
+    Matplotlib stores transform parents keyed by ``id()`` and records
+    pyplot figure numbers, both of which change between runs for
+    otherwise identical figures. Those are normalized so equal figures
+    produce equal bytes.
+    """
+
+    def persistent_id(self, obj: Any) -> Any:
+        if type(obj) is not dict or not obj:
+            return None
+        # Figure state: drop the pyplot figure number
+        if "__mpl_version__" in obj and "_number" in obj:
+            return ("figure", {
+                k: v for k, v in obj.items()
+                if k not in ("_number", "_restore_to_pylab")
+            })
+        # Transform parents: {id(parent): parent}
+        if all(type(k) is int for k in obj):
+            try:
+                from matplotlib.transforms import TransformNode
+            except ImportError:
+                return None
+            if all(isinstance(v, TransformNode) for v in obj.values()):
+                return ("transform-parents", len(obj))
+        return None
+
+
+def stable_digest(obj: Any) -> Optional[str]:
+    """Hash an object's pickled state.
+
+    Args:
+        obj: Object to hash (figure, array, DataFrame, plain data, ...)
+
+    Returns:
+        str: Hex digest, or None if the object cannot be pickled
+    """
+    writer = _HashWriter()
+    try:
+        _StablePickler(writer, protocol=4).dump(obj)
+    except Exception:
+        return None
+    return writer.hash.hexdigest()
+
+
+def _code_digest(code: types.CodeType, hasher) -> None:
+    """Feed a code object (and nested code objects) into a hash."""
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(const, hasher)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def _module_attributes(module: types.ModuleType, names: List[str]) -> Optional[list]:
+    """Describe the attributes of a module that a function may read.
+
+    ``co_names`` holds both global and attribute names, so every name that
+    is an attribute of the module is included (``cfg.SCALE`` and
+    ``helpers.plot`` in ``helpers.plot(df, cfg.SCALE)``). Functions are
+    described by their own code only; their globals are not followed.
+
+    Args:
+        module: Module referenced by the function
+        names: Names read by the function's code
+
+    Returns:
+        list: (name, description) pairs, or None if a value cannot be hashed
+    """
+    attrs = []
+    for name in names:
+        try:
+            with warnings.catch_warnings():
+                # Deprecated module attributes warn on access
+                warnings.simplefilter("ignore")
+                value = getattr(module, name)
+        except Exception:
+            continue
+        if value is None:
+            continue
+        if isinstance(value, types.ModuleType):
+            attrs.append((name, value.__name__))
+        elif isinstance(value, type):
+            attrs.append((name, f"{value.__module__}.{value.__qualname__}"))
+        elif isinstance(value, types.FunctionType):
+            hasher = hashlib.sha256()
+            _code_digest(value.__code__, hasher)
+            attrs.append((name, value.__qualname__, hasher.hexdigest()))
+        elif callable(value):
+            # Builtins, ufuncs and other callable objects
+            attrs.append((name, repr(value)))
+        else:
+            digest = stable_digest(value)
+            if digest is None:
+                return None
+            attrs.append((name, digest))
+    return attrs
+
+
+def callable_fingerprint(fn: Any, _depth: int = 0) -> Optional[str]:
+    """Fingerprint a panel callable from its code and inputs, without calling it.
+
+    Covers objects with a ``cache_key()`` method (returning None marks the
+    object as not cacheable), ``functools.partial``,
+    bound methods, and plain functions or lambdas (code, defaults, closure
+    variables, referenced global values and the module attributes they
+    read). Other callables are fingerprinted by their pickled state.
+
+    Args:
+        fn: Callable panel
+
+    Returns:
+        str: Hex digest, or None if the inputs cannot be fingerprinted
+            (the panel is then rendered without caching)
+    """
+    if _depth > 8:
+        return None
+
+    cache_key = getattr(fn, "cache_key", None)
+    if callable(cache_key):
+        key = cache_key()
+        if key is None:
+            return None
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    hasher = hashlib.sha256()
+
+    if isinstance(fn, functools.partial):
+        inner = callable_fingerprint(fn.func, _depth + 1)
+        inputs = stable_digest((fn.args, sorted(fn.keywords.items())))
+        if inner is None or inputs is None:
+            return None
+        hasher.update(f"partial:{inner}:{inputs}".encode())
+        return hasher.hexdigest()
+
+    if isinstance(fn, types.MethodType):
+        inner = callable_fingerprint(fn.__func__, _depth + 1)
+        owner = stable_digest(fn.__self__)
+        if inner is None or owner is None:
+            return None
+        hasher.update(f"method:{inner}:{owner}".encode())
+        return hasher.hexdigest()
+
+    if isinstance(fn, types.FunctionType):
+        hasher.update(f"{fn.__module__}.{fn.__qualname__}".encode())
+        _code_digest(fn.__code__, hasher)
+
+        inputs = [fn.__defaults__, fn.__kwdefaults__]
+        if fn.__closure__:
+            try:
+                inputs.append([cell.cell_contents for cell in fn.__closure__])
+            except ValueError:
+                # Empty cell (variable not yet assigned)
+                return None
+
+        # Global names the code reads: functions by fingerprint, modules and
+        # classes by name, everything else by value
+        names = sorted(fn.__code__.co_names)
+        for name in names:
+            if name not in fn.__globals__:
+                continue
+            value = fn.__globals__[name]
+            if isinstance(value, types.ModuleType):
+                attrs = _module_attributes(value, names)
+                if attrs is None:
+                    return None
+                inputs.append((name, value.__name__, attrs))
+            elif isinstance(value, type):
+                inputs.append((name, f"{value.__module__}.{value.__qualname__}"))
+            elif isinstance(value, (types.FunctionType, functools.partial)):
+                inner = callable_fingerprint(value, _depth + 1)
+                if inner is None:
+                    return None
+                inputs.append((name, inner))
+            elif callable(value) and not hasattr(value, "__dict__"):
+                # Builtins and C functions
+                inputs.append((name, repr(value)))
+            else:
+                inputs.append((name, value))
+
+        digest = stable_digest(inputs)
+        if digest is None:
+            return None
+        hasher.update(digest.encode())
+        return hasher.hexdigest()
+
+    return stable_digest(fn)
+
+
+class PanelCache:
+    """Persistent, size-bounded cache of rendered panel files.
+
+    Entries are stored as ``<directory>/<key[:2]>/<key>.<ext>``. Retrieving
+    an entry hard-links it to the requested location (falling back to a
+    copy across filesystems) and marks it as recently used. When the cache
+    grows past ``max_bytes``, least recently used entries are evicted until
+    it is back under 90% of the limit.
+
+    The cache is safe to share between worker processes: entries are
+    written to a temporary file and renamed into place. Hit and miss
+    counters are per process.
+
+    Keys come from ``callable_fingerprint``, which sees the panel
+    function's code and the values it reads, one level deep. Changes it
+    cannot see still return the old panel: the body of a function in
+    another module called through a helper (only functions the panel
+    references directly are fingerprinted), callable objects described by
+    ``repr``, and files or other state read at render time. Call
+    ``clear()`` after such changes.
+
+    Args:
+        directory: Cache directory (created if needed)
+        max_bytes: Size limit in bytes. Default: 1 GiB
+
+    Example:
+        >>> cache = PanelCache('~/.cache/trelliscope/panels')
+        >>> manager = PanelManager(cache=cache)
+        >>> display.write(force=True, panel_manager=manager)
+        >>> cache.stats()['hits']
+        120
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 1 << 30
+    ):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+
+    def _entry(self, key: str) -> Optional[Path]:
+        """Return the cached file for key, or None."""
+        shard = self.directory / key[:2]
+        if not shard.is_dir():
+            return None
+        for entry in shard.glob(f"{key}.*"):
+            return entry
+        return None
+
+    @staticmethod
+    def _link_or_copy(src: Path, dest: Path) -> None:
+        """Hard-link src to dest, copying if linking is not possible."""
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copy2(src, dest)
+
+    def fetch(self, key: str, path: Path) -> Optional[Path]:
+        """Place a cached panel at path, if there is one.
+
+        Args:
+            key: Cache key
+            path: Base path for the panel (extension is taken from the entry)
+
+        Returns:
+            Path: Path of the placed panel file, or None on a cache miss
+        """
+        entry = self._entry(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        dest = Path(path).with_suffix(entry.suffix)
+        dest.unlink(missing_ok=True)
+        try:
+            self._link_or_copy(entry, dest)
+            os.utime(entry)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return dest
+
+    def store(self, key: str, path: Path) -> Path:
+        """Add a rendered panel file to the cache.
+
+        Args:
+            key: Cache key
+            path: Rendered panel file
+
+        Returns:
+            Path: Path of the cache entry
+        """
+        path = Path(path)
+        shard = self.directory / key[:2]
+        shard.mkdir(exist_ok=True)
+        entry = shard / f"{key}{path.suffix}"
+
+        tmp = shard / f".{key}.{os.getpid()}.tmp"
+        self._link_or_copy(path, tmp)
+        os.replace(tmp, entry)
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += entry.stat().st_size
+        if self._size > self.max_bytes:
+            self.evict()
+        return entry
+
+    def _entries(self):
+        """Yield (path, stat) for every cache entry."""
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    yield entry, entry.stat()
+                except FileNotFoundError:
+                    continue
+
+    def _scan_size(self) -> int:
+        """Total size of all entries in bytes."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries.
+
+        Args:
+            target_bytes: Size to shrink to. Default: 90% of max_bytes
+
+        Returns:
+            int: Number of entries removed
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+
+        entries = sorted(self._entries(), key=lambda item: item[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for entry, stat in entries:
+            if size <= target_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            size -= stat.st_size
+            removed += 1
+
+        self._size = size
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        for entry, _ in list(self._entries()):
+            entry.unlink(missing_ok=True)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics.
+
+        Returns:
+            dict: hits, misses, entries and bytes
+        """
+        entries = list(self._entries())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for _, stat in entries),
+        }
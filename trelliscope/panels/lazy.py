@@ -0,0 +1,212 @@
+"""Lazy panels built on demand from a plot function and a grouping key.
+
+Instead of storing a figure per row, a display's panel column can hold
+LazyPanel objects: a plot function plus the rows of the source data it
+should be applied to. Each figure is only built when its panel is
+rendered, and the PanelManager closes it right after saving, so peak
+memory does not grow with the number of panels.
+"""
+
+import hashlib
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _subset_digest(data: pd.DataFrame) -> Optional[str]:
+    """Hash the values of a panel's rows, ignoring their index.
+
+    Used for render cache keys, where the same rows must hash the same
+    wherever they sit in the source frame. Unlike
+    ``trelliscope.manifest.frame_digest``, the index is not hashed.
+
+    Args:
+        data: Rows to hash
+
+    Returns:
+        str: Hex digest, or None if the values cannot be hashed
+    """
+    from trelliscope.panels.cache import stable_digest
+
+    try:
+        hashes = pd.util.hash_pandas_object(data, index=False)
+        return hashlib.sha256(hashes.to_numpy().tobytes()).hexdigest()
+    except TypeError:
+        return stable_digest(data.reset_index(drop=True))
+
+
+class LazyPanel:
+    """Deferred panel: a plot function applied to a subset of rows.
+
+    Calling the panel builds the figure with ``func(subset, **kwargs)``.
+    The source frame is shared between all panels of a display, so a
+    LazyPanel only costs its row positions. A pickled LazyPanel (e.g. one
+    sent to a worker process) carries only its own rows.
+
+    Args:
+        func: Plot function taking a DataFrame and returning a figure
+        data: Source DataFrame
+        rows: Integer positions of this panel's rows in data. Default:
+            all rows
+        **kwargs: Extra keyword arguments passed to func
+
+    Example:
+        >>> panel = LazyPanel(plot_sales, sales, rows=[0, 1, 2])
+        >>> fig = panel()   # figure is built here
+    """
+
+    __slots__ = ("func", "data", "rows", "kwargs")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        data: pd.DataFrame,
+        rows: Optional[Union[Sequence[int], np.ndarray]] = None,
+        **kwargs
+    ):
+        if not callable(func):
+            raise TypeError(f"func must be callable, got {type(func).__name__}")
+        self.func = func
+        self.data = data
+        self.rows = None if rows is None else np.asarray(rows, dtype=np.intp)
+        self.kwargs = kwargs
+
+    def subset(self) -> pd.DataFrame:
+        """Return the rows this panel is built from.
+
+        Returns:
+            pd.DataFrame: Subset of the source data
+        """
+        if self.rows is None:
+            return self.data
+        return self.data.iloc[self.rows]
+
+    def __getstate__(self) -> dict:
+        # Ship only this panel's rows, not the shared source frame: worker
+        # chunks would otherwise each carry a full copy of the data
+        return {
+            "func": self.func,
+            "data": self.subset(),
+            "rows": None,
+            "kwargs": self.kwargs,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __call__(self) -> Any:
+        """Build the panel figure."""
+        return self.func(self.subset(), **self.kwargs)
+
+    def cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Key the panel by its plot function and the content of its rows.
+
+        Used by PanelCache, so an unchanged group is not re-rendered.
+
+        Returns:
+            tuple: Description of the panel's inputs, or None if they
+                cannot be fingerprinted
+        """
+        from trelliscope.panels.cache import callable_fingerprint, stable_digest
+
+        subset = self.subset()
+        key = (
+            callable_fingerprint(self.func),
+            _subset_digest(subset),
+            stable_digest(sorted(self.kwargs.items())),
+        )
+        if None in key:
+            return None
+        return key + (list(subset.columns), [str(d) for d in subset.dtypes])
+
+    def __len__(self) -> int:
+        return len(self.data) if self.rows is None else len(self.rows)
+
+    def __repr__(self) -> str:
+        name = getattr(self.func, "__qualname__", type(self.func).__name__)
+        return f"LazyPanel({name}, rows={len(self)})"
+
+
+def group_rows(
+    data: pd.DataFrame,
+    by: Union[str, List[str]]
+) -> Tuple[pd.DataFrame, List[np.ndarray]]:
+    """Find the row positions of each group.
+
+    Groups are computed in one vectorized pass (group numbers, then a
+    stable argsort), not by iterating over a groupby.
+
+    Args:
+        data: Source DataFrame
+        by: Column name or list of column names to group by
+
+    Returns:
+        tuple: (keys, rows) where keys is a DataFrame with one row per
+            group (sorted by key) and rows[i] holds the positions of group
+            i's rows in data. Rows with a missing key are left out.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    missing = [col for col in by if col not in data.columns]
+    if missing:
+        raise ValueError(
+            f"Grouping columns not found in DataFrame: {missing}. "
+            f"Available columns: {list(data.columns)}"
+        )
+
+    grouped = data.groupby(by, sort=True, observed=True)
+    keys = grouped.size().index.to_frame(index=False)
+
+    if len(keys) == 0:
+        # Empty data or only missing keys: np.split would return one group
+        return keys, []
+
+    codes = grouped.ngroup().to_numpy()
+    codes = np.where(np.isnan(codes), -1, codes).astype(np.intp)
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes[codes >= 0], minlength=len(keys))
+    start = len(codes) - counts.sum()    # skip rows with missing keys
+    bounds = start + np.cumsum(counts)[:-1]
+    rows = np.split(order[start:], bounds - start)
+
+    return keys, rows
+
+
+def facet_panels(
+    data: pd.DataFrame,
+    by: Union[str, List[str]],
+    plot_fn: Callable[..., Any],
+    panel_column: str = "panel",
+    **kwargs
+) -> pd.DataFrame:
+    """Build a one-row-per-panel frame of lazy panels from long data.
+
+    The Python equivalent of the R package's ``facet_panels``: the data is
+    split by the grouping columns and each group gets a LazyPanel that
+    applies plot_fn to the group's rows when the panel is rendered.
+
+    Args:
+        data: Long-format source DataFrame
+        by: Column name or list of column names to group by
+        plot_fn: Function taking a group's DataFrame and returning a figure
+        panel_column: Name of the panel column. Default: 'panel'
+        **kwargs: Extra keyword arguments passed to plot_fn
+
+    Returns:
+        pd.DataFrame: Grouping columns plus the panel column, one row per
+            group, sorted by key
+
+    Example:
+        >>> panels = facet_panels(sales, by=['country'], plot_fn=plot_sales)
+        >>> display = Display(panels, name='sales').set_panel_column('panel')
+    """
+    keys, rows = group_rows(data, by)
+    if panel_column in keys.columns:
+        raise ValueError(
+            f"panel_column '{panel_column}' clashes with a grouping column"
+        )
+    keys[panel_column] = [
+        LazyPanel(plot_fn, data, positions, **kwargs) for positions in rows
+    ]
+    return keys
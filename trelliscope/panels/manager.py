@@ -1,11 +1,57 @@
 """Panel manager for coordinating panel rendering adapters."""
 
+import hashlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Iterable, Tuple, Union
 
 from trelliscope.panels import PanelRenderer
+from trelliscope.panels.cache import PanelCache, callable_fingerprint
 from trelliscope.panels.matplotlib_adapter import MatplotlibAdapter
-from trelliscope.panels.plotly_adapter import PlotlyAdapter
+from trelliscope.panels.plotly_adapter import PlotlyAdapter, figure_sidecar_path
+
+
+@dataclass
+class PanelResult:
+    """Outcome of rendering a single panel.
+
+    Attributes:
+        panel_id: Identifier the panel was rendered under
+        path: Path to the saved panel file, or None if rendering failed
+        error: Error message if rendering failed, otherwise None
+        cached: True if the panel was served from the render cache
+    """
+
+    panel_id: str
+    path: Optional[Path] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the panel was rendered successfully."""
+        return self.error is None
+
+
+@dataclass
+class _PendingPanel:
+    """A panel that passed cache lookup and adapter detection.
+
+    Attributes:
+        panel_id: Identifier the panel is rendered under
+        obj: Object to save (the result of a callable panel)
+        owned: True if obj was created by the manager and must be released
+        adapter: Adapter that saves obj
+        panel_path: Base path for the panel file
+        cache_key: Render cache key to store the result under, or None
+    """
+
+    panel_id: str
+    obj: Any
+    owned: bool
+    adapter: PanelRenderer
+    panel_path: Path
+    cache_key: Optional[str] = None
 
 
 class PanelManager:
@@ -19,6 +65,21 @@ class PanelManager:
     This allows users to register custom adapters that take precedence over
     built-in ones.
 
+    With a PanelCache, panels whose content, adapter settings and library
+    version match a previous render are linked from the cache instead of
+    being rendered again.
+
+    save_panels() hands panels of adapters that support batching (e.g.
+    PlotlyAdapter with a static format) to the adapter in groups of
+    ``batch_size``, so per-call exporter start-up is paid once per group.
+    With parallel rendering each worker batches its own chunk.
+
+    Args:
+        cache: PanelCache, or a directory to create one in. Default: None
+            (no caching)
+        batch_size: Largest number of panels saved in one batch. 1 saves
+            every panel on its own. Default: 32
+
     Example:
         >>> from trelliscope.panels.manager import PanelManager
         >>> import matplotlib.pyplot as plt
@@ -33,7 +94,11 @@ class PanelManager:
         /tmp/plot1.png
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[Union[PanelCache, str, Path]] = None,
+        batch_size: int = 32
+    ):
         """Initialize PanelManager with default adapters.
 
         Default adapters (in order):
@@ -44,6 +109,10 @@ class PanelManager:
             MatplotlibAdapter(),
             PlotlyAdapter(),
         ]
+        if cache is not None and not isinstance(cache, PanelCache):
+            cache = PanelCache(cache)
+        self.cache: Optional[PanelCache] = cache
+        self.batch_size = batch_size
 
     def register_adapter(self, adapter: PanelRenderer, prepend: bool = True):
         """Register a new adapter.
@@ -95,6 +164,34 @@ class PanelManager:
 
         return None
 
+    def _cache_key(
+        self,
+        obj: Any,
+        adapter: Optional[PanelRenderer],
+        options: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build the render cache key for a panel.
+
+        Callables are keyed before they are called, from their code and
+        inputs together with every adapter's settings (the adapter is not
+        known until the callable runs). Figures are keyed by their content
+        and their adapter's settings.
+
+        Returns:
+            str: Hex cache key, or None if the panel is not cacheable
+        """
+        if adapter is None:
+            content = callable_fingerprint(obj)
+            settings = [a.cache_key() for a in self.adapters]
+        else:
+            content = adapter.fingerprint(obj)
+            settings = [adapter.cache_key()]
+        if content is None:
+            return None
+
+        key = repr((content, settings, sorted(options.items())))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
     def save_panel(
         self,
         obj: Any,
@@ -105,9 +202,13 @@ class PanelManager:
         """Save panel using the appropriate adapter.
 
         This is the main entry point for panel rendering. It:
-        1. Executes obj if it's a callable (lazy evaluation)
-        2. Detects the appropriate adapter
-        3. Saves the panel to output_dir/panel_id.{format}
+        1. Links the panel from the render cache, if enabled and it has
+           been rendered before
+        2. Executes obj if it's a callable (lazy evaluation)
+        3. Detects the appropriate adapter
+        4. Saves the panel to output_dir/panel_id.{format}
+        5. Releases (e.g. closes) the figure if it came from a callable,
+           so lazily built figures do not accumulate in memory
 
         Args:
             obj: Panel object (figure, chart, callable, etc.)
@@ -131,10 +232,47 @@ class PanelManager:
             ...     dpi=150
             ... )
         """
+        prepared = self._prepare_panel(obj, output_dir, panel_id, kwargs)
+        if isinstance(prepared, Path):
+            return prepared
+        return self._save_prepared(prepared, kwargs)
+
+    def _prepare_panel(
+        self,
+        obj: Any,
+        output_dir: Path,
+        panel_id: str,
+        options: Dict[str, Any]
+    ) -> Union[Path, _PendingPanel]:
+        """Run every step of save_panel() up to the adapter's save.
+
+        Returns:
+            Path of the panel placed from the render cache, or the panel
+            still to be saved
+
+        Raises:
+            ValueError: If the callable fails or no adapter can handle it
+        """
         # Create output directory if needed
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Create base path for panel
+        panel_path = output_dir / panel_id
+
+        # A figure sidecar from an earlier render would be stale: cache hits
+        # only place the panel file
+        figure_sidecar_path(panel_path).unlink(missing_ok=True)
+
+        # Callables are looked up before they are called
+        cache_key = None
+        if self.cache is not None and callable(obj):
+            cache_key = self._cache_key(obj, None, options)
+            if cache_key is not None:
+                cached_path = self.cache.fetch(cache_key, panel_path)
+                if cached_path is not None:
+                    return cached_path
+
         # Handle callables (lazy evaluation)
         original_obj = obj
         if callable(obj):
@@ -162,17 +300,165 @@ class PanelManager:
                 f"or register a custom adapter."
             )
 
-        # Create base path for panel
-        panel_path = output_dir / panel_id
-
-        # Save panel using adapter
+        pending = _PendingPanel(
+            panel_id, obj, obj is not original_obj, adapter, panel_path
+        )
+
+        if self.cache is not None and cache_key is None:
+            cache_key = self._cache_key(obj, adapter, options)
+            if cache_key is not None:
+                cached_path = self.cache.fetch(cache_key, panel_path)
+                if cached_path is not None:
+                    self._release(pending)
+                    return cached_path
+        pending.cache_key = cache_key
+
+        # Replace rather than overwrite previous output: it may be a hard
+        # link into the render cache
+        panel_format = options.get("format", adapter.get_format())
+        panel_path.with_suffix(f".{panel_format}").unlink(missing_ok=True)
+        return pending
+
+    def _save_prepared(
+        self, pending: _PendingPanel, options: Dict[str, Any]
+    ) -> Path:
+        """Save a prepared panel with its adapter and cache the result."""
         try:
-            saved_path = adapter.save(obj, panel_path, **kwargs)
-            return saved_path
+            saved_path = pending.adapter.save(
+                pending.obj, pending.panel_path, **options
+            )
         except Exception as e:
             raise Exception(
-                f"Failed to save panel '{panel_id}': {e}"
+                f"Failed to save panel '{pending.panel_id}': {e}"
             ) from e
+        finally:
+            self._release(pending)
+
+        return self._finish_panel(pending, saved_path)
+
+    @staticmethod
+    def _release(pending: _PendingPanel) -> None:
+        """Release a panel object the manager created from a callable."""
+        if pending.owned:
+            pending.adapter.release(pending.obj)
+
+    def _finish_panel(self, pending: _PendingPanel, saved_path: Path) -> Path:
+        """Add a saved panel to the render cache."""
+        if pending.cache_key is not None:
+            self.cache.store(pending.cache_key, saved_path)
+        return saved_path
+
+    def write_assets(self, output_dir: Path) -> None:
+        """Write the shared files of every adapter for an output directory.
+
+        Args:
+            output_dir: Directory panels are saved in
+        """
+        for adapter in self.adapters:
+            adapter.write_assets(Path(output_dir))
+
+    def save_panels(
+        self,
+        panels: Iterable[Tuple[str, Any]],
+        output_dir: Path,
+        **kwargs
+    ) -> List[PanelResult]:
+        """Save a batch of panels, collecting per-panel errors.
+
+        Unlike save_panel(), a failing panel does not abort the batch.
+        Its error message is recorded on the returned PanelResult and
+        rendering continues with the next panel. Panels of adapters that
+        support batching are saved ``batch_size`` at a time with
+        save_batch().
+
+        Args:
+            panels: Iterable of (panel_id, panel object) pairs
+            output_dir: Directory to save panels in
+            **kwargs: Additional options passed to adapter.save()
+
+        Returns:
+            List[PanelResult]: One result per panel, in input order
+
+        Example:
+            >>> manager = PanelManager()
+            >>> results = manager.save_panels(
+            ...     [('0', fig0), ('1', fig1)],
+            ...     Path('/tmp/panels')
+            ... )
+            >>> [r.ok for r in results]
+            [True, True]
+        """
+        results: List[Optional[PanelResult]] = []
+        # (result index, panel) pairs waiting for a batched save
+        batch: List[Tuple[int, _PendingPanel]] = []
+
+        for panel_id, obj in panels:
+            hits = self.cache.hits if self.cache is not None else 0
+            try:
+                prepared = self._prepare_panel(obj, output_dir, panel_id, kwargs)
+            except Exception as e:
+                results.append(PanelResult(panel_id, error=str(e)))
+                continue
+
+            if isinstance(prepared, Path):
+                cached = self.cache is not None and self.cache.hits > hits
+                results.append(PanelResult(panel_id, path=prepared, cached=cached))
+            elif self.batch_size > 1 and prepared.adapter.supports_batch(**kwargs):
+                batch.append((len(results), prepared))
+                results.append(None)
+                if len(batch) >= self.batch_size:
+                    self._save_batch(batch, results, kwargs)
+                    batch = []
+            else:
+                try:
+                    path = self._save_prepared(prepared, kwargs)
+                    results.append(PanelResult(panel_id, path=path))
+                except Exception as e:
+                    results.append(PanelResult(panel_id, error=str(e)))
+
+        if batch:
+            self._save_batch(batch, results, kwargs)
+        return results
+
+    def _save_batch(
+        self,
+        batch: List[Tuple[int, _PendingPanel]],
+        results: List[Optional[PanelResult]],
+        options: Dict[str, Any]
+    ) -> None:
+        """Save batched panels, one save_batch() call per adapter.
+
+        Fills in the results of the batched panels at their indices.
+        """
+        by_adapter: Dict[int, List[Tuple[int, _PendingPanel]]] = {}
+        for item in batch:
+            by_adapter.setdefault(id(item[1].adapter), []).append(item)
+
+        for items in by_adapter.values():
+            adapter = items[0][1].adapter
+            try:
+                outcomes = adapter.save_batch(
+                    [pending.obj for _, pending in items],
+                    [pending.panel_path for _, pending in items],
+                    **options
+                )
+            except Exception as e:
+                outcomes = [e] * len(items)
+            finally:
+                for _, pending in items:
+                    self._release(pending)
+
+            for (index, pending), outcome in zip(items, outcomes):
+                if isinstance(outcome, Exception):
+                    results[index] = PanelResult(
+                        pending.panel_id,
+                        error=f"Failed to save panel '{pending.panel_id}': {outcome}"
+                    )
+                else:
+                    results[index] = PanelResult(
+                        pending.panel_id,
+                        path=self._finish_panel(pending, outcome)
+                    )
 
     def get_panel_interface(self) -> Dict[str, Any]:
         """Get panelInterface configuration based on most common adapter.
@@ -1,9 +1,11 @@
 """Matplotlib adapter for panel rendering."""
 
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from trelliscope.panels import PanelRenderer
+from trelliscope.panels.template import TemplatePanel, write_rgba
 
 
 class MatplotlibAdapter(PanelRenderer):
@@ -12,10 +14,21 @@ class MatplotlibAdapter(PanelRenderer):
     Supports PNG, JPEG, SVG, and PDF formats. Uses matplotlib's
     savefig() method with sensible defaults.
 
+    Also renders TemplatePanel objects (see FigureTemplate), which reuse
+    one figure for all panels of a layout and are always drawn at the
+    template's fixed size.
+
+    With ``fast_path=True``, PNG and JPEG figures are drawn once on an
+    Agg canvas at their own size and encoded from the RGBA buffer,
+    skipping the extra draw ``bbox_inches='tight'`` needs. Panels are
+    then not cropped to their content.
+
     Args:
         format: Output format ('png', 'jpeg', 'svg', 'pdf'). Default: 'png'
         dpi: Resolution in dots per inch. Default: 100
         bbox_inches: Bounding box mode. Default: 'tight'
+        fast_path: Render figures at fixed geometry through the Agg
+            canvas. Default: False
 
     Example:
         >>> import matplotlib.pyplot as plt
@@ -34,7 +47,8 @@ class MatplotlibAdapter(PanelRenderer):
         self,
         format: str = "png",
         dpi: int = 100,
-        bbox_inches: str = "tight"
+        bbox_inches: str = "tight",
+        fast_path: bool = False
     ):
         """Initialize MatplotlibAdapter.
 
@@ -42,6 +56,7 @@ class MatplotlibAdapter(PanelRenderer):
             format: Output format. Default: 'png'
             dpi: Resolution. Default: 100
             bbox_inches: Bounding box mode. Default: 'tight'
+            fast_path: Fixed-geometry Agg rendering. Default: False
         """
         valid_formats = ["png", "jpeg", "jpg", "svg", "pdf"]
         if format not in valid_formats:
@@ -53,16 +68,19 @@ class MatplotlibAdapter(PanelRenderer):
         self.format = format
         self.dpi = dpi
         self.bbox_inches = bbox_inches
+        self.fast_path = fast_path
 
     def detect(self, obj: Any) -> bool:
-        """Detect matplotlib Figure objects.
+        """Detect matplotlib Figure objects and template panels.
 
         Args:
             obj: Object to check
 
         Returns:
-            bool: True if obj is a matplotlib Figure
+            bool: True if obj is a matplotlib Figure or a TemplatePanel
         """
+        if isinstance(obj, TemplatePanel):
+            return True
         try:
             import matplotlib.figure
             return isinstance(obj, matplotlib.figure.Figure)
@@ -72,10 +90,13 @@ class MatplotlibAdapter(PanelRenderer):
     def save(self, obj: Any, path: Path, **kwargs) -> Path:
         """Save matplotlib figure to file.
 
+        Template panels are drawn at their template's size and dpi.
+
         Args:
-            obj: matplotlib Figure to save
+            obj: matplotlib Figure or TemplatePanel to save
             path: Base path for output (extension added automatically)
-            **kwargs: Override default settings (dpi, format, bbox_inches)
+            **kwargs: Override default settings (dpi, format, bbox_inches,
+                fast_path)
 
         Returns:
             Path: Path to saved file with extension
@@ -97,6 +118,13 @@ class MatplotlibAdapter(PanelRenderer):
         # Create output path with extension
         output_path = path.with_suffix(f".{format}")
 
+        if isinstance(obj, TemplatePanel):
+            return obj.template.save(obj.data, output_path, format=format)
+
+        if kwargs.get("fast_path", self.fast_path) and format in ("png", "jpeg", "jpg"):
+            write_rgba(self._draw(obj, dpi), output_path, format)
+            return output_path
+
         # Save figure
         obj.savefig(
             output_path,
@@ -107,6 +135,71 @@ class MatplotlibAdapter(PanelRenderer):
 
         return output_path
 
+    @staticmethod
+    def _draw(fig: Any, dpi: int):
+        """Draw a figure on an Agg canvas and return its RGBA pixels.
+
+        A figure with another canvas (e.g. from an interactive or pgf
+        backend) gets its original canvas back afterwards.
+        """
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        original_canvas = fig.canvas
+        canvas = original_canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            # The constructor attaches itself to fig; undone below
+            canvas = FigureCanvasAgg(fig)
+        original_dpi = fig.dpi
+        fig.dpi = dpi
+        try:
+            canvas.draw()
+            return np.asarray(canvas.buffer_rgba())
+        finally:
+            fig.dpi = original_dpi
+            if canvas is not original_canvas:
+                fig.set_canvas(original_canvas)
+
+    def release(self, obj: Any) -> None:
+        """Close the figure so pyplot drops its reference to it.
+
+        Template panels share their template's figure and are not closed.
+
+        Args:
+            obj: matplotlib Figure that was just saved
+        """
+        if isinstance(obj, TemplatePanel):
+            return
+        plt = sys.modules.get("matplotlib.pyplot")
+        if plt is not None:
+            plt.close(obj)
+
+    def cache_key(self) -> str:
+        """Return adapter settings plus the matplotlib version.
+
+        Returns:
+            str: Cache key component for this adapter
+        """
+        import matplotlib
+        return f"{super().cache_key()}:matplotlib={matplotlib.__version__}"
+
+    def fingerprint(self, obj: Any) -> Optional[str]:
+        """Hash the figure's pickled state (artists, data, styling).
+
+        Template panels are hashed from their template and data.
+
+        Args:
+            obj: matplotlib Figure or TemplatePanel
+
+        Returns:
+            str: Hex digest, or None if the figure cannot be pickled
+        """
+        from trelliscope.panels.cache import stable_digest
+        if isinstance(obj, TemplatePanel):
+            key = obj.cache_key()
+            return None if key is None else stable_digest(key)
+        return stable_digest(obj)
+
     def get_interface_type(self) -> str:
         """Return panelInterface type.
 
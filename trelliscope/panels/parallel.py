@@ -0,0 +1,216 @@
+"""Parallel panel rendering across worker processes.
+
+Rendering is embarrassingly parallel: every panel is saved independently
+under its own panel ID. This module splits the panels into chunks and
+hands each chunk to a worker, which renders it with its own PanelManager
+using the non-interactive Agg backend.
+"""
+
+import math
+import os
+import pickle
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from trelliscope.panels.manager import PanelManager, PanelResult
+
+
+# PanelManager installed in each worker process by _init_worker()
+_worker_manager: Optional[PanelManager] = None
+
+
+def _init_worker(manager: PanelManager) -> None:
+    """Configure a freshly started worker process.
+
+    Args:
+        manager: PanelManager to render with in this worker
+    """
+    global _worker_manager
+
+    # Workers never display figures; Agg avoids GUI toolkit start-up
+    os.environ["MPLBACKEND"] = "Agg"
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+    except ImportError:
+        pass
+
+    _worker_manager = manager
+
+
+def _is_shipping_error(error: BaseException) -> bool:
+    """Check whether a chunk failed to reach or come back from a worker.
+
+    Args:
+        error: Exception raised by the chunk's future
+
+    Returns:
+        bool: True for pickling errors and broken worker pools
+    """
+    if isinstance(error, (pickle.PicklingError, BrokenProcessPool)):
+        return True
+    # e.g. "Can't pickle local object" or "cannot pickle '_thread.lock'"
+    return isinstance(error, (TypeError, AttributeError)) and "pickle" in str(error)
+
+
+def _render_chunk(
+    chunk: Sequence[Tuple[str, Any]],
+    output_dir: Path,
+    manager: Optional[PanelManager] = None
+) -> List[PanelResult]:
+    """Render one chunk of panels inside a worker.
+
+    Args:
+        chunk: (panel_id, panel object) pairs
+        output_dir: Directory to save panels in
+        manager: PanelManager to use. Defaults to the worker's manager.
+
+    Returns:
+        List[PanelResult]: Results for the chunk, in input order
+    """
+    if manager is None:
+        manager = _worker_manager or PanelManager()
+    return manager.save_panels(chunk, output_dir)
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Normalize a ``workers`` argument to a process count.
+
+    Args:
+        workers: None or 1 for serial rendering, -1 (or 0) for one
+            worker per CPU, otherwise the number of worker processes
+
+    Returns:
+        int: Number of workers (1 means render serially)
+
+    Raises:
+        ValueError: If workers is negative and not -1
+    """
+    if workers is None:
+        return 1
+    if workers in (0, -1):
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError(f"workers must be >= -1, got {workers}")
+    return workers
+
+
+def render_panels(
+    panels: Sequence[Tuple[str, Any]],
+    output_dir: Path,
+    manager: Optional[PanelManager] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None
+) -> List[PanelResult]:
+    """Render panels serially or across a pool of workers.
+
+    Panels are split into chunks of consecutive panels. Each chunk is
+    rendered by one worker, and results are returned in input order
+    regardless of completion order, so panel IDs and the detected panel
+    format are deterministic.
+
+    A chunk that cannot be sent to a worker (for example because a panel
+    is a lambda that cannot be pickled), or whose worker crashed, is
+    rendered in this process instead, so a mixed display still renders
+    completely; a RuntimeWarning reports the fallback. Any other error
+    from a chunk is reported as a failure of each of its panels.
+
+    Args:
+        panels: (panel_id, panel object) pairs
+        output_dir: Directory to save panels in
+        manager: PanelManager to render with. Default: PanelManager()
+        workers: Number of worker processes. None or 1 renders serially,
+            -1 uses one worker per CPU. With an executor, only used to
+            size chunks (default: one worker per CPU).
+        executor: Existing concurrent.futures Executor to submit chunks
+            to. The caller is responsible for shutting it down.
+        chunksize: Panels per chunk. Default: about four chunks per worker,
+            capped at 64 panels.
+
+    Returns:
+        List[PanelResult]: One result per panel, in input order
+
+    Example:
+        >>> results = render_panels(
+        ...     [('0', fig0), ('1', fig1)],
+        ...     Path('/tmp/panels'),
+        ...     workers=4
+        ... )
+        >>> [r.path.name for r in results]
+        ['0.png', '1.png']
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if manager is None:
+        manager = PanelManager()
+    # Shared files are written once here, not by every worker
+    manager.write_assets(output_dir)
+
+    n_workers = resolve_workers(workers)
+    if executor is None and (n_workers <= 1 or len(panels) <= 1):
+        return manager.save_panels(panels, output_dir)
+
+    if chunksize is None:
+        if executor is not None and workers is None:
+            # An executor's size is not public; assume one worker per CPU
+            n_slots = resolve_workers(-1)
+        else:
+            n_slots = n_workers
+        slots = n_slots * 4
+        chunksize = min(64, max(1, math.ceil(len(panels) / slots)))
+    chunks = [
+        list(panels[i:i + chunksize])
+        for i in range(0, len(panels), chunksize)
+    ]
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(manager,)
+        )
+
+    try:
+        if owns_executor:
+            futures = [
+                executor.submit(_render_chunk, chunk, output_dir)
+                for chunk in chunks
+            ]
+        else:
+            futures = [
+                executor.submit(_render_chunk, chunk, output_dir, manager)
+                for chunk in chunks
+            ]
+
+        results: List[PanelResult] = []
+        fallback_errors = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                if not _is_shipping_error(e):
+                    results.extend(
+                        PanelResult(panel_id, error=str(e)) for panel_id, _ in chunk
+                    )
+                    continue
+                # Chunk could not be shipped to (or crashed) a worker
+                fallback_errors.append(e)
+                results.extend(manager.save_panels(chunk, output_dir))
+
+        if fallback_errors:
+            warnings.warn(
+                f"{len(fallback_errors)} of {len(chunks)} panel chunks could "
+                f"not be rendered by worker processes and were rendered "
+                f"serially in this process: {fallback_errors[0]!r}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return results
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True)
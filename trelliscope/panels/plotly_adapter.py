@@ -1,25 +1,100 @@
 """Plotly adapter for panel rendering."""
 
 from pathlib import Path
-from typing import Any
+import hashlib
+import json
+import os
+from typing import Any, List, Optional, Union
 
 from trelliscope.panels import PanelRenderer
 
+#: Suffix of the figure JSON written next to each HTML panel
+FIGURE_SIDECAR_SUFFIX = ".figure.json"
+
+#: include_plotlyjs mode referencing one local plotly.js per display
+SHARED_PLOTLYJS = "shared"
+
+
+def plotlyjs_bundle_name() -> str:
+    """Return the file name of the local plotly.js bundle.
+
+    The name carries the plotly.js version, so panels written by a newer
+    plotly never load an older bundle left in the directory.
+
+    Returns:
+        str: Bundle file name (e.g. 'plotly-2.35.2.min.js')
+    """
+    from plotly.offline import get_plotlyjs_version
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+def write_plotlyjs_bundle(directory: Path) -> Path:
+    """Write the plotly.js bundle into a directory, unless it is there.
+
+    The file is written under a temporary name and moved into place, so
+    concurrent writers and readers never see a partial bundle.
+
+    Args:
+        directory: Directory to write the bundle to
+
+    Returns:
+        Path: Path of the bundle
+    """
+    bundle = Path(directory) / plotlyjs_bundle_name()
+    if bundle.exists():
+        return bundle
+
+    from plotly.offline import get_plotlyjs
+
+    bundle.parent.mkdir(parents=True, exist_ok=True)
+    tmp = bundle.with_name(f".{bundle.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(get_plotlyjs(), encoding="utf-8")
+        os.replace(tmp, bundle)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return bundle
+
+
+def figure_sidecar_path(path: Path) -> Path:
+    """Return the figure JSON sidecar path of an HTML panel.
+
+    Args:
+        path: Panel path, with or without its extension
+
+    Returns:
+        Path: Sidecar path (e.g. panels/0.figure.json for panels/0.html)
+    """
+    path = Path(path)
+    return path.with_name(f"{path.stem}{FIGURE_SIDECAR_SUFFIX}")
+
 
 class PlotlyAdapter(PanelRenderer):
     """Adapter for rendering plotly figures to HTML or static images.
 
     Supports HTML (with CDN plotly.js), PNG, JPEG, SVG, and PDF formats.
     HTML is the default and recommended format for interactive plots.
+    HTML panels are written together with the figure's JSON specification
+    (``<panel>.figure.json``), which viewers can load directly instead of
+    parsing it back out of the HTML.
+
+    With ``include_plotlyjs='shared'``, plotly.js is written once to the
+    parent of the panel directory (the display directory) and every HTML
+    panel references it by relative path. Panels then load without network
+    access, and a page of iframe panels fetches a single cached script
+    instead of one copy per panel.
 
     Static image export (PNG, JPEG, SVG, PDF) requires the kaleido
     package to be installed.
 
     Args:
         format: Output format ('html', 'png', 'jpeg', 'svg', 'pdf'). Default: 'html'
-        include_plotlyjs: How to include plotly.js in HTML ('cdn', True, False). Default: 'cdn'
+        include_plotlyjs: How to include plotly.js in HTML ('cdn', 'shared', True, False).
+            Default: 'cdn'
         width: Width in pixels for static exports. Default: None (use figure default)
         height: Height in pixels for static exports. Default: None (use figure default)
+        figure_sidecar: Write the figure JSON next to HTML panels. Default: True
 
     Example:
         >>> import plotly.graph_objects as go
@@ -38,7 +113,8 @@ class PlotlyAdapter(PanelRenderer):
         format: str = "html",
         include_plotlyjs: str = "cdn",
         width: int = None,
-        height: int = None
+        height: int = None,
+        figure_sidecar: bool = True
     ):
         """Initialize PlotlyAdapter.
 
@@ -47,6 +123,7 @@ class PlotlyAdapter(PanelRenderer):
             include_plotlyjs: Plotly.js inclusion mode. Default: 'cdn'
             width: Width for static exports. Default: None
             height: Height for static exports. Default: None
+            figure_sidecar: Write figure JSON next to HTML panels. Default: True
         """
         valid_formats = ["html", "png", "jpeg", "jpg", "svg", "pdf"]
         if format not in valid_formats:
@@ -59,6 +136,7 @@ class PlotlyAdapter(PanelRenderer):
         self.include_plotlyjs = include_plotlyjs
         self.width = width
         self.height = height
+        self.figure_sidecar = figure_sidecar
 
     def detect(self, obj: Any) -> bool:
         """Detect plotly Figure objects.
@@ -90,7 +168,10 @@ class PlotlyAdapter(PanelRenderer):
     def save(self, obj: Any, path: Path, **kwargs) -> Path:
         """Save plotly figure to file.
 
-        For HTML format, saves interactive plot with plotly.js from CDN.
+        For HTML format, saves interactive plot with plotly.js from CDN,
+        plus the figure JSON sidecar if enabled. With
+        ``include_plotlyjs='shared'``, the HTML references the local
+        plotly.js bundle, which is written if it is not there yet.
         For static formats (PNG, JPEG, SVG, PDF), requires kaleido package.
 
         Args:
@@ -125,11 +206,16 @@ class PlotlyAdapter(PanelRenderer):
         # Save based on format
         if format == "html":
             include_plotlyjs = kwargs.get("include_plotlyjs", self.include_plotlyjs)
+            if include_plotlyjs == SHARED_PLOTLYJS:
+                bundle = write_plotlyjs_bundle(output_path.parent.parent)
+                include_plotlyjs = f"../{bundle.name}"
             pio.write_html(
                 obj,
                 output_path,
                 include_plotlyjs=include_plotlyjs
             )
+            if self.figure_sidecar:
+                self._write_sidecar(obj, output_path)
         else:
             # Static image export (requires kaleido)
             try:
@@ -150,6 +236,116 @@ class PlotlyAdapter(PanelRenderer):
 
         return output_path
 
+    def supports_batch(self, **kwargs) -> bool:
+        """Batch static image exports.
+
+        Args:
+            **kwargs: Options the figures would be saved with
+
+        Returns:
+            bool: True for static formats, False for HTML
+        """
+        return kwargs.get("format", self.format) != "html"
+
+    def save_batch(
+        self, objs: List[Any], paths: List[Path], **kwargs
+    ) -> List[Union[Path, Exception]]:
+        """Export several figures to static images in one Kaleido call.
+
+        ``plotly.io.write_images`` renders all figures in a single exporter
+        session and writes each file as it is done, instead of starting an
+        export per figure. If the batch fails (e.g. Kaleido older than 1.0,
+        or one invalid figure), the figures are saved one by one so each
+        error is reported against its own figure.
+
+        Args:
+            objs: plotly Figures or dict specs
+            paths: Base path for each figure (extension added automatically)
+            **kwargs: Override default settings (format, width, height)
+
+        Returns:
+            List: For each figure, the saved path or the exception raised
+        """
+        format = kwargs.get("format", self.format)
+        if format == "html":
+            return super().save_batch(objs, paths, **kwargs)
+
+        import plotly.io as pio
+
+        output_paths = [Path(path).with_suffix(f".{format}") for path in paths]
+        try:
+            if not all(self.detect(obj) for obj in objs):
+                raise ValueError("Batch contains objects that are not plotly Figures")
+            pio.write_images(
+                list(objs),
+                output_paths,
+                format=format,
+                width=kwargs.get("width", self.width),
+                height=kwargs.get("height", self.height),
+            )
+        except Exception:
+            return super().save_batch(objs, paths, **kwargs)
+        return output_paths
+
+    def write_assets(self, output_dir: Path) -> None:
+        """Write the shared plotly.js bundle, if panels reference it.
+
+        Args:
+            output_dir: Directory panels are saved in. The bundle goes to
+                its parent, the display directory.
+        """
+        if self.format == "html" and self.include_plotlyjs == SHARED_PLOTLYJS:
+            write_plotlyjs_bundle(Path(output_dir).parent)
+
+    @staticmethod
+    def _write_sidecar(obj: Any, output_path: Path) -> None:
+        """Write the figure JSON next to an HTML panel.
+
+        The file is written under a temporary name and moved into place,
+        so a reader never sees a partial sidecar.
+
+        Args:
+            obj: plotly Figure or dict spec
+            output_path: Path of the saved HTML panel
+        """
+        import plotly.io as pio
+
+        sidecar = figure_sidecar_path(output_path)
+        tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(pio.to_json(obj, validate=False), encoding="utf-8")
+            os.replace(tmp, sidecar)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def cache_key(self) -> str:
+        """Return adapter settings plus the plotly version.
+
+        Returns:
+            str: Cache key component for this adapter
+        """
+        import plotly
+        return f"{super().cache_key()}:plotly={plotly.__version__}"
+
+    def fingerprint(self, obj: Any) -> Optional[str]:
+        """Hash the figure's JSON specification.
+
+        Args:
+            obj: plotly Figure or dict spec
+
+        Returns:
+            str: Hex digest, or None if the spec cannot be serialized
+        """
+        try:
+            if isinstance(obj, dict):
+                spec = json.dumps(obj, sort_keys=True, default=str)
+            else:
+                spec = obj.to_json()
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
     def get_interface_type(self) -> str:
         """Return panelInterface type.
 
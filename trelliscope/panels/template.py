@@ -0,0 +1,230 @@
+"""Reusable matplotlib figure templates for panels that share a layout.
+
+Building a new Figure per panel and saving it with
+``savefig(bbox_inches='tight')`` repeats the same work for every panel:
+axes, ticks and text are created from scratch, and the tight bounding box
+needs an extra draw. When panels only differ in their data, a
+FigureTemplate builds the figure once per process and each panel only
+updates its artists. Panels are then drawn once at the template's fixed
+size on an Agg canvas and written as PNG straight from the RGBA buffer.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+import pandas as pd
+
+
+class FigureTemplate:
+    """One matplotlib figure reused for every panel of the same layout.
+
+    ``setup(fig)`` builds the axes and artists once per process and
+    returns them (any object, e.g. a tuple or dict of artists).
+    ``update(artists, data)`` changes them to show one panel's data, e.g.
+    with ``Line2D.set_data``, ``ax.set_title`` and ``ax.autoscale_view``.
+    Anything ``update`` does not change carries over from the previous
+    panel.
+
+    Panels are drawn at ``figsize`` and ``dpi`` without a tight bounding
+    box, so labels must fit inside the figure (use
+    ``fig.subplots_adjust`` or ``layout="constrained"`` in ``setup``).
+    The figure never goes through pyplot. Templates are picklable if
+    ``setup`` and ``update`` are module-level functions; each worker
+    process then builds its own figure.
+
+    Args:
+        setup: Function building the figure's content, called with the
+            empty Figure. Its return value is passed to update.
+        update: Function updating the artists with one panel's data
+        figsize: Figure size (width, height) in inches. Default: (6.4, 4.8)
+        dpi: Resolution in dots per inch. Default: 100
+        compress_level: zlib level of written PNGs (0-9). Low levels
+            write faster and produce larger files. Default: 1
+
+    Example:
+        >>> def setup(fig):
+        ...     ax = fig.add_subplot()
+        ...     line, = ax.plot([], [])
+        ...     return ax, line
+        >>>
+        >>> def update(artists, df):
+        ...     ax, line = artists
+        ...     line.set_data(df["date"], df["value"])
+        ...     ax.relim()
+        ...     ax.autoscale_view()
+        >>>
+        >>> template = FigureTemplate(setup, update, figsize=(4, 3))
+        >>> display = Display.from_groupby(
+        ...     sales, by="store", plot_fn=template.panel, name="sales"
+        ... )
+    """
+
+    def __init__(
+        self,
+        setup: Callable[[Any], Any],
+        update: Callable[[Any, Any], None],
+        figsize: Tuple[float, float] = (6.4, 4.8),
+        dpi: int = 100,
+        compress_level: int = 1
+    ):
+        if not callable(setup) or not callable(update):
+            raise TypeError("setup and update must be callable")
+        self.setup = setup
+        self.update = update
+        self.figsize = (float(figsize[0]), float(figsize[1]))
+        self.dpi = dpi
+        self.compress_level = compress_level
+        self._figure = None
+        self._canvas = None
+        self._artists = None
+
+    def __getstate__(self):
+        # The figure is rebuilt in the receiving process
+        state = self.__dict__.copy()
+        state.update(_figure=None, _canvas=None, _artists=None)
+        return state
+
+    def panel(self, data: Any) -> "TemplatePanel":
+        """Create a panel showing data with this template.
+
+        Can be passed as ``plot_fn`` to ``Display.from_groupby``.
+
+        Args:
+            data: Panel data, passed to update
+
+        Returns:
+            TemplatePanel: Panel rendered by MatplotlibAdapter
+        """
+        return TemplatePanel(self, data)
+
+    def _ensure_figure(self):
+        """Build the figure, its canvas and artists on first use."""
+        if self._figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            figure = Figure(figsize=self.figsize, dpi=self.dpi)
+            canvas = FigureCanvasAgg(figure)
+            self._artists = self.setup(figure)
+            self._figure, self._canvas = figure, canvas
+        return self._figure
+
+    def draw(self, data: Any):
+        """Update the figure with data and draw it.
+
+        Args:
+            data: Panel data, passed to update
+
+        Returns:
+            numpy.ndarray: RGBA pixels (height x width x 4), valid until
+                the next draw
+        """
+        import numpy as np
+
+        self._ensure_figure()
+        self.update(self._artists, data)
+        self._canvas.draw()
+        return np.asarray(self._canvas.buffer_rgba())
+
+    def save(self, data: Any, output_path: Path, format: str = "png") -> Path:
+        """Render a panel to a file.
+
+        PNG and JPEG are encoded from the RGBA buffer with Pillow; other
+        formats are written by ``Figure.savefig`` at the fixed size.
+
+        Args:
+            data: Panel data, passed to update
+            output_path: Output file path, including extension
+            format: Output format. Default: 'png'
+
+        Returns:
+            Path: output_path
+        """
+        if format in ("png", "jpeg", "jpg"):
+            write_rgba(self.draw(data), output_path, format, self.compress_level)
+        else:
+            figure = self._ensure_figure()
+            self.update(self._artists, data)
+            figure.savefig(output_path, format=format, dpi=self.dpi)
+        return output_path
+
+    def cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Key the template by its functions and geometry.
+
+        Returns:
+            tuple: Description of the template, or None if setup or update
+                cannot be fingerprinted
+        """
+        from trelliscope.panels.cache import callable_fingerprint
+
+        key = (
+            callable_fingerprint(self.setup),
+            callable_fingerprint(self.update),
+        )
+        if None in key:
+            return None
+        return key + (self.figsize, self.dpi, self.compress_level)
+
+    def __repr__(self) -> str:
+        name = getattr(self.update, "__qualname__", type(self.update).__name__)
+        return f"FigureTemplate({name}, figsize={self.figsize}, dpi={self.dpi})"
+
+
+class TemplatePanel:
+    """A panel drawn by a FigureTemplate from its data.
+
+    Args:
+        template: Template drawing the panel
+        data: Panel data, passed to the template's update function
+    """
+
+    __slots__ = ("template", "data")
+
+    def __init__(self, template: FigureTemplate, data: Any):
+        self.template = template
+        self.data = data
+
+    def cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Key the panel by its template and the content of its data.
+
+        Returns:
+            tuple: Description of the panel, or None if it cannot be
+                fingerprinted
+        """
+        from trelliscope.panels.cache import stable_digest
+        from trelliscope.panels.lazy import _subset_digest
+
+        template_key = self.template.cache_key()
+        if isinstance(self.data, pd.DataFrame):
+            content = _subset_digest(self.data)
+        else:
+            content = stable_digest(self.data)
+        if template_key is None or content is None:
+            return None
+        return template_key + (content,)
+
+    def __repr__(self) -> str:
+        return f"TemplatePanel({self.template!r})"
+
+
+def write_rgba(
+    pixels: Any,
+    output_path: Path,
+    format: str = "png",
+    compress_level: int = 1
+) -> None:
+    """Encode an RGBA pixel buffer as PNG or JPEG.
+
+    Args:
+        pixels: RGBA array (height x width x 4, uint8)
+        output_path: Output file path
+        format: 'png', 'jpeg' or 'jpg'. Default: 'png'
+        compress_level: zlib level for PNG (0-9). Default: 1
+    """
+    from PIL import Image
+
+    image = Image.fromarray(pixels, "RGBA")
+    if format == "png":
+        image.save(output_path, format="PNG", compress_level=compress_level)
+    else:
+        image.convert("RGB").save(output_path, format="JPEG", quality=90)
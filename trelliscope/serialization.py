@@ -4,12 +4,37 @@ JSON serialization for trelliscope displays.
 Converts Display objects to displayInfo.json format for the JavaScript viewer.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO
+import gzip
 import json
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 
-def serialize_display_info(display) -> Dict[str, Any]:
+from trelliscope.meta import level_code_map
+
+
+# Rows serialized per write when streaming metaData.json / metaData.js
+METADATA_CHUNK_SIZE = 10000
+
+# Every file write_metadata_json / write_metadata_js can produce
+METADATA_FILES = ("metaData.json", "metaData.json.gz", "metaData.js", "metaData.js.gz")
+
+# Equal-width bins in the numeric histograms stored in cogDistns
+COG_DISTN_BINS = 30
+
+# Most frequent values stored in cogDistns for string metas
+COG_DISTN_TOP_VALUES = 100
+
+
+def serialize_display_info(
+    display,
+    cog_columns: Optional[Dict[str, List[Any]]] = None,
+    embed_cog_data: bool = True,
+    cog_data_file: str = "metaData.json",
+    cog_distns: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Serialize Display to displayInfo.json format.
 
@@ -19,6 +44,19 @@ def serialize_display_info(display) -> Dict[str, Any]:
     ----------
     display : Display
         Display object to serialize.
+    cog_columns : dict, optional
+        Prebuilt cogData columns from ``build_cog_columns``. Built from
+        ``display`` if not given.
+    embed_cog_data : bool, default=True
+        If True, embed the cogData array. If False, leave it out and record
+        the external file holding it under ``cogDataFile`` instead, so
+        displayInfo.json only carries the schema and state.
+    cog_data_file : str, default="metaData.json"
+        Name of the external cogData file, relative to displayInfo.json.
+        Only used when ``embed_cog_data`` is False.
+    cog_distns : dict, optional
+        Prebuilt filter distributions from ``build_cog_distns``. Built from
+        ``display`` if not given.
 
     Returns
     -------
@@ -152,9 +190,6 @@ def serialize_display_info(display) -> Dict[str, Any]:
         "log": None,
     }
 
-    # Generate cogData from DataFrame
-    cog_data = _serialize_cog_data(display)
-
     # Build top-level panelInterface
     panel_interface_dict = None
     if display.panel_column is not None:
@@ -203,8 +238,9 @@ def serialize_display_info(display) -> Dict[str, Any]:
             "type": "JSON",
         },
         "cogInfo": cog_info,
-        "cogDistns": {},
-        "cogData": cog_data,
+        "cogDistns": (
+            build_cog_distns(display) if cog_distns is None else cog_distns
+        ),
         "state": {
             "layout": display.state["layout"].copy(),
             "labels": display.state["labels"].copy(),
@@ -215,6 +251,12 @@ def serialize_display_info(display) -> Dict[str, Any]:
         "imgSrcLookup": {},
     }
 
+    # cogData is either embedded or referenced by file name
+    if embed_cog_data:
+        info["cogData"] = _serialize_cog_data(display, cog_columns)
+    else:
+        info["cogDataFile"] = cog_data_file
+
     # Set primary panel and panelInterface if panel column is set
     if display.panel_column is not None:
         info["primarypanel"] = display.panel_column
@@ -224,168 +266,471 @@ def serialize_display_info(display) -> Dict[str, Any]:
     return info
 
 
-def _serialize_cog_data(display) -> List[Dict[str, Any]]:
+def build_cog_columns(display, rows: Optional[slice] = None) -> Dict[str, List[Any]]:
     """
-    Generate cogData array from Display's DataFrame.
+    Convert the Display's DataFrame to JSON-ready cogData columns.
 
-    Converts DataFrame rows to cogData objects with panel references.
-    For file-based panels, uses relative paths like "panels/0.png".
+    Works a column at a time rather than a row at a time: values are
+    converted to Python native types in bulk, datetimes are formatted as
+    whole columns, missing values (NaN, NaT, None) become None, and factor
+    values are mapped to 1-based level indices once per distinct value.
+    Converting every row holds all cogData as Python objects; when cogData
+    is embedded in displayInfo.json the result is shared with metaData.json
+    and metaData.js so the DataFrame is only walked once per write.
 
     Parameters
     ----------
     display : Display
         Display object with data.
+    rows : slice, optional
+        Positional range of rows to convert. Defaults to all rows.
 
     Returns
     -------
-    list of dict
-        cogData array with panel references and metadata.
+    dict
+        Mapping of variable name to list of values, one per row, in meta
+        variable order, followed by ``panelKey`` (the DataFrame index as
+        strings). Panel references are not included.
     """
-    from trelliscope.panel_interface import RESTPanelInterface
+    data = display.data
+    if rows is None:
+        rows = slice(None)
+    columns = {}
+
+    for varname, meta in display._meta_vars.items():
+        if varname not in data.columns:
+            continue
+        series = data[varname].iloc[rows]
+        if meta.type == "factor":
+            columns[varname] = _factor_column(series, meta)
+        else:
+            columns[varname] = _native_column(series)
 
-    cog_data = []
-
-    for idx, row in display.data.iterrows():
-        # Build cogData entry for this row
-        entry = {}
-
-        # Add all meta variable values
-        for varname in display._meta_vars.keys():
-            if varname in row:
-                value = row[varname]
-                # Convert numpy/pandas types to Python native types
-                if hasattr(value, 'item'):
-                    value = value.item()
-                # Convert pd.Timestamp to ISO format string
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-
-                # CRITICAL: Convert factor indices from 0-based to 1-based (R-style)
-                # The trelliscopejs viewer expects R-style 1-based factor indexing
-                # where levels[1-1] = levels[0] = first level
-                meta = display._meta_vars.get(varname)
-                if meta and meta.type == "factor":
-                    if isinstance(value, (int, float)) and not (isinstance(value, float) and value != value):
-                        # Numeric categorical code (0, 1, 2...) but not NaN
-                        # Note: NaN != NaN, so we check for that
-                        value = int(value) + 1  # Convert 0-based to 1-based
-                    elif isinstance(value, str) and hasattr(meta, 'levels') and meta.levels:
-                        # String value - look up index in levels and convert to 1-based
-                        try:
-                            idx = meta.levels.index(value)
-                            value = idx + 1  # Convert to 1-based index
-                        except (ValueError, AttributeError):
-                            # Keep string value if not in levels
-                            pass
-                    # NaN/None values are kept as-is
-
-                entry[varname] = value
-
-        # Add panelKey (using index as panel ID)
-        panel_id = str(idx)
-        entry["panelKey"] = panel_id
-
-        # Add panel reference
-        if display.panel_column is not None:
-            if isinstance(display.panel_interface, RESTPanelInterface):
-                # For REST panels, panel value is the endpoint path
-                entry[display.panel_column] = f"/panels/{panel_id}"
+    columns["panelKey"] = [str(idx) for idx in data.index[rows]]
+    return columns
+
+
+def build_cog_distns(
+    display,
+    bins: int = COG_DISTN_BINS,
+    top_values: int = COG_DISTN_TOP_VALUES,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Precompute per-meta value distributions for filter widgets.
+
+    Stored under ``cogDistns`` in displayInfo.json so viewers can draw
+    filter controls (factor counts, histograms, date ranges) without
+    scanning cogData. Each entry has the meta ``type``, the number of
+    non-missing values ``n`` and ``n_missing``, plus:
+
+    - factor: ``dist``, count per level in level order
+    - number, currency: ``range`` [min, max] and ``dist`` with histogram
+      ``breaks`` (bins + 1 edges) and ``freq`` (bins counts)
+    - date, time: ``range`` [min, max] as ISO 8601 strings
+    - string: ``n_distinct`` and ``dist``, the counts of the
+      ``top_values`` most frequent values
+
+    Parameters
+    ----------
+    display : Display
+        Display object with data and meta variables.
+    bins : int, default=30
+        Number of equal-width histogram bins for numeric metas.
+    top_values : int, default=100
+        Number of most frequent values kept for string metas.
+
+    Returns
+    -------
+    dict
+        Mapping of variable name to distribution. Metas of other types
+        (href, graph, ...) and columns missing from the data are left out.
+    """
+    data = display.data
+    distns = {}
+
+    for varname, meta in display._meta_vars.items():
+        if varname not in data.columns:
+            continue
+        series = data[varname]
+        missing = int(series.isna().sum())
+        distn = {"type": meta.type, "n": len(series) - missing, "n_missing": missing}
+
+        if meta.type == "factor":
+            counts = series.value_counts(dropna=True)
+            counts.index = counts.index.map(str)
+            counts = counts.groupby(level=0).sum()
+            levels = meta.levels if meta.levels is not None else counts.index
+            distn["dist"] = {
+                level: int(counts.get(level, 0)) for level in levels
+            }
+
+        elif meta.type in ("number", "currency"):
+            values = pd.to_numeric(series, errors="coerce").to_numpy(
+                dtype=float, na_value=np.nan
+            )
+            values = values[np.isfinite(values)]
+            if len(values) == 0:
+                distn["range"] = None
+                distn["dist"] = None
             else:
-                # For file-based panels, use relative path with correct extension
-                panel_format = "png"  # Default
-                if hasattr(display, '_panel_format'):
-                    panel_format = display._panel_format
-                entry[display.panel_column] = f"{panel_id}.{panel_format}"
+                freq, breaks = np.histogram(values, bins=bins)
+                distn["range"] = [float(values.min()), float(values.max())]
+                distn["dist"] = {
+                    "breaks": breaks.tolist(),
+                    "freq": freq.tolist(),
+                }
+
+        elif meta.type in ("date", "time"):
+            dates = pd.to_datetime(series, errors="coerce").dropna()
+            distn["range"] = (
+                [_to_native(dates.min()), _to_native(dates.max())]
+                if len(dates) else None
+            )
+
+        elif meta.type == "string":
+            counts = series.value_counts(dropna=True)
+            distn["n_distinct"] = len(counts)
+            distn["dist"] = {
+                str(value): int(count)
+                for value, count in counts.head(top_values).items()
+            }
+
+        else:
+            continue
 
-        cog_data.append(entry)
+        distns[varname] = distn
 
-    return cog_data
+    return distns
 
 
-def write_metadata_json(display, output_path: Path) -> Path:
+def _to_native(value: Any) -> Any:
+    """Convert a single numpy/pandas scalar to a JSON-ready Python value."""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return value
+
+
+def _native_column(series: pd.Series) -> List[Any]:
+    """
+    Convert a column to a list of JSON-ready Python values.
+
+    Missing values become None.
+    """
+    missing = series.isna().to_numpy()
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = _datetime_strings(series)
+    elif (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        or pd.api.types.is_bool_dtype(series.dtype)
+    ):
+        # numpy's object cast yields Python int/float/bool scalars
+        values = series.to_numpy(dtype=object)
+    else:
+        values = np.empty(len(series), dtype=object)
+        values[:] = [_to_native(v) for v in series.to_numpy(dtype=object)]
+
+    if missing.any():
+        values[missing] = None
+    return values.tolist()
+
+
+def _datetime_strings(series: pd.Series) -> np.ndarray:
+    """
+    Format a datetime column as ISO 8601 strings.
+
+    Matches ``Timestamp.isoformat()``. Naive columns without sub-second
+    precision are formatted in a single numpy call.
+    """
+    if series.dt.tz is None:
+        stamps = series.to_numpy(dtype="datetime64[ns]")
+        whole_seconds = stamps.astype("datetime64[s]")
+        valid = ~np.isnat(stamps)
+        if (stamps[valid] == whole_seconds[valid]).all():
+            return np.datetime_as_string(whole_seconds, unit="s").astype(object)
+
+    values = np.empty(len(series), dtype=object)
+    values[:] = [
+        None if ts is pd.NaT else ts.isoformat()
+        for ts in series.tolist()
+    ]
+    return values
+
+
+def _factor_column(series: pd.Series, meta) -> List[Any]:
+    """
+    Convert a factor column to 1-based level indices.
+
+    The trelliscopejs viewer expects R-style 1-based factor indexing, where
+    levels[1-1] = levels[0] = first level. Numeric values are treated as
+    0-based codes, strings found in ``meta.levels`` are replaced by their
+    1-based position, and other strings are kept as-is. Missing values
+    become None.
+
+    The conversion is computed once per distinct value and broadcast back
+    to the rows through the factorized codes.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    level_codes = _level_codes(meta)
+
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    for i, value in enumerate(uniques):
+        value = _to_native(value)
+        if isinstance(value, (int, float)):
+            # Numeric categorical code (0, 1, 2...) -> 1-based
+            value = int(value) + 1
+        elif isinstance(value, str) and value in level_codes:
+            value = level_codes[value] + 1
+        # Other values (e.g. strings not in levels) are kept as-is
+        mapped[i] = value
+    # Code -1 (missing) indexes the trailing None slot
+    mapped[-1] = None
+
+    return mapped[codes].tolist()
+
+
+def _level_codes(meta) -> Dict[str, int]:
+    """Level to 0-based code lookup for a factor meta variable."""
+    if hasattr(meta, 'level_codes'):
+        return meta.level_codes
+    return level_code_map(getattr(meta, 'levels', None))
+
+
+def _panel_refs(display, panel_keys: List[str], prefix: str) -> List[str]:
+    """
+    Build panel references for each panel key.
+
+    REST panels point at the endpoint path; file-based panels use
+    ``{prefix}{id}.{format}``.
+    """
+    from trelliscope.panel_interface import RESTPanelInterface
+
+    if isinstance(display.panel_interface, RESTPanelInterface):
+        # For REST panels, panel value is the endpoint path
+        return [f"/panels/{key}" for key in panel_keys]
+
+    panel_format = getattr(display, '_panel_format', None) or "png"
+    return [f"{prefix}{key}.{panel_format}" for key in panel_keys]
+
+
+def _iter_cog_chunks(
+    display,
+    cog_columns: Optional[Dict[str, List[Any]]],
+    panel_prefix: str,
+    chunk_size: int = METADATA_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Assemble cogData row objects, a chunk at a time.
+
+    Without prebuilt columns, each chunk of rows is converted on its own,
+    so only one chunk of cogData exists as Python objects at any time.
+
+    Parameters
+    ----------
+    display : Display
+        Display object with data.
+    cog_columns : dict or None
+        Columns from ``build_cog_columns`` covering every row. If None,
+        each chunk is converted with ``build_cog_columns(display, rows)``.
+    panel_prefix : str
+        Prefix for file-based panel references ("" or "panels/").
+    chunk_size : int, default=10000
+        Number of rows per chunk.
+
+    Yields
+    ------
+    list of dict
+        cogData entries for consecutive rows.
+    """
+    with_panels = display.panel_column is not None
+
+    for start in range(0, len(display.data), chunk_size):
+        stop = start + chunk_size
+        if cog_columns is None:
+            columns = build_cog_columns(display, slice(start, stop))
+        else:
+            columns = {
+                name: column[start:stop] for name, column in cog_columns.items()
+            }
+        keys = list(columns)
+        values = list(columns.values())
+        if with_panels:
+            keys.append(display.panel_column)
+            values.append(
+                _panel_refs(display, columns["panelKey"], panel_prefix)
+            )
+        yield [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def _cog_records(
+    display,
+    cog_columns: Optional[Dict[str, List[Any]]],
+    panel_prefix: str,
+) -> List[Dict[str, Any]]:
+    """
+    Assemble all cogData row objects from prebuilt columns.
+
+    Parameters
+    ----------
+    display : Display
+        Display object with data.
+    cog_columns : dict or None
+        Columns from ``build_cog_columns``; built if None.
+    panel_prefix : str
+        Prefix for file-based panel references ("" or "panels/").
+
+    Returns
+    -------
+    list of dict
+        One cogData entry per row.
+    """
+    records = []
+    for chunk in _iter_cog_chunks(display, cog_columns, panel_prefix):
+        records.extend(chunk)
+    return records
+
+
+def _write_json_array(
+    f: TextIO,
+    chunks: Iterable[List[Dict[str, Any]]],
+    indent: Optional[int] = None,
+) -> None:
+    """
+    Stream a JSON array of objects to an open file, one chunk at a time.
+
+    Output is identical to ``json.dump(records, f, indent=indent,
+    ensure_ascii=False)`` (with compact separators when ``indent`` is None),
+    but only one chunk of records is held as text at any time.
+
+    Parameters
+    ----------
+    f : file object
+        Text file open for writing.
+    chunks : iterable of list of dict
+        Records to write, in chunks.
+    indent : int, optional
+        Indentation level. None writes compact JSON.
+    """
+    if indent is None:
+        encode = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":")
+        ).encode
+        open_, sep, close = "[", ",", "]"
+    else:
+        pad = " " * indent
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+
+        def encode(record):
+            return pad + encoder.encode(record).replace("\n", "\n" + pad)
+
+        open_, sep, close = "[\n", ",\n", "\n]"
+
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        f.write(open_ if first else sep)
+        f.write(sep.join(encode(record) for record in chunk))
+        first = False
+    f.write("[]" if first else close)
+
+
+def _serialize_cog_data(
+    display,
+    cog_columns: Optional[Dict[str, List[Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate cogData array from Display's DataFrame.
+
+    Converts DataFrame rows to cogData objects with panel references.
+    For file-based panels, uses panel file names like "0.png".
+
+    Parameters
+    ----------
+    display : Display
+        Display object with data.
+    cog_columns : dict, optional
+        Prebuilt columns from ``build_cog_columns``.
+
+    Returns
+    -------
+    list of dict
+        cogData array with panel references and metadata.
+    """
+    return _cog_records(display, cog_columns, panel_prefix="")
+
+
+def write_metadata_json(
+    display,
+    output_path: Path,
+    cog_columns: Optional[Dict[str, List[Any]]] = None,
+    indent: Optional[int] = None,
+    chunk_size: int = METADATA_CHUNK_SIZE,
+    compress: bool = False,
+) -> Path:
     """
     Write metaData.json file with cogData array.
 
     This file contains the same cogData as embedded in displayInfo.json,
     but with relative panel paths like "panels/0.png".
 
+    Records are converted and streamed to the file in chunks. Without
+    ``cog_columns``, peak memory is roughly one chunk of cogData (Python
+    objects and JSON text) rather than the whole array; prebuilt columns
+    already hold every row.
+
     Parameters
     ----------
     display : Display
         Display object to serialize.
     output_path : Path
         Output directory path. File will be written to output_path/metaData.json.
+    cog_columns : dict, optional
+        Prebuilt columns from ``build_cog_columns``. If omitted, rows are
+        converted a chunk at a time.
+    indent : int, optional
+        JSON indentation level. None (default) writes compact JSON.
+    chunk_size : int, default=10000
+        Number of records serialized per write.
+    compress : bool, default=False
+        If True, gzip the output and write metaData.json.gz instead.
 
     Returns
     -------
     Path
-        Path to written metaData.json file.
+        Path to written metaData.json (or metaData.json.gz) file.
 
     Raises
     ------
     OSError
         If file cannot be written.
     """
-    from trelliscope.panel_interface import RESTPanelInterface
-
-    # Build metadata array with relative panel paths
-    metadata = []
-
-    for idx, row in display.data.iterrows():
-        entry = {}
-
-        # Add all meta variable values
-        for varname in display._meta_vars.keys():
-            if varname in row:
-                value = row[varname]
-                # Convert numpy/pandas types to Python native types
-                if hasattr(value, 'item'):
-                    value = value.item()
-                # Convert pd.Timestamp to ISO format string
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-
-                # CRITICAL: Convert factor indices from 0-based to 1-based (R-style)
-                meta = display._meta_vars.get(varname)
-                if meta and meta.type == "factor":
-                    if isinstance(value, (int, float)) and not (isinstance(value, float) and value != value):
-                        value = int(value) + 1
-                    elif isinstance(value, str) and hasattr(meta, 'levels') and meta.levels:
-                        try:
-                            idx_temp = meta.levels.index(value)
-                            value = idx_temp + 1
-                        except (ValueError, AttributeError):
-                            pass
-
-                entry[varname] = value
-
-        # Add panelKey
-        panel_id = str(idx)
-        entry["panelKey"] = panel_id
-
-        # Add panel reference with RELATIVE path for file-based panels
-        if display.panel_column is not None:
-            if isinstance(display.panel_interface, RESTPanelInterface):
-                entry[display.panel_column] = f"/panels/{panel_id}"
-            else:
-                # Use correct extension for file-based panels
-                panel_format = "png"  # Default
-                if hasattr(display, '_panel_format'):
-                    panel_format = display._panel_format
-                # CRITICAL: Use "panels/{id}.{format}" format for viewer to find files
-                entry[display.panel_column] = f"panels/{panel_id}.{panel_format}"
-
-        metadata.append(entry)
+    # CRITICAL: Use "panels/{id}.{format}" format for viewer to find files
+    chunks = _iter_cog_chunks(display, cog_columns, "panels/", chunk_size)
 
     # Write JSON file
-    json_path = output_path / "metaData.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    if compress:
+        json_path = output_path / "metaData.json.gz"
+        opener = gzip.open
+    else:
+        json_path = output_path / "metaData.json"
+        opener = open
+    with opener(json_path, "wt", encoding="utf-8") as f:
+        _write_json_array(f, chunks, indent=indent)
 
     return json_path
 
 
-def write_metadata_js(display, output_path: Path) -> Path:
+def write_metadata_js(
+    display,
+    output_path: Path,
+    cog_columns: Optional[Dict[str, List[Any]]] = None,
+    indent: Optional[int] = None,
+    chunk_size: int = METADATA_CHUNK_SIZE,
+    compress: bool = False,
+) -> Path:
     """
     Write metaData.js file with window.metaData wrapper.
 
@@ -393,89 +738,61 @@ def write_metadata_js(display, output_path: Path) -> Path:
     is embedded in displayInfo.json. It must contain:
     window.metaData = [...];
 
+    The array is streamed to the file in chunks, like ``write_metadata_json``.
+
     Parameters
     ----------
     display : Display
         Display object to serialize.
     output_path : Path
         Output directory path. File will be written to output_path/metaData.js.
+    cog_columns : dict, optional
+        Prebuilt columns from ``build_cog_columns``. If omitted, rows are
+        converted a chunk at a time.
+    indent : int, optional
+        JSON indentation level. None (default) writes compact JSON.
+    chunk_size : int, default=10000
+        Number of records serialized per write.
+    compress : bool, default=False
+        If True, gzip the output and write metaData.js.gz instead.
+        ``DisplayServer`` serves it as metaData.js with gzip encoding.
 
     Returns
     -------
     Path
-        Path to written metaData.js file.
+        Path to written metaData.js (or metaData.js.gz) file.
 
     Raises
     ------
     OSError
         If file cannot be written.
     """
-    from trelliscope.panel_interface import RESTPanelInterface
-
-    # Build metadata array (same as metaData.json)
-    metadata = []
-
-    for idx, row in display.data.iterrows():
-        entry = {}
-
-        # Add all meta variable values
-        for varname in display._meta_vars.keys():
-            if varname in row:
-                value = row[varname]
-                # Convert numpy/pandas types to Python native types
-                if hasattr(value, 'item'):
-                    value = value.item()
-                # Convert pd.Timestamp to ISO format string
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-
-                # CRITICAL: Convert factor indices from 0-based to 1-based (R-style)
-                meta = display._meta_vars.get(varname)
-                if meta and meta.type == "factor":
-                    if isinstance(value, (int, float)) and not (isinstance(value, float) and value != value):
-                        value = int(value) + 1
-                    elif isinstance(value, str) and hasattr(meta, 'levels') and meta.levels:
-                        try:
-                            idx_temp = meta.levels.index(value)
-                            value = idx_temp + 1
-                        except (ValueError, AttributeError):
-                            pass
-
-                entry[varname] = value
-
-        # Add panelKey
-        panel_id = str(idx)
-        entry["panelKey"] = panel_id
-
-        # Add panel reference
-        if display.panel_column is not None:
-            if isinstance(display.panel_interface, RESTPanelInterface):
-                entry[display.panel_column] = f"/panels/{panel_id}"
-            else:
-                # Use correct extension for file-based panels
-                panel_format = "png"  # Default
-                if hasattr(display, '_panel_format'):
-                    panel_format = display._panel_format
-                # CRITICAL: Use "panels/{id}.{format}" format
-                entry[display.panel_column] = f"panels/{panel_id}.{panel_format}"
-
-        metadata.append(entry)
-
-    # Convert to JSON string
-    json_str = json.dumps(metadata, indent=2, ensure_ascii=False)
-
-    # Wrap in window.metaData assignment
-    js_content = f"window.metaData = {json_str};\n"
-
-    # Write JavaScript file
-    js_path = output_path / "metaData.js"
-    with open(js_path, "w", encoding="utf-8") as f:
-        f.write(js_content)
+    # Same records as metaData.json
+    chunks = _iter_cog_chunks(display, cog_columns, "panels/", chunk_size)
+
+    # Write JavaScript file: window.metaData = [...];
+    if compress:
+        js_path = output_path / "metaData.js.gz"
+        opener = gzip.open
+    else:
+        js_path = output_path / "metaData.js"
+        opener = open
+    with opener(js_path, "wt", encoding="utf-8") as f:
+        f.write("window.metaData = ")
+        _write_json_array(f, chunks, indent=indent)
+        f.write(";\n")
 
     return js_path
 
 
-def write_display_info(display, output_path: Path) -> Path:
+def write_display_info(
+    display,
+    output_path: Path,
+    cog_columns: Optional[Dict[str, List[Any]]] = None,
+    embed_cog_data: bool = True,
+    cog_data_file: str = "metaData.json",
+    cog_distns: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Path:
     """
     Write displayInfo.json file for Display.
 
@@ -485,6 +802,14 @@ def write_display_info(display, output_path: Path) -> Path:
         Display object to serialize.
     output_path : Path
         Output directory path. File will be written to output_path/displayInfo.json.
+    cog_columns : dict, optional
+        Prebuilt columns from ``build_cog_columns``.
+    embed_cog_data : bool, default=True
+        If False, reference ``cog_data_file`` instead of embedding cogData.
+    cog_data_file : str, default="metaData.json"
+        Name of the external cogData file when not embedding.
+    cog_distns : dict, optional
+        Prebuilt distributions from ``build_cog_distns``.
 
     Returns
     -------
@@ -513,7 +838,13 @@ def write_display_info(display, output_path: Path) -> Path:
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Serialize display info
-    info = serialize_display_info(display)
+    info = serialize_display_info(
+        display,
+        cog_columns,
+        embed_cog_data=embed_cog_data,
+        cog_data_file=cog_data_file,
+        cog_distns=cog_distns,
+    )
 
     # Write JSON file
     json_path = output_path / "displayInfo.json"
@@ -8,12 +8,45 @@ from pathlib import Path
 from typing import Optional
 
 
+class _DisplayRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that also serves gzipped files transparently.
+
+    A request for ``metaData.js`` that only exists as ``metaData.js.gz``
+    is answered with the compressed file and ``Content-Encoding: gzip``,
+    so the browser sees the uncompressed script.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        gz_path = path + ".gz"
+        if os.path.exists(path) or not os.path.isfile(gz_path):
+            return super().send_head()
+
+        try:
+            f = open(gz_path, "rb")
+        except OSError:
+            return super().send_head()
+        try:
+            fs = os.fstat(f.fileno())
+            self.send_response(200)
+            self.send_header("Content-type", self.guess_type(path))
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(fs.st_size))
+            self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+
 class DisplayServer:
     """Simple HTTP server for viewing displays locally.
 
     This server allows you to view trelliscope displays in a web browser
     during development. It serves static files from the display directory
-    using Python's built-in HTTP server.
+    using Python's built-in HTTP server. Files written gzipped (such as
+    metaData.js.gz) are also served under their uncompressed name.
 
     Parameters
     ----------
@@ -101,8 +134,8 @@ class DisplayServer:
 
         os.chdir(self.display_dir.parent)
 
-        # Create server with simple file handler
-        handler = http.server.SimpleHTTPRequestHandler
+        # Create server with static file handler (gzip-aware)
+        handler = _DisplayRequestHandler
 
         try:
             self.httpd = socketserver.TCPServer(("localhost", self.port), handler)